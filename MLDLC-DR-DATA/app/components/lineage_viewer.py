@@ -1,24 +1,43 @@
 """Lineage viewer component for Streamlit dashboard."""
-import streamlit as st
-import json
+import os
+import sys
 from pathlib import Path
 
-LINEAGE_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "lineage"
+import streamlit as st
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from mldlc_server.lineage_graph import LineageGraph
+from mldlc_server.lineage_store import LineageStore
+
+LINEAGE_DB = Path(os.getenv("MLDLC_LINEAGE_DB", str(BASE_DIR / "data" / "lineage.db")))
 
 
-def render_lineage(entity_id: str | None = None) -> None:
-    """Render lineage view."""
-    if not LINEAGE_PATH.exists():
+@st.cache_resource
+def _lineage_graph(db_path: str) -> LineageGraph:
+    """One graph per database for the app's lifetime; it catches up with new records on each query."""
+    return LineageGraph(LineageStore(db_path))
+
+
+def render_lineage(entity_id: str | None = None, depth: int = 5) -> None:
+    """Render lineage view (recent records, or upstream/downstream of entity_id)."""
+    if not LINEAGE_DB.exists():
         st.info("No lineage records yet")
         return
-    records = list(LINEAGE_PATH.glob("*.json"))
-    if not records:
-        st.info("No lineage records yet")
+    graph = _lineage_graph(str(LINEAGE_DB))
+    if not entity_id:
+        records = graph.store.recent(limit=20)
+        if not records:
+            st.info("No lineage records yet")
+            return
+        for rec in records:
+            st.json(rec)
         return
-    for f in records[:20]:
-        try:
-            with open(f, encoding="utf-8") as fp:
-                rec = json.load(fp)
-            if entity_id and entity_id not in str(rec):
-                continue
+    lineage = graph.lineage(entity_id, "both", depth)
+    for side in ("upstream", "downstream"):
+        st.subheader(f"{side.title()} ({len(lineage[side])})")
+        if not lineage[side]:
+            st.caption(f"No {side} lineage for {entity_id}")
+        for rec in lineage[side]:
             st.json(rec)
@@ -0,0 +1,302 @@
+"""
+Incremental offset index over the MLDLC audit log (data/audit/audit.jsonl).
+
+A SQLite sidecar (audit.index.db next to the log) maps each line's byte
+offset to its event_type, day bucket, timestamp, risk_level and the entity
+IDs found in event_data. update() only reads bytes appended since the last
+call; queries select offsets from the index and seek straight to the
+matching lines, so a filtered query never scans the whole log.
+
+Query from the command line (streams JSONL to stdout):
+  python -m mldlc_server.audit_index query --event-type risk_assessed --risk-level RED \\
+      --since 2024-09-01 --until 2024-09-30
+  python -m mldlc_server.audit_index rebuild
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Iterator
+
+AUDIT_FILE = "audit.jsonl"
+INDEX_FILE = "audit.index.db"
+
+MAX_PAGE = 1000
+_BATCH_LINES = 5000
+
+# event_data keys whose values are indexed as entity IDs (plus any *_id key)
+ENTITY_KEYS = ("entity_id", "destination_entity", "source_entities", "artifact_type")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS entries (
+    offset INTEGER PRIMARY KEY,
+    length INTEGER NOT NULL,
+    event_type TEXT,
+    day TEXT,
+    ts TEXT,
+    risk_level TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_entries_type_day ON entries(event_type, day);
+CREATE INDEX IF NOT EXISTS idx_entries_day ON entries(day);
+CREATE INDEX IF NOT EXISTS idx_entries_risk ON entries(risk_level, day);
+CREATE TABLE IF NOT EXISTS entities (
+    entity TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    PRIMARY KEY (entity, offset)
+) WITHOUT ROWID;
+"""
+
+
+def _entity_ids(event_data: Any) -> set[str]:
+    ids: set[str] = set()
+    if not isinstance(event_data, dict):
+        return ids
+    for key, value in event_data.items():
+        if key in ENTITY_KEYS or key.endswith("_id"):
+            values = value if isinstance(value, list) else [value]
+            ids.update(str(v) for v in values if isinstance(v, (str, int)) and v != "")
+    return ids
+
+
+def _risk_level(event_data: Any) -> str | None:
+    if not isinstance(event_data, dict):
+        return None
+    level = event_data.get("risk_level")
+    if level is None and isinstance(event_data.get("assessment"), dict):
+        level = event_data["assessment"].get("risk_level")
+    return str(level) if level is not None else None
+
+
+class AuditIndex:
+    """Byte-offset index for one audit.jsonl file."""
+
+    def __init__(self, audit_path: str | Path, index_path: str | Path | None = None) -> None:
+        self.audit_path = Path(audit_path)
+        self.index_path = Path(index_path) if index_path else self.audit_path.with_name(INDEX_FILE)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.index_path), timeout=10)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @staticmethod
+    def _meta(conn: sqlite3.Connection, key: str, default: str = "") -> str:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def _file_id(self) -> str:
+        """Identity of the log file, so a rotated/replaced log triggers a rebuild."""
+        st = os.stat(self.audit_path)
+        with open(self.audit_path, "rb") as f:
+            head = f.readline()
+        return f"{st.st_ino}:{hashlib.sha256(head).hexdigest()[:16]}"
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+    def update(self) -> int:
+        """Index lines appended since the last update; returns how many were added."""
+        if not self.audit_path.exists():
+            return 0
+        size = self.audit_path.stat().st_size
+        with closing(self._connect()) as conn, conn:
+            indexed = int(self._meta(conn, "indexed_bytes", "0"))
+            file_id = self._file_id()
+            if size < indexed or self._meta(conn, "file_id") not in ("", file_id):
+                conn.execute("DELETE FROM entries")
+                conn.execute("DELETE FROM entities")
+                indexed = 0
+            if size == indexed:
+                conn.execute("INSERT OR REPLACE INTO meta VALUES ('file_id', ?)", (file_id,))
+                return 0
+            added = 0
+            entries: list[tuple] = []
+            entities: list[tuple[str, int]] = []
+            offset = indexed
+            with open(self.audit_path, "rb") as f:
+                f.seek(indexed)
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break  # partial line still being written
+                    line_offset, offset = offset, offset + len(raw)
+                    try:
+                        event = json.loads(raw)
+                    except json.JSONDecodeError:
+                        continue
+                    ts = str(event.get("timestamp", ""))
+                    data = event.get("event_data")
+                    entries.append((line_offset, len(raw), event.get("event_type"), ts[:10], ts, _risk_level(data)))
+                    entities.extend((eid, line_offset) for eid in _entity_ids(data))
+                    added += 1
+                    if len(entries) >= _BATCH_LINES:
+                        self._flush(conn, entries, entities)
+            self._flush(conn, entries, entities)
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('indexed_bytes', ?)", (str(offset),))
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('file_id', ?)", (file_id,))
+        return added
+
+    @staticmethod
+    def _flush(conn: sqlite3.Connection, entries: list[tuple], entities: list[tuple[str, int]]) -> None:
+        conn.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)", entries)
+        conn.executemany("INSERT OR IGNORE INTO entities VALUES (?, ?)", entities)
+        entries.clear()
+        entities.clear()
+
+    def rebuild(self) -> int:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM entries")
+            conn.execute("DELETE FROM entities")
+            conn.execute("DELETE FROM meta")
+        return self.update()
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _where(
+        event_type: str | None,
+        since: str | None,
+        until: str | None,
+        entity_id: str | None,
+        risk_level: str | None,
+        cursor: int | None,
+    ) -> tuple[str, list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if event_type:
+            clauses.append("e.event_type = ?")
+            params.append(event_type)
+        if risk_level:
+            clauses.append("e.risk_level = ?")
+            params.append(risk_level)
+        if since:
+            clauses.append("e.day >= ? AND e.ts >= ?")
+            params += [since[:10], since]
+        if until:
+            # A bare date includes that whole day
+            clauses.append("e.day <= ? AND e.ts <= ?")
+            params += [until[:10], until if len(until) > 10 else until + "\uffff"]
+        if entity_id:
+            clauses.append("e.offset IN (SELECT offset FROM entities WHERE entity = ?)")
+            params.append(entity_id)
+        if cursor is not None:
+            clauses.append("e.offset > ?")
+            params.append(cursor)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def _read(self, rows: list[tuple[int, int]]) -> list[dict[str, Any]]:
+        events = []
+        with open(self.audit_path, "rb") as f:
+            for offset, length in rows:
+                f.seek(offset)
+                try:
+                    events.append(json.loads(f.read(length)))
+                except json.JSONDecodeError:
+                    continue
+        return events
+
+    def query(
+        self,
+        event_type: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        entity_id: str | None = None,
+        risk_level: str | None = None,
+        limit: int = 100,
+        cursor: int | None = None,
+        refresh: bool = True,
+    ) -> dict[str, Any]:
+        """
+        One page of matching events in log order. Pass the returned
+        next_cursor back as cursor for the next page (None = no more).
+        """
+        if refresh:
+            self.update()
+        limit = max(1, min(int(limit), MAX_PAGE))
+        where, params = self._where(event_type, since, until, entity_id, risk_level, cursor)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT e.offset, e.length FROM entries e{where} ORDER BY e.offset LIMIT ?",
+                params + [limit + 1],
+            ).fetchall()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return {
+            "events": self._read(rows) if rows else [],
+            "count": len(rows),
+            "next_cursor": rows[-1][0] if has_more else None,
+        }
+
+    def count(self, **filters: Any) -> int:
+        """Number of matching events (same filters as query, without paging)."""
+        where, params = self._where(
+            filters.get("event_type"), filters.get("since"), filters.get("until"),
+            filters.get("entity_id"), filters.get("risk_level"), None,
+        )
+        with closing(self._connect()) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM entries e{where}", params).fetchone()[0]
+
+    def iter_events(self, page_size: int = MAX_PAGE, **filters: Any) -> Iterator[dict[str, Any]]:
+        """Stream every matching event, one page at a time."""
+        self.update()
+        cursor = None
+        while True:
+            page = self.query(limit=page_size, cursor=cursor, refresh=False, **filters)
+            yield from page["events"]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return
+
+
+def main(argv: list[str] | None = None) -> int:
+    default_dir = Path(os.getenv("MLDLC_AUDIT_PATH", str(Path(__file__).resolve().parent.parent / "data" / "audit")))
+    parser = argparse.ArgumentParser(description="Query the MLDLC audit log via its offset index")
+    parser.add_argument("--audit-file", type=Path, default=default_dir / AUDIT_FILE)
+    sub = parser.add_subparsers(dest="command", required=True)
+    q = sub.add_parser("query", help="Stream matching events as JSONL")
+    q.add_argument("--event-type")
+    q.add_argument("--since", help="ISO date or timestamp (inclusive)")
+    q.add_argument("--until", help="ISO date (whole day) or timestamp (inclusive)")
+    q.add_argument("--entity-id")
+    q.add_argument("--risk-level", choices=["RED", "YELLOW", "GREEN"])
+    q.add_argument("--count", action="store_true", help="Print only the number of matches")
+    sub.add_parser("rebuild", help="Drop and rebuild the index")
+    args = parser.parse_args(argv)
+
+    if not args.audit_file.exists():
+        sys.stderr.write(f"No audit log at {args.audit_file}\n")
+        return 1
+    index = AuditIndex(args.audit_file)
+    if args.command == "rebuild":
+        print(f"Indexed {index.rebuild()} event(s)")
+        return 0
+    filters = {
+        "event_type": args.event_type,
+        "since": args.since,
+        "until": args.until,
+        "entity_id": args.entity_id,
+        "risk_level": args.risk_level,
+    }
+    if args.count:
+        index.update()
+        print(index.count(**filters))
+        return 0
+    out = sys.stdout
+    for event in index.iter_events(**filters):
+        out.write(json.dumps(event) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+In-memory lineage graph over LineageStore for multi-hop queries.
+
+The graph holds only adjacency (entity -> [(neighbor, lineage_id)]) and an
+entity kind (dataset / model). It is loaded once and then updated
+incrementally from LineageStore.records_since(), so each query costs a
+single MAX(rowid) check. Closures are memoized per graph version: repeated
+upstream/downstream/impact queries on an unchanged store return from memory.
+
+This is the only lineage traversal: the MCP server's get_lineage and the
+Streamlit lineage viewer both read records through lineage().
+"""
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict, defaultdict, deque
+from pathlib import Path
+from typing import Any
+
+from mldlc_server.lineage_store import LineageStore
+
+MEMO_SIZE = 1024
+DIRECTIONS = ("upstream", "downstream", "both")
+
+# Entities named like models, or produced by a training-type transformation
+_MODEL_NAME = re.compile(r"(^|[/:_.\-])models?([/:_.\-]|$)|\.(pkl|joblib|onnx|pt|pth|h5|keras)$", re.I)
+_MODEL_TRANSFORMS = re.compile(r"train|fit|tun(e|ing)|retrain", re.I)
+
+
+def entity_kind(entity: str, transformation: str | None = None) -> str:
+    """Classify an entity as "model" or "dataset" from its name or producing transformation."""
+    if _MODEL_NAME.search(entity) or (transformation and _MODEL_TRANSFORMS.search(transformation)):
+        return "model"
+    return "dataset"
+
+
+class LineageGraph:
+    """Adjacency index over one LineageStore with per-version memoized closures."""
+
+    def __init__(self, store: LineageStore) -> None:
+        self.store = store
+        self.version = 0
+        self._children: dict[str, list[tuple[str, str]]] = defaultdict(list)
+        self._parents: dict[str, list[tuple[str, str]]] = defaultdict(list)
+        self._kinds: dict[str, str] = {}
+        self._memo: OrderedDict[tuple, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def refresh(self) -> int:
+        """Apply records added since the last refresh; returns the graph version."""
+        if self.store.version() == self.version:
+            return self.version
+        with self._lock:
+            changed = False
+            for rowid, rec in self.store.records_since(self.version):
+                lid = rec["lineage_id"]
+                dest = rec.get("destination_entity", "")
+                for src in rec.get("source_entities", []):
+                    self._children[src].append((dest, lid))
+                    self._parents[dest].append((src, lid))
+                    self._kinds.setdefault(src, entity_kind(src))
+                if entity_kind(dest, rec.get("transformation")) == "model":
+                    self._kinds[dest] = "model"
+                else:
+                    self._kinds.setdefault(dest, "dataset")
+                self.version = rowid
+                changed = True
+            if changed:
+                self._memo.clear()
+        return self.version
+
+    def kind(self, entity: str) -> str:
+        return self._kinds.get(entity) or entity_kind(entity)
+
+    def closure(self, entity_id: str, direction: str, depth: int | None = None) -> dict[str, Any]:
+        """
+        BFS closure from entity_id ("upstream" or "downstream"), up to depth hops
+        (None = unbounded). Returns reached entities with hop distance and the
+        shortest path from entity_id, plus the lineage_ids traversed per hop.
+        """
+        if direction not in ("upstream", "downstream"):
+            raise ValueError(f"direction must be 'upstream' or 'downstream', got {direction!r}")
+        self.refresh()
+        key = (entity_id, direction, depth)
+        with self._lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                return self._memo[key]
+            result = self._bfs(entity_id, direction, depth)
+            self._memo[key] = result
+            if len(self._memo) > MEMO_SIZE:
+                self._memo.popitem(last=False)
+        return result
+
+    def _bfs(self, entity_id: str, direction: str, depth: int | None) -> dict[str, Any]:
+        adjacency = self._children if direction == "downstream" else self._parents
+        prev: dict[str, str | None] = {entity_id: None}
+        dist = {entity_id: 0}
+        record_hops: dict[str, int] = {}
+        queue = deque([entity_id])
+        while queue:
+            node = queue.popleft()
+            hop = dist[node] + 1
+            if depth is not None and hop > depth:
+                continue
+            for neighbor, lid in adjacency.get(node, ()):
+                record_hops.setdefault(lid, hop)
+                if neighbor not in dist:
+                    dist[neighbor] = hop
+                    prev[neighbor] = node
+                    queue.append(neighbor)
+
+        entities = []
+        for node, d in dist.items():
+            if node == entity_id:
+                continue
+            path = [node]
+            while prev[path[-1]] is not None:
+                path.append(prev[path[-1]])
+            path.reverse()
+            entities.append({"entity": node, "kind": self.kind(node), "distance": d, "path": path})
+        entities.sort(key=lambda e: (e["distance"], e["entity"]))
+        return {
+            "entities": entities,
+            "record_hops": record_hops,
+            "max_distance": max(dist.values()),
+        }
+
+    def lineage(
+        self, entity_id: str, direction: str = "both", depth: int | None = 5
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        {"upstream": [...], "downstream": [...]}: the records traversed within
+        depth hops, limited to the requested direction(s). Each record carries
+        a "hop" field (1 = direct), ordered by hop then timestamp.
+        """
+        if direction not in DIRECTIONS:
+            raise ValueError(f"direction must be one of {DIRECTIONS}, got {direction!r}")
+        out: dict[str, list[dict[str, Any]]] = {"upstream": [], "downstream": []}
+        for side in ("upstream", "downstream"):
+            if direction not in (side, "both"):
+                continue
+            hops = self.closure(entity_id, side, depth)["record_hops"]
+            out[side] = sorted(
+                ({**rec, "hop": hops[lid]} for lid, rec in self.store.get_many(list(hops)).items()),
+                key=lambda r: (r["hop"], r.get("timestamp") or ""),
+            )
+        return out
+
+    def impact(self, entity_id: str, depth: int | None = None) -> dict[str, Any]:
+        """Every downstream dataset and model affected by a change to entity_id."""
+        down = self.closure(entity_id, "downstream", depth)
+        datasets = [e for e in down["entities"] if e["kind"] == "dataset"]
+        models = [e for e in down["entities"] if e["kind"] == "model"]
+        return {
+            "entity_id": entity_id,
+            "affected_count": len(down["entities"]),
+            "datasets": datasets,
+            "models": models,
+            "max_distance": down["max_distance"],
+            "graph_version": self.version,
+        }
+
+
+_graphs: dict[Path, LineageGraph] = {}
+
+
+def graph_for(store: LineageStore) -> LineageGraph:
+    """Shared LineageGraph per store database path."""
+    graph = _graphs.get(store.db_path)
+    if graph is None or graph.store is not store:
+        graph = _graphs[store.db_path] = LineageGraph(store)
+    return graph
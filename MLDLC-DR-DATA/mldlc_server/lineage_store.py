@@ -0,0 +1,191 @@
+"""
+Indexed lineage store for the MLDLC MCP server.
+SQLite-backed (stdlib only) replacement for one-JSON-file-per-record storage.
+
+Tables:
+  records(lineage_id, destination_entity, timestamp, record)  - indexed on destination
+  edges(source_entity, lineage_id)                             - indexed on source
+
+Multi-hop traversal is done in memory by lineage_graph.LineageGraph, which
+follows the store through records_since() and fetches records with get_many().
+
+Migrate existing per-file records:
+  python -m mldlc_server.lineage_store migrate [--lineage-dir data/lineage] [--db data/lineage.db]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Iterable
+
+# Stay well under SQLite's host-parameter limit for IN (...) queries
+_IN_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    lineage_id TEXT PRIMARY KEY,
+    destination_entity TEXT NOT NULL,
+    timestamp TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_records_destination ON records(destination_entity);
+CREATE TABLE IF NOT EXISTS edges (
+    source_entity TEXT NOT NULL,
+    lineage_id TEXT NOT NULL,
+    PRIMARY KEY (source_entity, lineage_id)
+);
+CREATE INDEX IF NOT EXISTS idx_edges_lineage ON edges(lineage_id);
+"""
+
+def _chunks(items: list[str], size: int = _IN_CHUNK) -> Iterable[list[str]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class LineageStore:
+    """Lineage records with source->destination and destination->source indexes."""
+
+    def __init__(self, db_path: str | Path) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=10)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, record: dict[str, Any]) -> bool:
+        cur = conn.execute(
+            "INSERT OR IGNORE INTO records (lineage_id, destination_entity, timestamp, record) VALUES (?, ?, ?, ?)",
+            (
+                record["lineage_id"],
+                record.get("destination_entity", ""),
+                record.get("timestamp"),
+                json.dumps(record),
+            ),
+        )
+        if cur.rowcount == 0:
+            return False
+        conn.executemany(
+            "INSERT OR IGNORE INTO edges (source_entity, lineage_id) VALUES (?, ?)",
+            [(src, record["lineage_id"]) for src in record.get("source_entities", [])],
+        )
+        return True
+
+    def add(self, record: dict[str, Any]) -> None:
+        """Store one lineage record (ignored if its lineage_id already exists)."""
+        with closing(self._connect()) as conn, conn:
+            self._insert(conn, record)
+
+    def add_many(self, records: Iterable[dict[str, Any]]) -> int:
+        """Store records in one transaction; returns how many were new."""
+        added = 0
+        with closing(self._connect()) as conn, conn:
+            for record in records:
+                if self._insert(conn, record):
+                    added += 1
+        return added
+
+    def import_directory(self, lineage_dir: str | Path) -> tuple[int, int]:
+        """
+        Import legacy data/lineage/*.json records. Idempotent.
+        Returns (imported, skipped) where skipped covers duplicates and unreadable files.
+        """
+        records: list[dict[str, Any]] = []
+        unreadable = 0
+        for f in sorted(Path(lineage_dir).glob("*.json")):
+            try:
+                with open(f, encoding="utf-8") as fp:
+                    rec = json.load(fp)
+            except (json.JSONDecodeError, OSError):
+                unreadable += 1
+                continue
+            if not isinstance(rec, dict) or "destination_entity" not in rec:
+                unreadable += 1
+                continue
+            rec.setdefault("lineage_id", f.stem)
+            records.append(rec)
+        imported = self.add_many(records)
+        return imported, unreadable + len(records) - imported
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def count(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def version(self) -> int:
+        """Monotonic store version (records are append-only, so the max rowid)."""
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM records").fetchone()[0]
+
+    def records_since(self, version: int) -> Iterable[tuple[int, dict[str, Any]]]:
+        """(rowid, record) for records added after `version`, oldest first."""
+        with closing(self._connect()) as conn:
+            cur = conn.execute("SELECT rowid, record FROM records WHERE rowid > ? ORDER BY rowid", (version,))
+            for rowid, raw in cur:
+                yield rowid, json.loads(raw)
+
+    def get_many(self, lineage_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Records by lineage_id for the ids that exist."""
+        out: dict[str, dict[str, Any]] = {}
+        with closing(self._connect()) as conn:
+            for chunk in _chunks(lineage_ids):
+                marks = ",".join("?" * len(chunk))
+                for lid, raw in conn.execute(
+                    f"SELECT lineage_id, record FROM records WHERE lineage_id IN ({marks})", chunk
+                ):
+                    out[lid] = json.loads(raw)
+        return out
+
+    def get(self, lineage_id: str) -> dict[str, Any] | None:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT record FROM records WHERE lineage_id = ?", (lineage_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def recent(self, limit: int = 20, entity_id: str | None = None) -> list[dict[str, Any]]:
+        """Newest records first, optionally only those touching entity_id."""
+        with closing(self._connect()) as conn:
+            if entity_id:
+                rows = conn.execute(
+                    "SELECT record FROM records WHERE destination_entity = ? OR lineage_id IN "
+                    "(SELECT lineage_id FROM edges WHERE source_entity = ?) ORDER BY timestamp DESC LIMIT ?",
+                    (entity_id, entity_id, limit),
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT record FROM records ORDER BY timestamp DESC LIMIT ?", (limit,)
+                ).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+
+def main(argv: list[str] | None = None) -> int:
+    base_dir = Path(__file__).resolve().parent.parent
+    parser = argparse.ArgumentParser(description="MLDLC lineage store maintenance")
+    sub = parser.add_subparsers(dest="command", required=True)
+    mig = sub.add_parser("migrate", help="Import per-file lineage records into the SQLite store")
+    mig.add_argument("--lineage-dir", type=Path, default=base_dir / "data" / "lineage")
+    mig.add_argument("--db", type=Path, default=base_dir / "data" / "lineage.db")
+    args = parser.parse_args(argv)
+
+    if not args.lineage_dir.exists():
+        sys.stderr.write(f"No lineage directory at {args.lineage_dir}\n")
+        return 1
+    store = LineageStore(args.db)
+    imported, skipped = store.import_directory(args.lineage_dir)
+    print(f"Imported {imported} record(s), skipped {skipped}; store now holds {store.count()} at {args.db}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,28 +16,111 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
+from mldlc_server.audit_index import AuditIndex
+from mldlc_server.lineage_graph import graph_for
+from mldlc_server.lineage_store import LineageStore
+from mldlc_server.risk_scorer import RiskScorer
+from mldlc_server.schema_validator import SchemaRegistry
+
+# The hash-chained audit log is the repository root's audit_chain.py, shared with the governance MCP server
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+from audit_chain import ChainedLog, verify_log  # noqa: E402
+
 # Configuration - use env or relative to this file
 BASE_DIR = Path(__file__).resolve().parent.parent
 SCHEMAS_PATH = Path(os.getenv("MLDLC_SCHEMAS_PATH", str(BASE_DIR / "schemas")))
 GOVERNANCE_PATH = Path(os.getenv("MLDLC_GOVERNANCE_PATH", str(BASE_DIR / "governance")))
 AUDIT_PATH = Path(os.getenv("MLDLC_AUDIT_PATH", str(BASE_DIR / "data" / "audit")))
 LINEAGE_PATH = Path(BASE_DIR / "data" / "lineage")
+LINEAGE_DB = Path(os.getenv("MLDLC_LINEAGE_DB", str(BASE_DIR / "data" / "lineage.db")))
 
 server = Server("mldlc-vtco")
 
 
+_audit_logs: dict[Path, ChainedLog] = {}
+
+
 def _log_audit(event_type: str, event_data: dict[str, Any], reasoning: str = "") -> None:
-    """Log audit event to file."""
+    """Append audit event to the hash-chained audit log."""
     AUDIT_PATH.mkdir(parents=True, exist_ok=True)
-    audit_file = AUDIT_PATH / "audit.jsonl"
+    audit_log = _audit_logs.get(AUDIT_PATH)
+    if audit_log is None:
+        audit_log = _audit_logs[AUDIT_PATH] = ChainedLog(AUDIT_PATH / "audit.jsonl")
     event = {
         "timestamp": datetime.utcnow().isoformat(),
         "event_type": event_type,
         "event_data": event_data,
         "reasoning": reasoning,
     }
-    with open(audit_file, "a", encoding="utf-8") as f:
-        f.write(json.dumps(event) + "\n")
+    audit_log.append(event)
+
+
+_audit_indexes: dict[Path, AuditIndex] = {}
+
+
+def _audit_index() -> AuditIndex:
+    """Offset index for AUDIT_PATH/audit.jsonl (updated incrementally on each query)."""
+    index = _audit_indexes.get(AUDIT_PATH)
+    if index is None:
+        index = _audit_indexes[AUDIT_PATH] = AuditIndex(AUDIT_PATH / "audit.jsonl")
+    return index
+
+
+_lineage_stores: dict[Path, LineageStore] = {}
+
+
+def _lineage_store() -> LineageStore:
+    """
+    Shared LineageStore for LINEAGE_DB (one per path so tests can repoint it).
+    A new, empty store picks up legacy per-file records from LINEAGE_PATH.
+    """
+    store = _lineage_stores.get(LINEAGE_DB)
+    if store is None:
+        store = _lineage_stores[LINEAGE_DB] = LineageStore(LINEAGE_DB)
+        if store.count() == 0 and LINEAGE_PATH.exists():
+            imported, _ = store.import_directory(LINEAGE_PATH)
+            if imported:
+                sys.stderr.write(f"Imported {imported} legacy lineage record(s) into {LINEAGE_DB}\n")
+    return store
+
+
+_risk_scorer_cache: dict[Path, tuple[int, RiskScorer]] = {}
+
+
+def _risk_scorer() -> RiskScorer:
+    """RiskScorer for GOVERNANCE_PATH/risk_matrix.json, rebuilt when the file changes."""
+    path = GOVERNANCE_PATH / "risk_matrix.json"
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        mtime = 0
+    cached = _risk_scorer_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = _risk_scorer_cache[path] = (mtime, RiskScorer.from_file(path))
+    return cached[1]
+
+
+_schema_registries: dict[Path, SchemaRegistry] = {}
+
+
+def _schema_registry() -> SchemaRegistry:
+    """Schemas in SCHEMAS_PATH, loaded and compiled on first use."""
+    registry = _schema_registries.get(SCHEMAS_PATH)
+    if registry is None:
+        registry = _schema_registries[SCHEMAS_PATH] = SchemaRegistry(SCHEMAS_PATH)
+    return registry
+
+
+def _schema_not_found(artifact_type: str) -> dict:
+    return {
+        "status": "error",
+        "error_type": "schema_not_found",
+        "message": f"Schema not found for artifact type: {artifact_type}",
+        "available_types": _schema_registry().artifact_types,
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -72,96 +155,38 @@ async def _assess_risk(
     financial_impact: str = "low",
     customer_impact: str = "low",
 ) -> dict:
-    score = 0
-    if scope == "production":
-        score += 3
-    elif scope == "staging":
-        score += 2
-    else:
-        score += 1
-    if data_sensitivity == "high":
-        score += 3
-    elif data_sensitivity == "medium":
-        score += 2
-    else:
-        score += 1
-    if financial_impact == "high":
-        score += 3
-    elif financial_impact == "medium":
-        score += 2
-    else:
-        score += 1
-    if customer_impact == "high":
-        score += 3
-    elif customer_impact == "medium":
-        score += 2
-    else:
-        score += 1
-
-    if score >= 9:
-        risk_level = "RED"
-        requirements = [
-            "Explicit approval required",
-            "Full documentation mandatory",
-            "Security review required",
-            "Rollback plan required",
-            "24-hour observation period",
-        ]
-    elif score >= 5:
-        risk_level = "YELLOW"
-        requirements = [
-            "Manager review required",
-            "Documentation recommended",
-            "Testing required",
-            "Monitoring required",
-        ]
-    else:
-        risk_level = "GREEN"
-        requirements = ["Standard process", "Basic documentation", "Self-review acceptable"]
-
-    result = {
-        "risk_level": risk_level,
-        "risk_score": score,
-        "description": description,
-        "factors": {
-            "scope": scope,
-            "data_sensitivity": data_sensitivity,
-            "financial_impact": financial_impact,
-            "customer_impact": customer_impact,
-        },
-        "requirements": requirements,
-    }
+    result = _risk_scorer().assess(
+        description,
+        scope=scope,
+        data_sensitivity=data_sensitivity,
+        financial_impact=financial_impact,
+        customer_impact=customer_impact,
+    )
     _log_audit("risk_assessed", result)
     return {"status": "success", "assessment": result}
 
 
+async def _assess_risk_batch(items: list[dict[str, Any]], include_assessments: bool = True) -> dict:
+    assessments, counts = _risk_scorer().assess_many(items)
+    red_ids = [a["id"] for a in assessments if a["risk_level"] == "RED" and "id" in a]
+    _log_audit(
+        "risk_assessed_batch",
+        {"total": len(assessments), "counts": counts, "red_item_ids": red_ids[:100]},
+    )
+    result: dict[str, Any] = {"status": "success", "total": len(assessments), "counts": counts}
+    if include_assessments:
+        result["assessments"] = assessments
+    return result
+
+
 async def _validate_artifact(
     artifact_type: str,
     artifact_data: dict[str, Any],
     strict_mode: bool = True,
 ) -> dict:
-    schema_file = SCHEMAS_PATH / f"{artifact_type}_v1.schema.json"
-    if not schema_file.exists():
-        return {
-            "status": "error",
-            "error_type": "schema_not_found",
-            "message": f"Schema not found: {schema_file}",
-        }
-    with open(schema_file, encoding="utf-8") as f:
-        schema = json.load(f)
-    errors = []
-    warnings = []
-    required = schema.get("required", [])
-    for field in required:
-        if field not in artifact_data:
-            errors.append(f"Missing required field: {field}")
-    result = {
-        "valid": len(errors) == 0,
-        "errors": errors,
-        "warnings": warnings,
-        "schema_type": artifact_type,
-        "schema_version": "v1",
-    }
+    result = _schema_registry().validate(artifact_type, artifact_data, strict_mode)
+    if result is None:
+        return _schema_not_found(artifact_type)
     _log_audit("schema_validated", {"artifact_type": artifact_type, "valid": result["valid"]})
     return {
         "status": "success" if result["valid"] else "validation_failed",
@@ -169,6 +194,30 @@ async def _validate_artifact(
     }
 
 
+async def _validate_artifacts(
+    artifact_type: str,
+    artifacts: list[dict[str, Any]],
+    strict_mode: bool = True,
+) -> dict:
+    summary = _schema_registry().validate_many(artifact_type, artifacts, strict_mode)
+    if summary is None:
+        return _schema_not_found(artifact_type)
+    _log_audit(
+        "schema_validated_batch",
+        {
+            "artifact_type": artifact_type,
+            "total": summary["total"],
+            "valid": summary["valid"],
+            "invalid": summary["invalid"],
+            "invalid_indexes": [r["index"] for r in summary["results"] if not r["valid"]][:100],
+        },
+    )
+    return {
+        "status": "success" if summary["invalid"] == 0 else "validation_failed",
+        "validation": summary,
+    }
+
+
 async def _record_lineage(
     source_entities: list[str],
     transformation: str,
@@ -188,35 +237,54 @@ async def _record_lineage(
         "code_reference": code_reference,
         "timestamp": datetime.utcnow().isoformat(),
     }
-    LINEAGE_PATH.mkdir(parents=True, exist_ok=True)
-    lineage_file = LINEAGE_PATH / f"{lineage_id}.json"
-    with open(lineage_file, "w", encoding="utf-8") as f:
-        json.dump(lineage_record, f, indent=2)
+    _lineage_store().add(lineage_record)
     _log_audit("lineage_recorded", lineage_record)
     return {"status": "success", "lineage_id": lineage_id, "record": lineage_record}
 
 
 async def _get_lineage(entity_id: str, direction: str = "both", depth: int = 5) -> dict:
-    upstream, downstream = [], []
-    if LINEAGE_PATH.exists():
-        for f in LINEAGE_PATH.glob("*.json"):
-            try:
-                with open(f, encoding="utf-8") as fp:
-                    rec = json.load(fp)
-                if entity_id in rec.get("source_entities", []):
-                    downstream.append(rec)
-                if rec.get("destination_entity") == entity_id:
-                    upstream.append(rec)
-            except (json.JSONDecodeError, OSError):
-                pass
+    if direction not in ("upstream", "downstream", "both"):
+        return {"status": "error", "message": f"Unknown direction: {direction}"}
+    graph = graph_for(_lineage_store())
+    lineage = graph.lineage(entity_id, direction, depth)
+    paths: dict[str, list[dict[str, Any]]] = {"upstream": [], "downstream": []}
+    for side in ("upstream", "downstream"):
+        if direction in (side, "both"):
+            paths[side] = graph.closure(entity_id, side, depth)["entities"]  # memoized by lineage()
     return {
         "status": "success",
         "entity_id": entity_id,
         "direction": direction,
-        "lineage": {"upstream": upstream[:depth], "downstream": downstream[:depth]},
+        "depth": depth,
+        "lineage": lineage,
+        "paths": paths,
     }
 
 
+async def _impact_analysis(entity_id: str, depth: int | None = None) -> dict:
+    impact = graph_for(_lineage_store()).impact(entity_id, depth)
+    return {"status": "success", "impact": impact}
+
+
+async def _query_audit(
+    event_type: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    entity_id: str | None = None,
+    risk_level: str | None = None,
+    limit: int = 100,
+    cursor: int | None = None,
+) -> dict:
+    index = _audit_index()
+    page = index.query(event_type, since, until, entity_id, risk_level, limit, cursor)
+    return {"status": "success", **page}
+
+
+async def _verify_audit(full: bool = False) -> dict:
+    result = verify_log(AUDIT_PATH / "audit.jsonl", full=full)
+    return {"status": "success" if result["valid"] else "tampered", "verification": result}
+
+
 async def _log_audit_event(event_type: str, event_data: dict[str, Any], reasoning: str) -> dict:
     event_id = hashlib.sha256(
         f"{event_type}:{datetime.utcnow().isoformat()}".encode()
@@ -261,9 +329,34 @@ async def list_tools() -> list[Tool]:
                 "required": ["description"],
             },
         ),
+        Tool(
+            name="assess_risk_batch",
+            description="Score many change requests in one pass using the risk matrix; writes one audit record per batch.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "items": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "id": {"type": "string", "description": "Ticket / change request ID"},
+                                "description": {"type": "string"},
+                                "scope": {"type": "string", "enum": ["production", "staging", "development"]},
+                                "data_sensitivity": {"type": "string", "enum": ["high", "medium", "low"]},
+                                "financial_impact": {"type": "string", "enum": ["high", "medium", "low"]},
+                                "customer_impact": {"type": "string", "enum": ["high", "medium", "low"]},
+                            },
+                        },
+                    },
+                    "include_assessments": {"type": "boolean", "description": "Return per-item results (default true)"},
+                },
+                "required": ["items"],
+            },
+        ),
         Tool(
             name="validate_artifact",
-            description="Validate artifact against JSON schema.",
+            description="Validate artifact against JSON schema (errors include paths such as $.metrics.accuracy).",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -277,6 +370,22 @@ async def list_tools() -> list[Tool]:
                 "required": ["artifact_type", "artifact_data"],
             },
         ),
+        Tool(
+            name="validate_artifacts",
+            description="Validate many artifacts of one type in a single call; returns counts and per-item errors for failures.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "artifact_type": {
+                        "type": "string",
+                        "enum": ["dataset", "model", "experiment", "deployment"],
+                    },
+                    "artifacts": {"type": "array", "items": {"type": "object"}},
+                    "strict_mode": {"type": "boolean"},
+                },
+                "required": ["artifact_type", "artifacts"],
+            },
+        ),
         Tool(
             name="record_lineage",
             description="Record data lineage for a transformation.",
@@ -294,7 +403,7 @@ async def list_tools() -> list[Tool]:
         ),
         Tool(
             name="get_lineage",
-            description="Get lineage for an entity.",
+            description="Get lineage for an entity: records and entity paths up to `depth` hops upstream and/or downstream.",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -305,6 +414,44 @@ async def list_tools() -> list[Tool]:
                 "required": ["entity_id"],
             },
         ),
+        Tool(
+            name="impact_analysis",
+            description="List every downstream dataset and model affected by a change to an entity, with paths.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "entity_id": {"type": "string"},
+                    "depth": {"type": "integer", "description": "Max hops (default: unbounded)"},
+                },
+                "required": ["entity_id"],
+            },
+        ),
+        Tool(
+            name="query_audit",
+            description="Query the audit trail by event type, time range, entity and risk level (indexed, paged).",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "event_type": {"type": "string"},
+                    "since": {"type": "string", "description": "ISO date or timestamp (inclusive)"},
+                    "until": {"type": "string", "description": "ISO date (whole day) or timestamp (inclusive)"},
+                    "entity_id": {"type": "string", "description": "vtco_id, lineage_id, dataset/model name, ..."},
+                    "risk_level": {"type": "string", "enum": ["RED", "YELLOW", "GREEN"]},
+                    "limit": {"type": "integer", "description": "Page size (max 1000, default 100)"},
+                    "cursor": {"type": "integer", "description": "next_cursor from the previous page"},
+                },
+            },
+        ),
+        Tool(
+            name="verify_audit",
+            description="Verify the audit log hash chain (records since the last checkpoint, or the whole log with full=true).",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "full": {"type": "boolean", "description": "Re-verify every record and checkpoint"},
+                },
+            },
+        ),
         Tool(
             name="log_audit_event",
             description="Log an audit event.",
@@ -338,11 +485,20 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             arguments.get("financial_impact", "low"),
             arguments.get("customer_impact", "low"),
         ),
+        "assess_risk_batch": lambda: _assess_risk_batch(
+            arguments["items"],
+            arguments.get("include_assessments", True),
+        ),
         "validate_artifact": lambda: _validate_artifact(
             arguments["artifact_type"],
             arguments["artifact_data"],
             arguments.get("strict_mode", True),
         ),
+        "validate_artifacts": lambda: _validate_artifacts(
+            arguments["artifact_type"],
+            arguments["artifacts"],
+            arguments.get("strict_mode", True),
+        ),
         "record_lineage": lambda: _record_lineage(
             arguments["source_entities"],
             arguments["transformation"],
@@ -355,6 +511,20 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             arguments.get("direction", "both"),
             arguments.get("depth", 5),
         ),
+        "impact_analysis": lambda: _impact_analysis(
+            arguments["entity_id"],
+            arguments.get("depth"),
+        ),
+        "query_audit": lambda: _query_audit(
+            arguments.get("event_type"),
+            arguments.get("since"),
+            arguments.get("until"),
+            arguments.get("entity_id"),
+            arguments.get("risk_level"),
+            arguments.get("limit", 100),
+            arguments.get("cursor"),
+        ),
+        "verify_audit": lambda: _verify_audit(arguments.get("full", False)),
         "log_audit_event": lambda: _log_audit_event(
             arguments["event_type"],
             arguments["event_data"],
@@ -0,0 +1,130 @@
+"""
+Table-driven RED/YELLOW/GREEN risk scoring from governance/risk_matrix.json.
+
+RiskScorer reads the factor weights ("scoring") and level bands
+("risk_levels.*.score_range") once and precomputes the (score, level) for
+every combination of factor values (4 factors x 3 values = 81 rows). Scoring
+an item is then one tuple lookup, so a batch of thousands of change requests
+is a single pass of dict lookups instead of per-item if/elif chains.
+Unknown factor values score as the factor's lowest weight, as before.
+"""
+from __future__ import annotations
+
+import itertools
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+FACTORS = ("scope", "data_sensitivity", "financial_impact", "customer_impact")
+FACTOR_DEFAULTS = {
+    "scope": "development",
+    "data_sensitivity": "low",
+    "financial_impact": "low",
+    "customer_impact": "low",
+}
+
+# Used when governance/risk_matrix.json is missing (mirrors the shipped matrix)
+DEFAULT_MATRIX: dict[str, Any] = {
+    "risk_levels": {
+        "RED": {
+            "score_range": [9, 12],
+            "requirements": [
+                "Explicit approval required",
+                "Full documentation mandatory",
+                "Security review required",
+                "Rollback plan required",
+                "24-hour observation period",
+            ],
+        },
+        "YELLOW": {
+            "score_range": [5, 8],
+            "requirements": [
+                "Manager review required",
+                "Documentation recommended",
+                "Testing required",
+                "Monitoring required",
+            ],
+        },
+        "GREEN": {
+            "score_range": [1, 4],
+            "requirements": ["Standard process", "Basic documentation", "Self-review acceptable"],
+        },
+    },
+    "scoring": {
+        "scope": {"production": 3, "staging": 2, "development": 1},
+        "data_sensitivity": {"high": 3, "medium": 2, "low": 1},
+        "financial_impact": {"high": 3, "medium": 2, "low": 1},
+        "customer_impact": {"high": 3, "medium": 2, "low": 1},
+    },
+}
+
+
+class RiskScorer:
+    """Precomputed risk matrix lookups."""
+
+    def __init__(self, matrix: dict[str, Any]) -> None:
+        scoring = matrix.get("scoring") or DEFAULT_MATRIX["scoring"]
+        levels = matrix.get("risk_levels") or DEFAULT_MATRIX["risk_levels"]
+        self.weights = {f: dict(scoring.get(f, DEFAULT_MATRIX["scoring"][f])) for f in FACTORS}
+        self._fallback = {f: min(w.values()) for f, w in self.weights.items()}
+
+        # Highest band first so overlapping ranges resolve to the more severe level
+        bands = sorted(
+            ((cfg["score_range"][0], cfg["score_range"][1], name) for name, cfg in levels.items()),
+            reverse=True,
+        )
+        self.requirements = {name: list(cfg.get("requirements", [])) for name, cfg in levels.items()}
+        self._lowest_level = bands[-1][2]
+        max_score = sum(max(w.values()) for w in self.weights.values())
+        self._level_by_score = [self._band(s, bands) for s in range(max_score + 1)]
+
+        self._table: dict[tuple[str, ...], tuple[int, str]] = {}
+        for combo in itertools.product(*(self.weights[f].items() for f in FACTORS)):
+            score = sum(weight for _, weight in combo)
+            self._table[tuple(value for value, _ in combo)] = (score, self._level_by_score[score])
+
+    def _band(self, score: int, bands: list[tuple[int, int, str]]) -> str:
+        for low, _high, name in bands:
+            if score >= low:
+                return name
+        return self._lowest_level
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "RiskScorer":
+        path = Path(path)
+        if not path.exists():
+            return cls(DEFAULT_MATRIX)
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def score(self, factors: dict[str, Any]) -> tuple[int, str]:
+        """(risk_score, risk_level) for one set of factor values."""
+        key = tuple(str(factors.get(f) or FACTOR_DEFAULTS[f]) for f in FACTORS)
+        hit = self._table.get(key)
+        if hit is not None:
+            return hit
+        score = sum(self.weights[f].get(v, self._fallback[f]) for f, v in zip(FACTORS, key))
+        return score, self._level_by_score[min(score, len(self._level_by_score) - 1)]
+
+    def assess(self, description: str, **factors: Any) -> dict[str, Any]:
+        values = {f: factors.get(f) or FACTOR_DEFAULTS[f] for f in FACTORS}
+        score, level = self.score(values)
+        return {
+            "risk_level": level,
+            "risk_score": score,
+            "description": description,
+            "factors": values,
+            "requirements": self.requirements.get(level, []),
+        }
+
+    def assess_many(self, items: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], dict[str, int]]:
+        """Assess a batch; returns (assessments, counts per level). Items may carry an "id"."""
+        assessments = []
+        for item in items:
+            result = self.assess(item.get("description", ""), **{f: item.get(f) for f in FACTORS})
+            if "id" in item:
+                result["id"] = item["id"]
+            assessments.append(result)
+        counts = Counter(a["risk_level"] for a in assessments)
+        return assessments, {level: counts.get(level, 0) for level in self.requirements}
@@ -0,0 +1,382 @@
+"""
+Compiled JSON Schema validation for MLDLC artifacts.
+
+SchemaRegistry loads every `{artifact_type}_v{N}.schema.json` in the schemas
+directory once and compiles one validator per schema:
+
+- fastjsonschema (if installed) as a fast valid/invalid check,
+- a built-in compiled walker for the full error list when the schema only
+  uses the subset the MLDLC schemas need (type, required, properties,
+  additionalProperties, items, enum, const, pattern, format,
+  minimum/maximum, minLength/maxLength, minItems/maxItems); it is several
+  times faster than jsonschema's iter_errors on these schemas,
+- jsonschema Draft 7 validators for schemas using anything beyond that subset.
+
+Errors carry a JSONPath-style location ("$.metrics.accuracy"). With
+strict_mode=False, only missing required fields and type mismatches fail
+validation; everything else is reported as a warning.
+
+A schema file that cannot be read, parsed or compiled is logged and skipped
+(see SchemaRegistry.load_errors); the other artifact types keep validating.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import re
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None
+
+logger = logging.getLogger(__name__)
+
+STRICT_ONLY_KEYWORDS = {"required", "type"}
+
+WALKER_KEYWORDS = {
+    "type", "required", "properties", "additionalProperties", "items", "enum", "const",
+    "pattern", "format", "minimum", "maximum", "minLength", "maxLength", "minItems", "maxItems",
+    # annotations
+    "$schema", "$id", "title", "description", "default", "examples", "$comment",
+}
+
+_SCHEMA_FILE = re.compile(r"^(?P<type>.+)_v(?P<version>\d+)\.schema\.json$")
+
+# Raised for a malformed schema file (bad JSON, or a schema the backends cannot compile)
+SCHEMA_LOAD_ERRORS: tuple[type[Exception], ...] = (OSError, ValueError, TypeError, AttributeError, re.error)
+if jsonschema is not None:
+    SCHEMA_LOAD_ERRORS += (jsonschema.exceptions.SchemaError,)
+if fastjsonschema is not None:
+    SCHEMA_LOAD_ERRORS += (fastjsonschema.JsonSchemaDefinitionException,)
+
+ErrorList = list[dict[str, Any]]
+Walker = Callable[[Any, str, ErrorList], None]
+
+
+def _path(parts: list[Any] | tuple[Any, ...]) -> str:
+    out = "$"
+    for p in parts:
+        out += f"[{p}]" if isinstance(p, int) else f".{p}"
+    return out
+
+
+def _error(path: str, keyword: str, message: str) -> dict[str, Any]:
+    return {"path": path, "keyword": keyword, "message": message}
+
+
+# ---------------------------------------------------------------------------
+# Built-in compiled walker
+# ---------------------------------------------------------------------------
+_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+
+def _is_datetime(v: str) -> bool:
+    try:
+        datetime.fromisoformat(v.replace("Z", "+00:00"))
+        return "T" in v or " " in v
+    except ValueError:
+        return False
+
+
+def _is_date(v: str) -> bool:
+    try:
+        date.fromisoformat(v)
+        return True
+    except ValueError:
+        return False
+
+
+_FORMAT_CHECKS: dict[str, Callable[[str], bool]] = {
+    "date-time": _is_datetime,
+    "date": _is_date,
+    "email": lambda v: re.fullmatch(r"[^@\s]+@[^@\s]+\.[^@\s]+", v) is not None,
+    "uri": lambda v: re.match(r"^[a-zA-Z][a-zA-Z0-9+.\-]*:", v) is not None,
+}
+
+
+def walker_supports(schema: Any) -> bool:
+    """True if every keyword in schema (recursively) is handled by compile_walker."""
+    if not isinstance(schema, dict):
+        return isinstance(schema, bool)
+    if not set(schema) <= WALKER_KEYWORDS:
+        return False
+    if schema.get("format") not in (None, *_FORMAT_CHECKS):
+        return False
+    subs = list(schema.get("properties", {}).values())
+    for key in ("items", "additionalProperties"):
+        if key in schema:
+            subs.append(schema[key])
+    return all(walker_supports(sub) for sub in subs)
+
+
+def compile_walker(schema: dict[str, Any]) -> Walker:
+    """Compile a schema into a closure tree; each node appends errors for its value."""
+    checks: list[Walker] = []
+
+    if "type" in schema:
+        types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        preds = [_TYPE_CHECKS[t] for t in types if t in _TYPE_CHECKS]
+        label = " or ".join(types)
+
+        def check_type(v: Any, path: str, errors: ErrorList) -> None:
+            if not any(p(v) for p in preds):
+                errors.append(_error(path, "type", f"{v!r:.60} is not of type {label}"))
+
+        checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = schema["enum"]
+
+        def check_enum(v: Any, path: str, errors: ErrorList) -> None:
+            if v not in allowed:
+                errors.append(_error(path, "enum", f"{v!r:.60} is not one of {allowed}"))
+
+        checks.append(check_enum)
+
+    if "const" in schema:
+        const = schema["const"]
+
+        def check_const(v: Any, path: str, errors: ErrorList) -> None:
+            if v != const:
+                errors.append(_error(path, "const", f"{const!r} was expected"))
+
+        checks.append(check_const)
+
+    if "pattern" in schema:
+        pattern = re.compile(schema["pattern"])
+
+        def check_pattern(v: Any, path: str, errors: ErrorList) -> None:
+            if isinstance(v, str) and not pattern.search(v):
+                errors.append(_error(path, "pattern", f"{v!r} does not match {pattern.pattern!r}"))
+
+        checks.append(check_pattern)
+
+    fmt_check = _FORMAT_CHECKS.get(schema.get("format", ""))
+    if fmt_check is not None:
+        fmt = schema["format"]
+
+        def check_format(v: Any, path: str, errors: ErrorList) -> None:
+            if isinstance(v, str) and not fmt_check(v):
+                errors.append(_error(path, "format", f"{v!r} is not a valid {fmt}"))
+
+        checks.append(check_format)
+
+    for keyword, op, word in (("minimum", float.__lt__, "less than"), ("maximum", float.__gt__, "greater than")):
+        if keyword in schema:
+            bound = float(schema[keyword])
+
+            def check_bound(v: Any, path: str, errors: ErrorList, bound=bound, op=op, word=word, keyword=keyword) -> None:
+                if _TYPE_CHECKS["number"](v) and op(float(v), bound):
+                    errors.append(_error(path, keyword, f"{v} is {word} the {keyword} of {schema[keyword]}"))
+
+            checks.append(check_bound)
+
+    for keyword, kind, cmp in (
+        ("minLength", str, int.__lt__), ("maxLength", str, int.__gt__),
+        ("minItems", list, int.__lt__), ("maxItems", list, int.__gt__),
+    ):
+        if keyword in schema:
+            limit = int(schema[keyword])
+
+            def check_len(v: Any, path: str, errors: ErrorList, limit=limit, kind=kind, cmp=cmp, keyword=keyword) -> None:
+                if isinstance(v, kind) and cmp(len(v), limit):
+                    errors.append(_error(path, keyword, f"length {len(v)} violates {keyword}={limit}"))
+
+            checks.append(check_len)
+
+    required = list(schema.get("required", []))
+    props = {name: compile_walker(sub) for name, sub in schema.get("properties", {}).items()}
+    additional = schema.get("additionalProperties", True)
+    additional_walker = compile_walker(additional) if isinstance(additional, dict) else None
+    if required or props or additional is not True:
+
+        def check_object(v: Any, path: str, errors: ErrorList) -> None:
+            if not isinstance(v, dict):
+                return
+            for name in required:
+                if name not in v:
+                    errors.append(_error(f"{path}.{name}", "required", f"Missing required field: {name}"))
+            for name, value in v.items():
+                walker = props.get(name)
+                if walker is not None:
+                    walker(value, f"{path}.{name}", errors)
+                elif additional is False:
+                    errors.append(_error(f"{path}.{name}", "additionalProperties", f"Unexpected field: {name}"))
+                elif additional_walker is not None:
+                    additional_walker(value, f"{path}.{name}", errors)
+
+        checks.append(check_object)
+
+    if isinstance(schema.get("items"), dict):
+        item_walker = compile_walker(schema["items"])
+
+        def check_items(v: Any, path: str, errors: ErrorList) -> None:
+            if isinstance(v, list):
+                for i, item in enumerate(v):
+                    item_walker(item, f"{path}[{i}]", errors)
+
+        checks.append(check_items)
+
+    def walk(v: Any, path: str, errors: ErrorList) -> None:
+        for check in checks:
+            check(v, path, errors)
+
+    return walk
+
+
+# ---------------------------------------------------------------------------
+# Compiled schema + registry
+# ---------------------------------------------------------------------------
+class CompiledSchema:
+    """One schema compiled for the fastest available backend."""
+
+    def __init__(self, artifact_type: str, version: str, schema: dict[str, Any], backend: str = "auto") -> None:
+        self.artifact_type = artifact_type
+        self.version = version
+        self.schema = schema
+        self._fast = None
+        self._validator = None
+        self._walker: Walker | None = None
+        if backend == "auto" and fastjsonschema is not None:
+            self._fast = fastjsonschema.compile(schema)
+        use_walker = backend == "builtin" or (backend == "auto" and walker_supports(schema))
+        if not use_walker and jsonschema is not None:
+            cls = jsonschema.validators.validator_for(schema, default=jsonschema.Draft7Validator)
+            cls.check_schema(schema)
+            self._validator = cls(schema, format_checker=cls.FORMAT_CHECKER)
+        if self._validator is None:
+            self._walker = compile_walker(schema)
+        self.backend = "jsonschema" if self._validator is not None else "builtin"
+        if self._fast is not None:
+            self.backend = f"fastjsonschema+{self.backend}"
+
+    def errors(self, data: Any) -> ErrorList:
+        """All schema errors for data (empty list when valid)."""
+        if self._fast is not None:
+            try:
+                self._fast(data)
+                return []
+            except fastjsonschema.JsonSchemaException as e:
+                fast_error = e
+        else:
+            fast_error = None
+        if self._validator is not None:
+            errors = [self._jsonschema_error(e) for e in self._validator.iter_errors(data)]
+        else:
+            errors = []
+            self._walker(data, "$", errors)
+        if not errors and fast_error is not None:
+            # fastjsonschema checks some formats the detailed backend does not
+            parts = list(getattr(fast_error, "path", None) or ["data"])[1:]
+            errors.append(_error(_path(parts), getattr(fast_error, "rule", None) or "schema", str(fast_error)))
+        return errors
+
+    @staticmethod
+    def _jsonschema_error(e: Any) -> dict[str, Any]:
+        parts = list(e.absolute_path)
+        if e.validator == "required":
+            missing = re.match(r"'(.+)' is a required property", e.message)
+            if missing:
+                field = missing.group(1)
+                return _error(_path(parts + [field]), "required", f"Missing required field: {field}")
+        return _error(_path(parts), str(e.validator), e.message)
+
+    def validate(self, data: Any, strict_mode: bool = True) -> dict[str, Any]:
+        errors, warnings = [], []
+        for err in self.errors(data):
+            if strict_mode or err["keyword"] in STRICT_ONLY_KEYWORDS:
+                errors.append(err)
+            else:
+                warnings.append(err)
+        return {
+            "valid": not errors,
+            "errors": errors,
+            "warnings": warnings,
+            "schema_type": self.artifact_type,
+            "schema_version": self.version,
+        }
+
+
+class SchemaRegistry:
+    """All artifact schemas in a directory, loaded and compiled once."""
+
+    def __init__(self, schemas_dir: str | Path, backend: str = "auto") -> None:
+        self.schemas_dir = Path(schemas_dir)
+        self.backend = backend
+        self._schemas: dict[str, CompiledSchema] = {}
+        self.load_errors: dict[str, str] = {}  # schema file name -> why it was skipped
+        self.reload()
+
+    def reload(self) -> None:
+        schemas: dict[str, CompiledSchema] = {}
+        load_errors: dict[str, str] = {}
+        for f in sorted(self.schemas_dir.glob("*.schema.json")):
+            m = _SCHEMA_FILE.match(f.name)
+            if not m:
+                continue
+            version = f"v{m.group('version')}"
+            existing = schemas.get(m.group("type"))
+            # Keep the newest version per artifact type
+            if existing is not None and int(existing.version[1:]) >= int(version[1:]):
+                continue
+            try:
+                with open(f, encoding="utf-8") as fp:
+                    schema = json.load(fp)
+                schemas[m.group("type")] = CompiledSchema(m.group("type"), version, schema, self.backend)
+            except SCHEMA_LOAD_ERRORS as e:
+                logger.warning("Skipping schema %s: %s", f.name, e)
+                load_errors[f.name] = str(e)
+        self._schemas = schemas
+        self.load_errors = load_errors
+
+    @property
+    def artifact_types(self) -> list[str]:
+        return sorted(self._schemas)
+
+    def get(self, artifact_type: str) -> CompiledSchema | None:
+        return self._schemas.get(artifact_type)
+
+    def validate(self, artifact_type: str, data: Any, strict_mode: bool = True) -> dict[str, Any] | None:
+        compiled = self.get(artifact_type)
+        return compiled.validate(data, strict_mode) if compiled else None
+
+    def validate_many(
+        self, artifact_type: str, items: list[Any], strict_mode: bool = True
+    ) -> dict[str, Any] | None:
+        """Validate a batch; per-item results are returned only for invalid items or items with warnings."""
+        compiled = self.get(artifact_type)
+        if compiled is None:
+            return None
+        results = []
+        valid = 0
+        for i, item in enumerate(items):
+            res = compiled.validate(item, strict_mode)
+            if res["valid"]:
+                valid += 1
+            if res["errors"] or res["warnings"]:
+                results.append({"index": i, "valid": res["valid"], "errors": res["errors"], "warnings": res["warnings"]})
+        return {
+            "schema_type": artifact_type,
+            "schema_version": compiled.version,
+            "total": len(items),
+            "valid": valid,
+            "invalid": len(items) - valid,
+            "results": results,
+        }
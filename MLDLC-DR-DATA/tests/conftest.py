@@ -0,0 +1,5 @@
+"""Make mldlc_server importable when tests run from the repo root."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
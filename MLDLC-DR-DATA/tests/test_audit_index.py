@@ -0,0 +1,95 @@
+"""Tests for the audit log offset index."""
+import json
+
+import pytest
+
+from mldlc_server.audit_index import AuditIndex, main
+
+
+def _event(event_type: str, ts: str, **data) -> dict:
+    return {"timestamp": ts, "event_type": event_type, "event_data": data, "reasoning": ""}
+
+
+def _append(path, *events) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        for e in events:
+            f.write(json.dumps(e) + "\n")
+
+
+@pytest.fixture
+def audit_file(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    _append(
+        path,
+        _event("risk_assessed", "2024-09-03T10:00:00", risk_level="RED", description="a"),
+        _event("risk_assessed", "2024-09-15T10:00:00", risk_level="GREEN", description="b"),
+        _event("risk_assessed", "2024-10-01T00:00:01", risk_level="RED", description="c"),
+        _event("lineage_recorded", "2024-09-20T08:00:00", lineage_id="abc123",
+               source_entities=["raw"], destination_entity="clean"),
+        _event("vtco_defined", "2024-09-30T23:59:59", vtco_id="v1"),
+    )
+    return path
+
+
+def test_filtered_query(audit_file) -> None:
+    """RED risk assessments in September."""
+    page = AuditIndex(audit_file).query(
+        event_type="risk_assessed", risk_level="RED", since="2024-09-01", until="2024-09-30"
+    )
+    assert [e["event_data"]["description"] for e in page["events"]] == ["a"]
+    assert page["next_cursor"] is None
+
+
+def test_bare_until_date_includes_whole_day(audit_file) -> None:
+    """until=YYYY-MM-DD covers events late on that day."""
+    page = AuditIndex(audit_file).query(since="2024-09-30", until="2024-09-30")
+    assert [e["event_type"] for e in page["events"]] == ["vtco_defined"]
+
+
+def test_entity_lookup(audit_file) -> None:
+    """Entity IDs from event_data (ids, source/destination entities) are indexed."""
+    index = AuditIndex(audit_file)
+    assert index.query(entity_id="raw")["count"] == 1
+    assert index.query(entity_id="abc123")["events"][0]["event_type"] == "lineage_recorded"
+    assert index.query(entity_id="v1")["count"] == 1
+
+
+def test_paging_with_cursor(audit_file) -> None:
+    """Pages follow log order and next_cursor resumes after the last event."""
+    index = AuditIndex(audit_file)
+    first = index.query(limit=2)
+    second = index.query(limit=2, cursor=first["next_cursor"])
+    third = index.query(limit=2, cursor=second["next_cursor"])
+    descriptions = [e["event_type"] for p in (first, second, third) for e in p["events"]]
+    assert len(descriptions) == 5
+    assert third["next_cursor"] is None
+
+
+def test_incremental_update(audit_file) -> None:
+    """Only appended lines are indexed; partial trailing lines wait."""
+    index = AuditIndex(audit_file)
+    assert index.update() == 5
+    assert index.update() == 0
+    _append(audit_file, _event("risk_assessed", "2024-09-04T00:00:00", risk_level="RED"))
+    with open(audit_file, "a", encoding="utf-8") as f:
+        f.write('{"timestamp": "2024-09-05')
+    assert index.update() == 1
+    assert index.count(risk_level="RED") == 3
+
+
+def test_rotated_log_is_reindexed(audit_file) -> None:
+    """A replaced log file triggers a rebuild instead of reading stale offsets."""
+    index = AuditIndex(audit_file)
+    index.update()
+    audit_file.unlink()
+    _append(audit_file, _event("vtco_defined", "2024-11-01T00:00:00", vtco_id="v9"))
+    page = index.query()
+    assert [e["event_data"]["vtco_id"] for e in page["events"]] == ["v9"]
+
+
+def test_cli_streams_jsonl(audit_file, capsys) -> None:
+    """query command prints one JSON event per line."""
+    assert main(["--audit-file", str(audit_file), "query", "--event-type", "risk_assessed"]) == 0
+    lines = capsys.readouterr().out.strip().splitlines()
+    assert len(lines) == 3
+    assert json.loads(lines[0])["event_data"]["description"] == "a"
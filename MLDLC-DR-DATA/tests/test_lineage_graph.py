@@ -0,0 +1,101 @@
+"""Tests for the in-memory lineage graph and impact analysis."""
+import pytest
+
+from mldlc_server.lineage_graph import LineageGraph, entity_kind
+from mldlc_server.lineage_store import LineageStore
+
+
+def _rec(lineage_id: str, sources: list[str], dest: str, transformation: str = "transform") -> dict:
+    return {
+        "lineage_id": lineage_id,
+        "source_entities": sources,
+        "transformation": transformation,
+        "destination_entity": dest,
+        "context": "test",
+        "timestamp": "2024-01-15T12:00:00",
+    }
+
+
+@pytest.fixture
+def graph(tmp_path) -> LineageGraph:
+    """raw -> clean -> features -> churn_clf (trained), clean -> report."""
+    store = LineageStore(tmp_path / "lineage.db")
+    store.add_many([
+        _rec("l1", ["raw"], "clean"),
+        _rec("l2", ["clean"], "features"),
+        _rec("l3", ["features"], "churn_clf", "model_training"),
+        _rec("l4", ["clean"], "report"),
+    ])
+    return LineageGraph(store)
+
+
+def test_entity_kind() -> None:
+    """Models are recognised by name or training transformation."""
+    assert entity_kind("models/churn.pkl") == "model"
+    assert entity_kind("model:churn_v2") == "model"
+    assert entity_kind("churn_clf", "model_training") == "model"
+    assert entity_kind("features_v2") == "dataset"
+    assert entity_kind("modeling_notes") == "dataset"
+
+
+def test_downstream_closure_with_paths(graph) -> None:
+    """Closure lists every reachable entity with its shortest path."""
+    closure = graph.closure("raw", "downstream")
+    by_entity = {e["entity"]: e for e in closure["entities"]}
+    assert set(by_entity) == {"clean", "features", "churn_clf", "report"}
+    assert by_entity["churn_clf"]["path"] == ["raw", "clean", "features", "churn_clf"]
+    assert by_entity["churn_clf"]["distance"] == 3
+    assert closure["record_hops"] == {"l1": 1, "l2": 2, "l4": 2, "l3": 3}
+
+
+def test_upstream_closure_and_depth(graph) -> None:
+    """Upstream closure walks back to roots and respects depth."""
+    full = graph.closure("churn_clf", "upstream")
+    assert [e["entity"] for e in full["entities"]] == ["features", "clean", "raw"]
+    limited = graph.closure("churn_clf", "upstream", depth=1)
+    assert [e["entity"] for e in limited["entities"]] == ["features"]
+
+
+def test_impact_analysis_splits_datasets_and_models(graph) -> None:
+    """Impact lists downstream datasets and models separately."""
+    impact = graph.impact("clean")
+    assert [e["entity"] for e in impact["models"]] == ["churn_clf"]
+    assert sorted(e["entity"] for e in impact["datasets"]) == ["features", "report"]
+    assert impact["affected_count"] == 3
+
+
+def test_memoized_until_store_changes(graph) -> None:
+    """Repeated queries hit the memo; new records invalidate it incrementally."""
+    first = graph.closure("raw", "downstream")
+    assert graph.closure("raw", "downstream") is first
+    graph.store.add(_rec("l5", ["churn_clf"], "predictions"))
+    second = graph.closure("raw", "downstream")
+    assert second is not first
+    assert "predictions" in {e["entity"] for e in second["entities"]}
+
+
+def test_lineage_records_carry_hops(graph) -> None:
+    """lineage() returns the traversed records per side, ordered by hop."""
+    out = graph.lineage("raw", "downstream", depth=5)
+    assert {r["destination_entity"]: r["hop"] for r in out["downstream"]} == {
+        "clean": 1, "features": 2, "report": 2, "churn_clf": 3,
+    }
+    assert out["upstream"] == []
+    assert [r["lineage_id"] for r in graph.lineage("churn_clf", "upstream")["upstream"]] == ["l3", "l2", "l1"]
+
+
+def test_lineage_depth_and_direction(graph) -> None:
+    """depth limits hops; both sides are filled for "both"; unknown directions are rejected."""
+    assert {r["lineage_id"] for r in graph.lineage("raw", "downstream", depth=2)["downstream"]} == {"l1", "l2", "l4"}
+    both = graph.lineage("clean", "both", depth=1)
+    assert [r["lineage_id"] for r in both["upstream"]] == ["l1"]
+    assert sorted(r["lineage_id"] for r in both["downstream"]) == ["l2", "l4"]
+    with pytest.raises(ValueError):
+        graph.lineage("clean", "sideways")
+
+
+def test_cycles_terminate(tmp_path) -> None:
+    """A cycle in recorded lineage does not loop forever."""
+    store = LineageStore(tmp_path / "lineage.db")
+    store.add_many([_rec("a", ["x"], "y"), _rec("b", ["y"], "x")])
+    assert len(LineageGraph(store).lineage("x", "downstream", depth=10)["downstream"]) == 2
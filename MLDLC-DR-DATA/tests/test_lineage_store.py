@@ -0,0 +1,41 @@
+"""Tests for the SQLite lineage store."""
+import json
+
+from mldlc_server.lineage_store import LineageStore, main
+
+
+def _rec(lineage_id: str, sources: list[str], dest: str, ts: str = "2024-01-15T12:00:00") -> dict:
+    return {
+        "lineage_id": lineage_id,
+        "source_entities": sources,
+        "transformation": "transform",
+        "destination_entity": dest,
+        "context": "test",
+        "code_reference": None,
+        "timestamp": ts,
+    }
+
+
+def test_import_directory_is_idempotent(tmp_path) -> None:
+    """Migration imports legacy per-file records once and skips bad files."""
+    legacy = tmp_path / "lineage"
+    legacy.mkdir()
+    for rec in (_rec("l1", ["raw"], "clean"), _rec("l2", ["clean"], "features")):
+        (legacy / f"{rec['lineage_id']}.json").write_text(json.dumps(rec))
+    (legacy / "broken.json").write_text("{not json")
+    store = LineageStore(tmp_path / "lineage.db")
+    assert store.import_directory(legacy) == (2, 1)
+    assert store.import_directory(legacy) == (0, 3)
+    assert store.count() == 2
+    assert store.get("l2")["destination_entity"] == "features"
+
+
+def test_migrate_command(tmp_path, capsys) -> None:
+    """migrate CLI reports counts and writes the database."""
+    legacy = tmp_path / "lineage"
+    legacy.mkdir()
+    (legacy / "l1.json").write_text(json.dumps(_rec("l1", ["raw"], "clean")))
+    db = tmp_path / "out.db"
+    assert main(["migrate", "--lineage-dir", str(legacy), "--db", str(db)]) == 0
+    assert "Imported 1 record(s)" in capsys.readouterr().out
+    assert LineageStore(db).count() == 1
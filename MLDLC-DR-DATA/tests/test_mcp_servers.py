@@ -5,3 +5,23 @@ import pytest
 def test_placeholder() -> None:
     """Placeholder test."""
     assert True
+
+
+def test_audit_log_is_hash_chained(tmp_path, monkeypatch) -> None:
+    """_log_audit writes a verifiable chain and verify_audit reports tampering."""
+    import asyncio
+
+    from mldlc_server import mcp_server_stdio as server
+
+    monkeypatch.setattr(server, "AUDIT_PATH", tmp_path)
+    for i in range(3):
+        server._log_audit("risk_assessed", {"risk_level": "GREEN", "n": i})
+    ok = asyncio.run(server._verify_audit(full=True))
+    assert ok["status"] == "success"
+    assert ok["verification"]["records_checked"] == 3
+
+    audit_file = tmp_path / "audit.jsonl"
+    audit_file.write_text(audit_file.read_text().replace('"n": 1', '"n": 7'))
+    bad = asyncio.run(server._verify_audit(full=True))
+    assert bad["status"] == "tampered"
+    assert bad["verification"]["first_bad_line"] == 2
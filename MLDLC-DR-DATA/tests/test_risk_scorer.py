@@ -0,0 +1,60 @@
+"""Tests for the table-driven risk scorer."""
+from pathlib import Path
+
+import pytest
+
+from mldlc_server.risk_scorer import DEFAULT_MATRIX, RiskScorer
+
+MATRIX = Path(__file__).parent.parent / "governance" / "risk_matrix.json"
+
+
+@pytest.fixture
+def scorer() -> RiskScorer:
+    return RiskScorer.from_file(MATRIX)
+
+
+@pytest.mark.parametrize(
+    "factors, score, level",
+    [
+        ({}, 4, "GREEN"),
+        ({"scope": "staging"}, 5, "YELLOW"),
+        ({"scope": "production", "data_sensitivity": "high", "financial_impact": "medium"}, 9, "RED"),
+        ({"scope": "production", "data_sensitivity": "high", "financial_impact": "high", "customer_impact": "high"}, 12, "RED"),
+        ({"scope": "production", "data_sensitivity": "medium", "financial_impact": "medium"}, 8, "YELLOW"),
+    ],
+)
+def test_score_bands(scorer, factors, score, level) -> None:
+    """Scores and levels follow the matrix weights and score ranges."""
+    assert scorer.score(factors) == (score, level)
+
+
+def test_unknown_values_score_lowest(scorer) -> None:
+    """Unrecognised factor values count as the lowest weight."""
+    assert scorer.score({"scope": "qa", "data_sensitivity": "extreme"}) == (4, "GREEN")
+
+
+def test_requirements_come_from_matrix(scorer) -> None:
+    """RED requirements are read from risk_matrix.json."""
+    result = scorer.assess("drop prod table", scope="production", data_sensitivity="high",
+                           financial_impact="high", customer_impact="high")
+    assert result["risk_level"] == "RED"
+    assert "Security review required" in result["requirements"]
+
+
+def test_matrix_weights_are_table_driven() -> None:
+    """Changing the matrix changes scoring without code changes."""
+    matrix = {**DEFAULT_MATRIX, "scoring": {**DEFAULT_MATRIX["scoring"], "scope": {"production": 9, "staging": 2, "development": 1}}}
+    assert RiskScorer(matrix).score({"scope": "production"}) == (12, "RED")
+
+
+def test_assess_many_counts(scorer) -> None:
+    """Batch scoring returns per-item results with ids and level counts."""
+    items = [
+        {"id": "T-1", "description": "docs"},
+        {"id": "T-2", "description": "prod", "scope": "production", "data_sensitivity": "high",
+         "financial_impact": "high"},
+        {"id": "T-3", "description": "staging", "scope": "staging"},
+    ]
+    assessments, counts = scorer.assess_many(items)
+    assert [a["id"] for a in assessments] == ["T-1", "T-2", "T-3"]
+    assert counts == {"RED": 1, "YELLOW": 1, "GREEN": 1}
@@ -0,0 +1,102 @@
+"""Tests for compiled artifact schema validation."""
+import shutil
+from pathlib import Path
+
+import pytest
+
+from mldlc_server.schema_validator import SchemaRegistry, walker_supports
+
+SCHEMAS = Path(__file__).parent.parent / "schemas"
+
+GOOD_MODEL = {"name": "churn", "version": "1.0.0", "type": "classification", "metrics": {"accuracy": 0.91}}
+BAD_MODEL = {"name": "churn", "version": "1.0", "type": "svm", "metrics": {"accuracy": 1.5}}
+
+
+@pytest.fixture(params=["auto", "builtin", "jsonschema"])
+def registry(request) -> SchemaRegistry:
+    if request.param == "jsonschema":
+        pytest.importorskip("jsonschema")
+    return SchemaRegistry(SCHEMAS, backend=request.param)
+
+
+def test_loads_all_schemas(registry) -> None:
+    """Every *_v1.schema.json is loaded once, keyed by artifact type."""
+    assert {"dataset", "model", "experiment", "deployment", "lineage"} <= set(registry.artifact_types)
+
+
+def test_repo_schemas_use_walker_subset() -> None:
+    """The shipped schemas compile to the built-in walker in auto mode."""
+    registry = SchemaRegistry(SCHEMAS)
+    for artifact_type in registry.artifact_types:
+        assert walker_supports(registry.get(artifact_type).schema), artifact_type
+
+
+def test_valid_model(registry) -> None:
+    """A well-formed model passes."""
+    result = registry.validate("model", GOOD_MODEL)
+    assert result["valid"] is True
+    assert result["errors"] == []
+
+
+def test_error_paths_and_keywords(registry) -> None:
+    """Type/enum/pattern/range errors report JSONPath locations."""
+    result = registry.validate("model", BAD_MODEL)
+    assert result["valid"] is False
+    found = {(e["path"], e["keyword"]) for e in result["errors"]}
+    assert found == {("$.version", "pattern"), ("$.type", "enum"), ("$.metrics.accuracy", "maximum")}
+
+
+def test_missing_required_nested(registry) -> None:
+    """Missing nested required fields point at the field."""
+    result = registry.validate("model", {**GOOD_MODEL, "metrics": {}})
+    assert result["errors"][0]["path"] == "$.metrics.accuracy"
+    assert result["errors"][0]["keyword"] == "required"
+
+
+def test_array_item_paths(registry) -> None:
+    """Errors inside arrays include the item index."""
+    dataset = {"name": "d", "version": "1.0.0", "source": "s3", "schema_version": "v1",
+               "columns": [{"name": "a", "type": "int"}, {"name": 3}]}
+    paths = {e["path"] for e in registry.validate("dataset", dataset)["errors"]}
+    assert paths == {"$.columns[1].name", "$.columns[1].type"}
+
+
+def test_non_strict_demotes_to_warnings(registry) -> None:
+    """strict_mode=False keeps only required/type errors as failures."""
+    result = registry.validate("model", BAD_MODEL, strict_mode=False)
+    assert result["valid"] is True
+    assert len(result["warnings"]) == 3
+    missing = registry.validate("model", {"name": "x"}, strict_mode=False)
+    assert missing["valid"] is False
+
+
+def test_validate_many(registry) -> None:
+    """Batch validation returns counts and only the failing items."""
+    summary = registry.validate_many("model", [GOOD_MODEL] * 5 + [BAD_MODEL] * 2)
+    assert (summary["total"], summary["valid"], summary["invalid"]) == (7, 5, 2)
+    assert [r["index"] for r in summary["results"]] == [5, 6]
+
+
+def test_unknown_type(registry) -> None:
+    """Unknown artifact types return None."""
+    assert registry.validate("pipeline", {}) is None
+
+
+@pytest.mark.parametrize("backend", ["auto", "builtin", "jsonschema"])
+def test_malformed_schema_is_skipped(tmp_path, backend) -> None:
+    """A bad schema file is logged and skipped; the good ones still validate."""
+    if backend == "jsonschema":
+        pytest.importorskip("jsonschema")
+    shutil.copy(SCHEMAS / "model_v1.schema.json", tmp_path)
+    shutil.copy(SCHEMAS / "lineage_v1.schema.json", tmp_path)
+    (tmp_path / "dataset_v1.schema.json").write_text("{not json", encoding="utf-8")
+    (tmp_path / "experiment_v1.schema.json").write_text('{"type": 5}', encoding="utf-8")
+    (tmp_path / "lineage_v2.schema.json").write_text('{"properties": []}', encoding="utf-8")
+
+    registry = SchemaRegistry(tmp_path, backend=backend)
+    assert set(registry.artifact_types) == {"model", "lineage"}
+    assert registry.get("lineage").version == "v1"
+    assert set(registry.load_errors) == {
+        "dataset_v1.schema.json", "experiment_v1.schema.json", "lineage_v2.schema.json"}
+    assert registry.validate("model", GOOD_MODEL)["valid"] is True
+    assert registry.validate("dataset", {}) is None
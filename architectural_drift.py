@@ -1,15 +1,31 @@
 """
 Architectural drift metrics - standalone module for Streamlit and MCP.
 No MCP/anyio dependencies - uses only stdlib + subprocess.
+
+DriftProvider wraps calculate_architectural_drift with a snapshot keyed on the
+repo HEAD SHA: callers get the last snapshot immediately and a recompute runs
+in a background thread only when HEAD has moved. A failed recompute is not
+retried for the same HEAD until RETRY_BACKOFF seconds have passed (or a forced
+refresh); the last error is reported meanwhile.
 """
 from __future__ import annotations
 
+import json
+import logging
+import os
 import subprocess
+import threading
+import time
 from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = "drift_snapshot.json"
+RETRY_BACKOFF = 300.0  # seconds before a failed recompute is retried for the same HEAD
+
 
 def calculate_architectural_drift(
     repo_path: str | Path = ".",
@@ -146,3 +162,132 @@ def calculate_architectural_drift(
         },
         "timestamp": datetime.now().isoformat(),
     }
+
+
+def get_repo_head(repo_path: str | Path = ".") -> str | None:
+    """Current HEAD SHA, or None when repo_path is not a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=str(repo_path),
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    head = result.stdout.strip()
+    return head if result.returncode == 0 and head else None
+
+
+class DriftProvider:
+    """
+    Cached drift metrics for one repo, refreshed in the background.
+
+    get() never runs git log analysis on the caller's thread: it returns the
+    last snapshot (memory, then .ai-governance/drift_snapshot.json) and, when
+    HEAD differs from the snapshot's SHA, starts one background recompute.
+    After a failure, the same HEAD is retried only once RETRY_BACKOFF has passed.
+    """
+
+    def __init__(
+        self,
+        repo_path: str | Path = ".",
+        days: int = 90,
+        snapshot_path: str | Path | None = None,
+    ) -> None:
+        self.repo_path = Path(repo_path)
+        self.days = days
+        self.snapshot_path = (
+            Path(snapshot_path) if snapshot_path else self.repo_path / ".ai-governance" / SNAPSHOT_FILE
+        )
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._error: str | None = None
+        self._failed: tuple[str | None, float] | None = None  # (HEAD, monotonic time) of the last failure
+        self._snapshot: dict[str, Any] | None = self._load_snapshot()
+
+    def _load_snapshot(self) -> dict[str, Any] | None:
+        try:
+            data = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if data.get("days") != self.days or "result" not in data:
+            return None
+        return data
+
+    def _save_snapshot(self, snapshot: dict[str, Any]) -> None:
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.snapshot_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(snapshot, indent=2), encoding="utf-8")
+            os.replace(tmp, self.snapshot_path)
+        except OSError as e:
+            logger.warning("Could not persist drift snapshot: %s", e)
+
+    def _compute(self, head: str | None) -> None:
+        try:
+            result = calculate_architectural_drift(repo_path=self.repo_path, days=self.days)
+            snapshot = {"head": head, "days": self.days, "result": result}
+            self._save_snapshot(snapshot)
+            with self._lock:
+                self._snapshot = snapshot
+                self._error = None
+                self._failed = None
+        except Exception as e:
+            logger.warning("Drift recompute failed: %s", e)
+            with self._lock:
+                self._error = str(e)
+                self._failed = (head, time.monotonic())
+
+    def _retry_in(self, head: str | None) -> float:
+        """Seconds until a failed recompute for head may run again (0 = now). Call with _lock held."""
+        if self._failed is None or self._failed[0] != head:
+            return 0.0
+        return max(0.0, RETRY_BACKOFF - (time.monotonic() - self._failed[1]))
+
+    def refresh(self, force: bool = False, wait: bool = False, head: str | None = None) -> bool:
+        """
+        Start a background recompute if HEAD moved (or force=True). A HEAD
+        whose recompute failed is skipped until RETRY_BACKOFF has passed,
+        unless force=True. Returns True if a recompute is running after the call.
+        """
+        if head is None:
+            head = get_repo_head(self.repo_path)
+        with self._lock:
+            running = self._thread is not None and self._thread.is_alive()
+            current = self._snapshot is not None and self._snapshot.get("head") == head
+            if not running and (force or (not current and not self._retry_in(head))):
+                self._thread = threading.Thread(
+                    target=self._compute, args=(head,), name="drift-refresh", daemon=True
+                )
+                self._thread.start()
+                running = True
+            thread = self._thread
+        if wait and thread is not None:
+            thread.join()
+            return False
+        return running
+
+    def get(self) -> dict[str, Any]:
+        """
+        Snapshot state without blocking on git analysis.
+        Keys: result (drift dict or None), head (SHA the result was computed
+        at), current_head, refreshing, stale, error (last failure, if any) and
+        retry_in (seconds until a failed HEAD is retried automatically).
+        """
+        head = get_repo_head(self.repo_path)
+        refreshing = self.refresh(head=head)
+        with self._lock:
+            snapshot = self._snapshot
+            error = self._error
+            retry_in = self._retry_in(head)
+        return {
+            "result": snapshot["result"] if snapshot else None,
+            "head": snapshot.get("head") if snapshot else None,
+            "current_head": head,
+            "refreshing": refreshing,
+            "stale": snapshot is None or snapshot.get("head") != head,
+            "error": error,
+            "retry_in": round(retry_in),
+        }
@@ -0,0 +1,308 @@
+"""
+Hash-chained, append-only JSONL audit log with Merkle checkpoints.
+
+Every record written by ChainedLog carries the SHA-256 of the previous record
+and its own hash, appended as the last two fields of the line:
+
+    {...entry...,"prev_hash":"<64 hex>","hash":"<64 hex>"}
+
+`hash` is the SHA-256 of the line bytes up to (not including) ',"hash":', so
+verification works on raw bytes without re-serializing JSON. Lines written
+before chaining was enabled are folded into the first record's prev_hash
+(SHA-256 of that legacy prefix), so they are covered too.
+
+Every `checkpoint_every` records a checkpoint is appended to
+`<log>.checkpoints.jsonl` with the chain head, the byte offset it ends at and
+the Merkle root of the record hashes in that segment. verify_log(full=False)
+only re-hashes records after the last checkpoint.
+
+Editing, deleting or reordering any record breaks the chain. Publish the
+latest checkpoint head somewhere outside the log (git commit, ticket) to also
+detect a wholesale rewrite of log + checkpoints.
+
+CLI:
+  python audit_chain.py verify .ai-governance/violations.jsonl [--full]
+
+MLDLC-DR-DATA's MCP server imports this module too (for data/audit/audit.jsonl).
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # Windows: in-process lock only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+GENESIS = "0" * 64
+CHECKPOINT_EVERY = 1000
+
+_HASH_MARK = b',"hash":"'
+_PREV_MARK = b',"prev_hash":"'
+_SUFFIX_LEN = len(_HASH_MARK) + 64 + 3  # ,"hash":"<64>"}\n
+_PREV_LEN = len(_PREV_MARK) + 64 + 1  # ,"prev_hash":"<64>"
+_READ_CHUNK = 1 << 20
+
+
+def checkpoint_path(log_path: str | Path) -> Path:
+    log_path = Path(log_path)
+    return log_path.with_name(log_path.stem + ".checkpoints.jsonl")
+
+
+def merkle_root(hashes: list[str]) -> str:
+    """Merkle root over hex SHA-256 leaves (odd nodes are paired with themselves)."""
+    if not hashes:
+        return GENESIS
+    level = [bytes.fromhex(h) for h in hashes]
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [hashlib.sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level), 2)]
+    return level[0].hex()
+
+
+def _split(line: bytes) -> tuple[str, str, bytes] | None:
+    """(prev_hash, hash, hashed_body) for a chained line, None for an unchained one."""
+    if len(line) < _SUFFIX_LEN + _PREV_LEN or not line.endswith(b'"}\n'):
+        return None
+    body = line[:-_SUFFIX_LEN]
+    if line[-_SUFFIX_LEN:-_SUFFIX_LEN + len(_HASH_MARK)] != _HASH_MARK:
+        return None
+    if body[-_PREV_LEN:-_PREV_LEN + len(_PREV_MARK)] != _PREV_MARK:
+        return None
+    return body[-65:-1].decode("ascii"), line[-67:-3].decode("ascii"), body
+
+
+def _read_checkpoints(path: Path) -> list[dict[str, Any]]:
+    checkpoints = []
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        checkpoints.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+    except OSError:
+        pass
+    return checkpoints
+
+
+class ChainedLog:
+    """Append-only hash-chained JSONL writer for one file."""
+
+    def __init__(self, path: str | Path, checkpoint_every: int = CHECKPOINT_EVERY) -> None:
+        self.path = Path(path)
+        self.checkpoints_path = checkpoint_path(self.path)
+        self.checkpoint_every = checkpoint_every
+        self._lock = threading.Lock()
+        # Tail state, trusted only while the file size matches what we last wrote
+        self._size = -1
+        self._head = GENESIS
+        self._count = 0
+        self._segment: list[str] = []
+        self._segment_start = 0
+
+    def _load_state(self) -> None:
+        """Rebuild head/count/segment from the last checkpoint (or the whole file)."""
+        checkpoints = _read_checkpoints(self.checkpoints_path)
+        last = checkpoints[-1] if checkpoints else None
+        start = last["offset"] if last else 0
+        head = last["head"] if last else None
+        count = last["count"] if last else 0
+        segment: list[str] = []
+        legacy = hashlib.sha256()
+        size = 0
+        if self.path.exists():
+            size = self.path.stat().st_size
+            if last and size < start:
+                logger.warning("%s is shorter than its last checkpoint; restarting checkpoints", self.path)
+                start, head, count = 0, None, 0
+            with open(self.path, "rb") as f:
+                f.seek(start)
+                for line in f:
+                    parts = _split(line)
+                    if parts is None:
+                        if head is None:
+                            legacy.update(line)
+                        continue
+                    head = parts[1]
+                    segment.append(head)
+                    count += 1
+        self._head = head if head is not None else legacy.hexdigest() if size else GENESIS
+        self._count = count
+        self._segment = segment
+        self._segment_start = start
+        self._size = size
+
+    def append(self, entry: dict[str, Any]) -> dict[str, Any]:
+        """Append entry with prev_hash/hash fields; returns the stored record."""
+        record = {k: v for k, v in entry.items() if k not in ("prev_hash", "hash")}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(self.path, "ab") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                if os.fstat(f.fileno()).st_size != self._size:
+                    self._load_state()
+                body = json.dumps(record)[:-1]
+                body += ("," if record else "") + f'"prev_hash":"{self._head}"'
+                digest = hashlib.sha256(body.encode("utf-8")).hexdigest()
+                line = f'{body},"hash":"{digest}"}}\n'.encode("utf-8")
+                f.write(line)
+                f.flush()
+                self._size += len(line)
+                self._head = digest
+                self._count += 1
+                self._segment.append(digest)
+                if len(self._segment) >= self.checkpoint_every:
+                    self._write_checkpoint()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+        record["prev_hash"] = body[-65:-1]
+        record["hash"] = digest
+        return record
+
+    def checkpoint(self) -> dict[str, Any] | None:
+        """Force a checkpoint for records since the last one (None if there are none)."""
+        with self._lock:
+            if self._size != (self.path.stat().st_size if self.path.exists() else 0):
+                self._load_state()
+            return self._write_checkpoint() if self._segment else None
+
+    def _write_checkpoint(self) -> dict[str, Any]:
+        cp = {
+            "count": self._count,
+            "offset": self._size,
+            "head": self._head,
+            "segment_start": self._segment_start,
+            "segment_count": len(self._segment),
+            "merkle_root": merkle_root(self._segment),
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+        }
+        with open(self.checkpoints_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(cp) + "\n")
+        self._segment = []
+        self._segment_start = self._size
+        return cp
+
+
+def _fail(result: dict[str, Any], line_no: int, error: str) -> dict[str, Any]:
+    result.update(valid=False, first_bad_line=line_no, error=error)
+    return result
+
+
+def verify_log(path: str | Path, full: bool = True) -> dict[str, Any]:
+    """
+    Verify the hash chain in one streaming pass.
+
+    full=True re-hashes every record and checks every checkpoint's offset,
+    head and Merkle root. full=False starts at the last checkpoint (trusting
+    the history before it, which earlier verifications covered) and checks
+    only the records appended since, so its cost grows with new data only.
+    """
+    path = Path(path)
+    checkpoints = _read_checkpoints(checkpoint_path(path))
+    result: dict[str, Any] = {
+        "path": str(path),
+        "mode": "full" if full or not checkpoints else "tail",
+        "valid": True,
+        "records_checked": 0,
+        "legacy_lines": 0,
+        "checkpoints_checked": 0,
+        "head": None,
+        "first_bad_line": None,
+        "error": None,
+    }
+    if not path.exists():
+        return _fail(result, 0, "log file not found")
+
+    size = path.stat().st_size
+    pending = list(checkpoints) if result["mode"] == "full" else []
+    start, head, line_no = 0, None, 0
+    if result["mode"] == "tail":
+        last = checkpoints[-1]
+        if size < last["offset"]:
+            return _fail(result, 0, "log is shorter than its last checkpoint (truncated)")
+        start, head = last["offset"], last["head"]
+        if start:
+            with open(path, "rb") as f:
+                f.seek(start - 67)
+                if f.read(64).decode("ascii", "replace") != head:
+                    return _fail(result, 0, "record at last checkpoint does not match checkpoint head")
+        result["checkpoints_checked"] = 1
+
+    legacy = hashlib.sha256()
+    legacy_bytes = 0
+    segment: list[str] = []
+    offset = start
+    with open(path, "rb", buffering=_READ_CHUNK) as f:
+        f.seek(start)
+        for line in f:
+            line_no += 1
+            offset += len(line)
+            parts = _split(line)
+            if parts is None:
+                if head is None:
+                    # Everything before the first chained record is folded into its prev_hash
+                    legacy.update(line)
+                    legacy_bytes += len(line)
+                    result["legacy_lines"] += 1 if line.strip() else 0
+                    continue
+                if not line.strip():
+                    continue
+                return _fail(result, line_no, "unchained or malformed record after chain start")
+            prev, digest, body = parts
+            expected_prev = head if head is not None else (legacy.hexdigest() if legacy_bytes else GENESIS)
+            if prev != expected_prev:
+                return _fail(result, line_no, "prev_hash does not match previous record (edited, deleted or reordered)")
+            if hashlib.sha256(body).hexdigest() != digest:
+                return _fail(result, line_no, "record hash mismatch (record edited)")
+            head = digest
+            segment.append(digest)
+            result["records_checked"] += 1
+            if pending and offset == pending[0]["offset"]:
+                cp = pending.pop(0)
+                if cp["head"] != head or cp.get("merkle_root") != merkle_root(segment):
+                    return _fail(result, line_no, f"checkpoint at offset {cp['offset']} does not match records")
+                segment = []
+                result["checkpoints_checked"] += 1
+    if pending:
+        return _fail(result, line_no, f"checkpoint at offset {pending[0]['offset']} has no matching record")
+    result["head"] = head
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Hash-chained audit log tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+    v = sub.add_parser("verify", help="Verify a chained log")
+    v.add_argument("path", type=Path)
+    v.add_argument("--full", action="store_true", help="Verify from the first record instead of the last checkpoint")
+    c = sub.add_parser("checkpoint", help="Write a checkpoint for records since the last one")
+    c.add_argument("path", type=Path)
+    args = parser.parse_args(argv)
+
+    if args.command == "checkpoint":
+        cp = ChainedLog(args.path).checkpoint()
+        print(json.dumps(cp) if cp else "No records since last checkpoint")
+        return 0
+    result = verify_log(args.path, full=args.full)
+    print(json.dumps(result, indent=2))
+    return 0 if result["valid"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Load test for the personal ML MCP server (my-ml-mcp-server).
+
+N concurrent clients (default 50), one thread and one keep-alive session
+each, send a mixed workload of the endpoints editors and pages hit:
+detect-zone, validate-code, suggest-pattern, prompts, query-knowledge-graph,
+health and (when the server is sandboxed) init-experiment. Prints requests/sec
+and latency percentiles.
+
+Without --url the script starts the server itself with uvicorn on a free
+port, with experiments written to a temp directory. --baseline-ref runs the
+same load against my-ml-mcp-server as of a git ref (extracted to a temp
+directory) first and prints the comparison:
+
+  python benchmarks/load_test_my_ml.py --baseline-ref 9317759
+  python benchmarks/load_test_my_ml.py --url http://localhost:8000 --clients 50 --duration 20
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+import requests
+
+REPO = Path(__file__).resolve().parent.parent
+SERVER_DIR = REPO / "my-ml-mcp-server"
+
+FILE_PATHS = [
+    "src/api/predict.py", "src/models/train.py", "notebooks/eda.ipynb",
+    "experiments/baseline/notebook.ipynb", "pipelines/features.py", "scratch/idea.py",
+]
+CODE = (
+    "from sklearn.model_selection import train_test_split\n"
+    "X_train, X_test, y_train, y_test = train_test_split(X, y)\n"
+    "model.fit(X_train, y_train)\n"
+)
+TASKS = ["split data for training", "train a model with mlflow", "evaluate and plot metrics", "serve predictions"]
+QUERIES = ["iris", "random forest", "accuracy", "churn model"]
+ZONES = ["green", "yellow", "red"]
+
+# (weight, method, path or path factory, body factory); writes only run against a sandboxed server
+WORKLOAD: list[tuple[int, str, Any, Any]] = [
+    (30, "POST", "/detect-zone", lambda r: {"file_path": r.choice(FILE_PATHS)}),
+    (15, "POST", "/validate-code", lambda r: {"code": CODE, "zone": r.choice(ZONES)}),
+    (20, "POST", "/suggest-pattern", lambda r: {"task": r.choice(TASKS), "zone": r.choice(ZONES)}),
+    (15, "GET", lambda r: f"/prompts/{r.choice(ZONES)}", None),
+    (10, "POST", "/query-knowledge-graph", lambda r: {"query": r.choice(QUERIES)}),
+    (5, "GET", "/health", None),
+]
+WRITE_WORKLOAD = [
+    (5, "POST", "/init-experiment", lambda r: {"name": f"load test {r.randrange(200)}", "description": "load"}),
+]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@contextmanager
+def serve(server_dir: Path) -> Iterator[str]:
+    """Run uvicorn for server_dir on a free port, experiments in a temp dir."""
+    port = free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "MY_ML_EXPERIMENTS_DIR": str(Path(tmp) / "experiments"),
+            "MY_ML_EXPERIMENT_DB": str(Path(tmp) / "experiments.db"),
+        }
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "mcp.server:app", "--port", str(port), "--log-level", "warning"],
+            cwd=server_dir,
+            env=env,
+        )
+        url = f"http://127.0.0.1:{port}"
+        try:
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    requests.get(url + "/health", timeout=1).raise_for_status()
+                    break
+                except requests.RequestException:
+                    if proc.poll() is not None or time.monotonic() > deadline:
+                        raise SystemExit(f"server in {server_dir} did not start")
+                    time.sleep(0.2)
+            yield url
+        finally:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+
+@contextmanager
+def checkout(ref: str) -> Iterator[Path]:
+    """my-ml-mcp-server as of ref, extracted to a temp directory."""
+    archive = subprocess.run(
+        ["git", "archive", ref, "my-ml-mcp-server"], cwd=REPO, check=True, capture_output=True
+    ).stdout
+    with tempfile.TemporaryDirectory() as tmp:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(tmp)
+        yield Path(tmp) / "my-ml-mcp-server"
+
+
+def _client(url: str, workload: list, seed: int, warmup_end: float, end: float,
+            latencies: list[float], errors: list[int], ok_by_path: Counter,
+            headers: dict[str, str] | None = None) -> None:
+    rng = random.Random(seed)
+    weights = [w[0] for w in workload]
+    session = requests.Session()
+    session.headers.update(headers or {})
+    while True:
+        now = time.monotonic()
+        if now >= end:
+            break
+        _, method, path, body = rng.choices(workload, weights)[0]
+        path = path(rng) if callable(path) else path
+        start = time.perf_counter()
+        try:
+            resp = session.request(method, url + path, json=body(rng) if body else None, timeout=30)
+            ok = resp.status_code < 400
+        except requests.RequestException:
+            ok = False
+        elapsed = time.perf_counter() - start
+        if ok:
+            ok_by_path[f"{method} {path.split('?')[0]}"] += 1  # warmup included
+        if now >= warmup_end:
+            latencies.append(elapsed)
+            if not ok:
+                errors.append(1)
+
+
+def run_load(url: str, workload: list, clients: int, duration: float, warmup: float,
+             headers: dict[str, str] | None = None) -> dict[str, Any]:
+    """Drive workload from `clients` threads for warmup + duration seconds; stats cover duration only."""
+    latencies: list[float] = []
+    errors: list[int] = []
+    start = time.monotonic()
+    warmup_end = start + warmup
+    end = warmup_end + duration
+    counters = [Counter() for _ in range(clients)]
+    threads = [
+        threading.Thread(target=_client, args=(url, workload, i, warmup_end, end, latencies, errors, counters[i], headers))
+        for i in range(clients)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    latencies.sort()
+    ok_by_path = sum(counters, Counter())
+
+    def pct(p: float) -> float:
+        return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000, 2) if latencies else 0.0
+
+    return {
+        "url": url,
+        "clients": clients,
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": round(len(latencies) / duration, 1),
+        "p50_ms": pct(0.50),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2) if latencies else 0.0,
+        "ok_by_path": dict(ok_by_path),
+    }
+
+
+def print_result(label: str, r: dict[str, Any]) -> None:
+    print(
+        f"{label:<10} {r['rps']:>9.1f} req/s  p50 {r['p50_ms']:>7.2f} ms  p95 {r['p95_ms']:>7.2f} ms  "
+        f"p99 {r['p99_ms']:>7.2f} ms  ({r['requests']} requests, {r['errors']} errors, {r['clients']} clients)"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Concurrent load test for my-ml-mcp-server")
+    parser.add_argument("--url", help="Test a running server instead of starting one")
+    parser.add_argument("--baseline-ref", help="Also test my-ml-mcp-server at this git ref and compare")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0, help="Measured seconds per run")
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--writes", action="store_true",
+                        help="Include /init-experiment against --url (always on for a started server)")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args(argv)
+
+    results: dict[str, Any] = {}
+    if args.baseline_ref:
+        with checkout(args.baseline_ref) as old_dir, serve(old_dir) as url:
+            results["baseline"] = run_load(url, WORKLOAD + WRITE_WORKLOAD, args.clients, args.duration, args.warmup)
+        print_result(args.baseline_ref[:10], results["baseline"])
+    if args.url:
+        workload = WORKLOAD + (WRITE_WORKLOAD if args.writes else [])
+        results["current"] = run_load(args.url, workload, args.clients, args.duration, args.warmup)
+    else:
+        with serve(SERVER_DIR) as url:
+            results["current"] = run_load(url, WORKLOAD + WRITE_WORKLOAD, args.clients, args.duration, args.warmup)
+    print_result("current", results["current"])
+    if "baseline" in results and results["baseline"]["rps"]:
+        print(f"speedup    {results['current']['rps'] / results['baseline']['rps']:.2f}x req/s")
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    return 1 if results["current"]["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Load test for quiz_server.py: /quiz/submit and /quiz/status.
+
+N concurrent clients (default 50) act as an onboarding wave: each request is
+for one of --developers developers, 30% submissions (half of them passing)
+and 70% status checks. Prints requests/sec and latency percentiles.
+
+Without --url the script starts quiz_server.py itself on a free port with a
+temp GOVERNANCE_REPO_PATH, once per serving mode given in --modes
+("dev" = Flask development server, "N" = production mode with N workers):
+
+  python benchmarks/load_test_quiz.py --modes dev,4
+  python benchmarks/load_test_quiz.py --url http://localhost:3001 --clients 50
+
+Submissions name many developers, so they need the server's shared secret
+(see the trust model in quiz_server.py): a started server gets a random
+QUIZ_SERVER_TOKEN, and --url runs use --token (default: $QUIZ_SERVER_TOKEN).
+
+After each started run it checks that the attempts recorded in the store add
+up to the submissions the server accepted, i.e. that no update was lost.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import secrets
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from load_test_my_ml import free_port, print_result, run_load  # noqa: E402
+
+REPO = Path(__file__).resolve().parent.parent
+CORRECT = ["b", "c", "a", "d", "b"]
+WRONG = ["a", "a", "a", "a", "a"]
+
+
+def workload(developers: int) -> list[tuple[int, str, Any, Any]]:
+    return [
+        (15, "POST", "/quiz/submit",
+         lambda r: {"quiz_id": "v1", "developer": f"dev{r.randrange(developers)}", "answers": CORRECT}),
+        (15, "POST", "/quiz/submit",
+         lambda r: {"quiz_id": "v1", "developer": f"dev{r.randrange(developers)}", "answers": WRONG}),
+        (70, "GET", lambda r: f"/quiz/status?developer=dev{r.randrange(developers)}", None),
+    ]
+
+
+@contextmanager
+def serve(mode: str, repo_path: Path, token: str) -> Iterator[str]:
+    """Run quiz_server.py in dev mode or with `mode` production workers, writes gated on token."""
+    port = free_port()
+    cmd = [sys.executable, str(REPO / "quiz_server.py"), "--host", "127.0.0.1", "--port", str(port)]
+    if mode != "dev":
+        cmd += ["--workers", mode]
+    # Request logs go to a file: an undrained pipe would block the server once full
+    log = repo_path / "quiz_server.log"
+    with open(log, "w") as log_file:
+        proc = subprocess.Popen(
+            cmd, cwd=REPO, env={**os.environ, "GOVERNANCE_REPO_PATH": str(repo_path), "QUIZ_SERVER_TOKEN": token},
+            stdout=log_file, stderr=subprocess.STDOUT,
+        )
+    url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                requests.get(url + "/quiz/questions", timeout=1).raise_for_status()
+                break
+            except requests.RequestException:
+                if proc.poll() is not None or time.monotonic() > deadline:
+                    raise SystemExit(f"quiz_server ({mode}) did not start:\n{log.read_text()}")
+                time.sleep(0.2)
+        yield url
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def stored_attempts(repo_path: Path) -> int:
+    """Total attempts recorded in the store (every accepted submission adds one)."""
+    from quiz_store import QuizStore
+
+    store = QuizStore(repo_path / ".ai-governance" / "quiz_results.db")
+    with closing(store._connect()) as conn:
+        return conn.execute("SELECT COALESCE(SUM(attempts), 0) FROM quiz_results").fetchone()[0]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Concurrent load test for quiz_server.py")
+    parser.add_argument("--url", help="Test a running server instead of starting one")
+    parser.add_argument("--modes", default="dev,4",
+                        help="Comma-separated serving modes to start: dev and/or worker counts")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--developers", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=10.0, help="Measured seconds per run")
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--token", default=os.environ.get("QUIZ_SERVER_TOKEN", ""),
+                        help="QUIZ_SERVER_TOKEN of the --url server")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args(argv)
+
+    mix = workload(args.developers)
+    results: dict[str, Any] = {}
+    failed = False
+    if args.url:
+        headers = {"Authorization": f"Bearer {args.token}"} if args.token else None
+        results["url"] = run_load(args.url, mix, args.clients, args.duration, args.warmup, headers)
+        print_result("url", results["url"])
+        failed = bool(results["url"]["errors"])
+    else:
+        for mode in [m.strip() for m in args.modes.split(",") if m.strip()]:
+            label = "dev" if mode == "dev" else f"{mode} workers"
+            token = secrets.token_urlsafe(16)
+            with tempfile.TemporaryDirectory() as tmp, serve(mode, Path(tmp), token) as url:
+                result = run_load(url, mix, args.clients, args.duration, args.warmup,
+                                  {"Authorization": f"Bearer {token}"})
+                result["stored_attempts"] = stored_attempts(Path(tmp))
+            submitted = result["ok_by_path"].get("POST /quiz/submit", 0)
+            result["lost_updates"] = submitted - result["stored_attempts"]
+            results[label] = result
+            print_result(label, result)
+            print(f"{'':<10} {submitted} submissions accepted, {result['stored_attempts']} stored "
+                  f"({result['lost_updates']} lost)")
+            failed = failed or bool(result["errors"]) or result["lost_updates"] != 0
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
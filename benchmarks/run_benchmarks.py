@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for governance hot paths.
+
+Times the code paths the MCP servers hit on every request or every analytics
+run, so a rule or parser change that makes them 10x slower shows up before it
+ships:
+
+- determine_zone over synthetic 10k / 100k path sets
+- get_trend over a 1M-line entropy log
+- _compute_coaching_metrics over a large coaching log
+- calculate_architectural_drift on a generated git repo
+- MLDLC _get_lineage over many lineage records: direct (1-hop) lineage, the
+  workload recorded before the SQLite lineage store, and a 5-hop BFS
+
+Run:     python benchmarks/run_benchmarks.py run --output bench_results.json
+Compare: python benchmarks/run_benchmarks.py compare benchmarks/baseline.json bench_results.json
+Update the stored baseline: python benchmarks/run_benchmarks.py run --output benchmarks/baseline.json
+
+`compare` exits with status 1 when any case is slower than the baseline by more
+than --threshold (default 0.25 = 25%). Use --scale 0.1 for a quick local run;
+results recorded at different scales are not compared.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+REPO = Path(__file__).resolve().parent.parent
+MLDLC_DIR = REPO / "MLDLC-DR-DATA"
+sys.path.insert(0, str(REPO))
+
+from data.telemetry_generator import generate_telemetry  # noqa: E402
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_THRESHOLD = 0.25
+
+# Full-scale sizes; multiplied by --scale
+SIZES = {
+    "determine_zone_10k": 10_000,
+    "determine_zone_100k": 100_000,
+    "get_trend_1m": 1_000_000,
+    "coaching_metrics": 200_000,
+    "architectural_drift_commits": 500,
+    "mldlc_get_lineage": 5_000,
+    "mldlc_lineage_bfs_5hop": 5_000,
+}
+
+PATH_TEMPLATES = [
+    "src/payment/{name}.py",
+    "src/security/{name}.py",
+    "src/api/{name}.py",
+    "src/services/{name}.py",
+    "src/utils/{name}.py",
+    "src/crud/{name}.py",
+    "tests/unit/test_{name}.py",
+    "docs/{name}.md",
+    "migrations/2024_{name}.sql",
+    "lib/{name}.js",
+    "config/production/{name}.yaml",
+    "app/components/{name}.tsx",
+]
+
+Case = Callable[[Path, float], Any]
+
+
+# ---------------------------------------------------------------------------
+# Fixture builders (telemetry logs come from data.telemetry_generator)
+# ---------------------------------------------------------------------------
+def _synthetic_paths(n: int) -> list[str]:
+    rng = random.Random(42)
+    return [rng.choice(PATH_TEMPLATES).format(name=f"module_{i}") for i in range(n)]
+
+
+def _load_jsonl(path: Path) -> list[dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _build_git_repo(path: Path, commits: int) -> None:
+    """Generate a git repo quickly via git fast-import."""
+    subprocess.run(["git", "init", "-q", str(path)], check=True)
+    rng = random.Random(42)
+    authors = ["alice", "bob", "carol", "dave", "erin"]
+    files = [f"src/module_{i}/service.py" for i in range(60)]
+    start = int(time.time()) - 80 * 86400
+    chunks: list[bytes] = []
+    for c in range(commits):
+        author = rng.choice(authors)
+        when = start + c * (80 * 86400 // max(commits, 1))
+        msg = f"commit {c}\n".encode()
+        chunks.append(b"commit refs/heads/main\n")
+        chunks.append(f"committer {author} <{author}@example.com> {when} +0000\n".encode())
+        chunks.append(b"data %d\n%s" % (len(msg), msg))
+        for fpath in rng.sample(files, 3):
+            body = "".join(f"import mod_{k}\n" for k in range(rng.randint(2, 15)))
+            body += "".join(f"x_{k} = {c}\n" for k in range(rng.randint(5, 40)))
+            data = body.encode()
+            chunks.append(f"M 100644 inline {fpath}\n".encode())
+            chunks.append(b"data %d\n%s\n" % (len(data), data))
+        chunks.append(b"\n")
+    subprocess.run(["git", "fast-import", "--quiet"], input=b"".join(chunks), cwd=str(path), check=True)
+    subprocess.run(["git", "checkout", "-q", "main"], cwd=str(path), check=True)
+
+
+def _lineage_records(n: int) -> list[dict[str, Any]]:
+    rng = random.Random(42)
+    records = []
+    for i in range(n):
+        records.append({
+            "lineage_id": f"{i:012x}",
+            "source_entities": [f"dataset_{rng.randrange(max(i, 1))}"],
+            "transformation": "feature_engineering",
+            "destination_entity": f"dataset_{i}",
+            "context": "benchmark",
+            "code_reference": None,
+            "timestamp": "2024-01-15T12:00:00",
+        })
+    return records
+
+
+# ---------------------------------------------------------------------------
+# Cases: each returns (callable, workload size) or None when unavailable
+# ---------------------------------------------------------------------------
+def _zone_case(key: str) -> Case:
+    def build(_tmp: Path, scale: float):
+        from zoning_enforcer import determine_zone, load_governance_rules
+
+        rules = load_governance_rules(REPO)
+        paths = _synthetic_paths(max(1, int(SIZES[key] * scale)))
+        return (lambda: [determine_zone(p, None, rules) for p in paths]), len(paths)
+
+    return build
+
+
+def _case_get_trend(tmp: Path, scale: float):
+    from entropy_tracker import get_trend
+
+    n = max(1, int(SIZES["get_trend_1m"] * scale))
+    generate_telemetry(tmp, {"entropy_log": n}, days=30)
+    log_path = tmp / "entropy_log.jsonl"
+    return (lambda: get_trend(log_path, 30.0)), n
+
+
+def _case_coaching_metrics(tmp: Path, scale: float):
+    try:
+        from mcp_server import _compute_coaching_metrics
+    except ImportError:
+        return None
+    generate_telemetry(tmp, {"coaching_log": max(1, int(SIZES["coaching_metrics"] * scale))})
+    entries = _load_jsonl(tmp / "coaching_log.jsonl")
+    return (lambda: _compute_coaching_metrics(entries)), len(entries)
+
+
+def _case_architectural_drift(tmp: Path, scale: float):
+    from architectural_drift import calculate_architectural_drift
+
+    commits = max(10, int(SIZES["architectural_drift_commits"] * scale))
+    repo = tmp / "drift_repo"
+    _build_git_repo(repo, commits)
+    return (lambda: calculate_architectural_drift(repo_path=repo, days=90)), commits
+
+
+def _mldlc_lineage_case(key: str, depth: int) -> Case:
+    def build(tmp: Path, scale: float):
+        sys.path.insert(0, str(MLDLC_DIR))
+        try:
+            from mldlc_server import mcp_server_stdio as mldlc
+        except ImportError:
+            return None
+        n = max(1, int(SIZES[key] * scale))
+        mldlc.LINEAGE_PATH = tmp / "lineage"
+        mldlc.LINEAGE_DB = tmp / "lineage.db"
+        mldlc._lineage_store().add_many(_lineage_records(n))
+        mldlc.AUDIT_PATH = tmp / "audit"
+        return (lambda: asyncio.run(mldlc._get_lineage("dataset_1", "both", depth))), n
+
+    return build
+
+
+CASES: dict[str, Case] = {
+    "determine_zone_10k": _zone_case("determine_zone_10k"),
+    "determine_zone_100k": _zone_case("determine_zone_100k"),
+    "get_trend_1m": _case_get_trend,
+    "coaching_metrics": _case_coaching_metrics,
+    "architectural_drift": _case_architectural_drift,
+    "mldlc_get_lineage": _mldlc_lineage_case("mldlc_get_lineage", 1),
+    "mldlc_lineage_bfs_5hop": _mldlc_lineage_case("mldlc_lineage_bfs_5hop", 5),
+}
+
+
+# ---------------------------------------------------------------------------
+# Runner and comparison
+# ---------------------------------------------------------------------------
+def run_benchmarks(scale: float, repeat: int, only: list[str] | None = None) -> dict[str, Any]:
+    """Run every case and return a results document."""
+    logging.disable(logging.INFO)
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as tmp_name:
+        tmp = Path(tmp_name)
+        for name, build in CASES.items():
+            if only and name not in only:
+                continue
+            case_dir = tmp / name
+            case_dir.mkdir()
+            built = build(case_dir, scale)
+            if built is None:
+                results[name] = {"skipped": "dependency not installed"}
+                print(f"  {name:<24} skipped (dependency not installed)")
+                continue
+            fn, size = built
+            fn()  # warm-up
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fn()
+                timings.append(time.perf_counter() - start)
+            results[name] = {
+                "size": size,
+                "median_s": round(statistics.median(timings), 6),
+                "min_s": round(min(timings), 6),
+                "repeat": repeat,
+            }
+            print(f"  {name:<24} n={size:<9} median={results[name]['median_s']:.4f}s")
+    return {
+        "meta": {
+            "created": datetime.utcnow().isoformat() + "Z",
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scale": scale,
+            **({"only": sorted(only)} if only else {}),
+        },
+        "results": results,
+    }
+
+
+def compare_results(baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> list[str]:
+    """
+    Return the names of cases that regressed by more than threshold. A case
+    timed in the baseline but missing, skipped or failed in the current run
+    counts as a regression too (unless the run was limited with --only).
+    """
+    regressions: list[str] = []
+    if baseline.get("meta", {}).get("scale") != current.get("meta", {}).get("scale"):
+        print("Scale differs between baseline and current run; nothing compared.")
+        return regressions
+    base_results = baseline.get("results", {})
+    cur_results = current.get("results", {})
+    only = current.get("meta", {}).get("only")
+    names = [n for n in base_results if not only or n in only]
+    names += [n for n in cur_results if n not in base_results]
+    print(f"{'case':<24} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for name in names:
+        base = base_results.get(name) or {}
+        cur = cur_results.get(name) or {}
+        if "median_s" not in base:
+            timed = f"{cur['median_s']:>10.4f}" if "median_s" in cur else f"{'-':>10}"
+            print(f"{name:<24} {'-':>10} {timed} {'n/a':>7}")
+            continue
+        if "median_s" not in cur:
+            regressions.append(name)
+            reason = cur.get("skipped") or cur.get("error") or "not run"
+            print(f"{name:<24} {base['median_s']:>10.4f} {'-':>10} {'n/a':>7}  MISSING ({reason})")
+            continue
+        ratio = cur["median_s"] / base["median_s"] if base["median_s"] else 1.0
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<24} {base['median_s']:>10.4f} {cur['median_s']:>10.4f} {ratio:>7.2f}{flag}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Governance hot-path benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="Run benchmarks and write results JSON")
+    run_p.add_argument("--output", type=Path, default=Path("bench_results.json"))
+    run_p.add_argument("--scale", type=float, default=1.0, help="Multiply fixture sizes (e.g. 0.1)")
+    run_p.add_argument("--repeat", type=int, default=3)
+    run_p.add_argument("--only", nargs="*", choices=sorted(CASES), help="Run a subset of cases")
+
+    cmp_p = sub.add_parser("compare", help="Fail if current results regress vs baseline")
+    cmp_p.add_argument("baseline", type=Path, nargs="?", default=BASELINE_PATH)
+    cmp_p.add_argument("current", type=Path, nargs="?", default=Path("bench_results.json"))
+    cmp_p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                       help="Allowed slowdown as a fraction (0.25 = 25%%)")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        print(f"Running benchmarks (scale={args.scale}, repeat={args.repeat})")
+        doc = run_benchmarks(args.scale, args.repeat, args.only)
+        args.output.write_text(json.dumps(doc, indent=2) + "\n", encoding="utf-8")
+        print(f"Results written to {args.output}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    current = json.loads(args.current.read_text(encoding="utf-8"))
+    regressions = compare_results(baseline, current, args.threshold)
+    if regressions:
+        print(f"FAILED: {len(regressions)} case(s) slower than {args.threshold:.0%} or missing: {', '.join(regressions)}")
+        return 1
+    print("OK: no regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    raise SystemExit(main())
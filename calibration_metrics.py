@@ -0,0 +1,188 @@
+"""
+Calibration metrics for the AI Adoption Universal Framework.
+
+Turns Week 1 telemetry (violations.jsonl + scaffolding_effectiveness.jsonl)
+into the four entropy components and per-role / per-zone breakdowns:
+
+- Bloat:     accepted edits that shipped unused code (violations, allowed=True)
+- Rework:    edits touching a file 3+ times (violations)
+- Reverts:   AI suggestions reverted within 24h (scaffolding)
+- Premature: suggestions accepted in under 5 seconds (scaffolding)
+
+Each log is reduced with a single group-by over precomputed indicator
+columns instead of one boolean-mask filter per metric. Inputs can be pandas
+DataFrames, pyarrow Tables, or lists of dicts. Output feeds
+entropy_tracker.calculate_entropy directly.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from entropy_tracker import calculate_entropy
+
+logger = logging.getLogger(__name__)
+
+# Columns the live MCP log may not carry (blocked-edit entries only record
+# zone/role/reason); filled so demo and live data share one code path.
+VIOLATION_DEFAULTS: dict[str, Any] = {
+    "zone": "unknown",
+    "user_role": "unknown",
+    "complexity_score": 0,
+    "allowed": False,
+    "touch_count": 1,
+    "has_bloat": False,
+}
+SCAFFOLDING_DEFAULTS: dict[str, Any] = {
+    "user_role": "unknown",
+    "time_to_accept": float("nan"),
+    "was_reverted": False,
+}
+
+PREMATURE_SECONDS = 5
+REWORK_TOUCHES = 3
+
+
+def to_frame(data: Any, defaults: dict[str, Any] | None = None) -> pd.DataFrame:
+    """Coerce a DataFrame, pyarrow Table or list of dicts to a DataFrame with default columns."""
+    if isinstance(data, pd.DataFrame):
+        df = data.copy()
+    elif hasattr(data, "to_pandas"):
+        df = data.to_pandas()
+    else:
+        df = pd.DataFrame(list(data or []))
+    for col, default in (defaults or {}).items():
+        if col not in df.columns:
+            df[col] = default
+        else:
+            df[col] = df[col].fillna(default)
+    return df
+
+
+def load_jsonl_frame(path: str | Path, skip_adr: bool = False) -> pd.DataFrame:
+    """Read a JSONL log into a DataFrame, skipping malformed lines (and ADR records if asked)."""
+    records: list[dict[str, Any]] = []
+    p = Path(path)
+    if not p.exists():
+        return pd.DataFrame()
+    try:
+        with open(p, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if skip_adr and "adr_id" in entry:
+                    continue
+                records.append(entry)
+    except OSError as e:
+        logger.warning("Could not read %s: %s", p, e)
+    return pd.DataFrame(records)
+
+
+def _violation_indicators(violations: Any) -> pd.DataFrame:
+    df = to_frame(violations, VIOLATION_DEFAULTS)
+    accepted = df["allowed"].astype(bool)
+    return pd.DataFrame({
+        "user_role": df["user_role"].astype(str),
+        "zone": df["zone"].astype(str),
+        "events": 1,
+        "accepted": accepted.astype(int),
+        "bloat": (accepted & df["has_bloat"].astype(bool)).astype(int),
+        "rework": (pd.to_numeric(df["touch_count"], errors="coerce") >= REWORK_TOUCHES).astype(int),
+    })
+
+
+def _scaffolding_indicators(scaffolding: Any) -> pd.DataFrame:
+    df = to_frame(scaffolding, SCAFFOLDING_DEFAULTS)
+    return pd.DataFrame({
+        "user_role": df["user_role"].astype(str),
+        "events": 1,
+        "reverts": df["was_reverted"].astype(bool).astype(int),
+        "premature": (pd.to_numeric(df["time_to_accept"], errors="coerce") < PREMATURE_SECONDS).astype(int),
+    })
+
+
+def _pct(numerator: float, denominator: float) -> float:
+    return round(float(numerator) / float(denominator) * 100, 2) if denominator else 0.0
+
+
+def _components(v: pd.Series | None, s: pd.Series | None) -> dict[str, float]:
+    """Percentages from summed indicator rows (either side may be missing for a group)."""
+    out: dict[str, float] = {}
+    if v is not None:
+        out["bloat"] = _pct(v["bloat"], v["accepted"])
+        out["rework"] = _pct(v["rework"], v["events"])
+    if s is not None:
+        out["reverts"] = _pct(s["reverts"], s["events"])
+        out["premature"] = _pct(s["premature"], s["events"])
+    return out
+
+
+def compute_calibration(violations: Any, scaffolding: Any) -> dict[str, Any]:
+    """
+    Compute the four entropy components overall, per role and per zone.
+    Zone breakdown covers bloat/rework only (scaffolding events carry no zone).
+    """
+    v = _violation_indicators(violations)
+    s = _scaffolding_indicators(scaffolding)
+
+    v_cols = ["events", "accepted", "bloat", "rework"]
+    s_cols = ["events", "reverts", "premature"]
+    v_total = v[v_cols].sum()
+    s_total = s[s_cols].sum()
+    v_role = v.groupby("user_role")[v_cols].sum()
+    s_role = s.groupby("user_role")[s_cols].sum()
+    v_zone = v.groupby("zone")[v_cols].sum()
+
+    components = {"bloat": 0.0, "rework": 0.0, "reverts": 0.0, "premature": 0.0}
+    components.update(_components(v_total, s_total))
+
+    by_role: dict[str, dict[str, Any]] = {}
+    for role in sorted(set(v_role.index) | set(s_role.index)):
+        vr = v_role.loc[role] if role in v_role.index else None
+        sr = s_role.loc[role] if role in s_role.index else None
+        entry: dict[str, Any] = _components(vr, sr)
+        entry["violation_events"] = int(vr["events"]) if vr is not None else 0
+        entry["scaffolding_events"] = int(sr["events"]) if sr is not None else 0
+        by_role[role] = entry
+
+    by_zone = {
+        zone: {**_components(row, None), "violation_events": int(row["events"])}
+        for zone, row in v_zone.iterrows()
+    }
+
+    return {
+        "components": components,
+        "by_role": by_role,
+        "by_zone": by_zone,
+        "violation_events": int(v_total["events"]) if len(v) else 0,
+        "scaffolding_events": int(s_total["events"]) if len(s) else 0,
+    }
+
+
+def entropy_inputs(components: dict[str, float]) -> dict[str, float]:
+    """Map components to calculate_entropy / MCP calculate_entropy argument names."""
+    return {
+        "bloat_percent": components.get("bloat", 0.0),
+        "rework_percent": components.get("rework", 0.0),
+        "revert_percent": components.get("reverts", 0.0),
+        "premature_acceptance_percent": components.get("premature", 0.0),
+    }
+
+
+def calibrate(violations: Any, scaffolding: Any) -> dict[str, Any]:
+    """Full calibration: components, breakdowns, calculate_entropy inputs and score."""
+    result = compute_calibration(violations, scaffolding)
+    inputs = entropy_inputs(result["components"])
+    result["entropy_inputs"] = inputs
+    result["entropy_score"] = calculate_entropy(**inputs)
+    return result
@@ -1,25 +1,34 @@
 """Code Review - AI-powered production readiness check."""
 import streamlit as st
 import sys
+import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from coaching_server.server import validate_code
 
+SEVERITY_ICON = {"ERROR": "⛔", "CRITICAL": "🔴", "HIGH": "🟠", "WARNING": "🟡", "INFO": "ℹ️"}
+
 st.title("🔍 Code Review")
-st.caption("Production readiness check")
+st.caption("Production readiness check — reviewed live as you edit (Ctrl+Enter or click away to apply)")
 
 code = st.text_area("Paste code to review", height=250, placeholder="# Your ML code here...")
-if st.button("Review"):
-    if code:
-        result = validate_code(code)
-        if result["valid"]:
-            st.success("✅ No critical issues")
-        else:
-            st.error("Issues found:")
-            for i in result["issues"]:
-                st.write(f"- **{i['severity']}**: {i['message']}")
-        if result.get("strengths"):
-            st.info("**Strengths:** " + "; ".join(result["strengths"]))
+if code.strip():
+    started = time.perf_counter()
+    result = validate_code(code)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if result["valid"]:
+        st.success("✅ No critical issues")
     else:
-        st.warning("Paste code first")
+        st.error("Issues found:")
+    lines = code.splitlines()
+    for i in result["issues"]:
+        icon = SEVERITY_ICON.get(i["severity"], "•")
+        st.write(f"{icon} **{i['severity']}** · line {i['line']}, col {i['col']} · {i['message']}")
+        if 0 < i["line"] <= len(lines):
+            st.code(lines[i["line"] - 1].strip(), language="python")
+    if result.get("strengths"):
+        st.info("**Strengths:** " + "; ".join(result["strengths"]))
+    st.caption(f"Reviewed {len(lines)} line(s) in {elapsed_ms:.1f} ms")
+else:
+    st.info("Paste code to start the review")
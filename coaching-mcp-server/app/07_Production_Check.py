@@ -16,11 +16,11 @@ if st.button("Check"):
         if result["valid"]:
             st.success("✅ Passes production readiness checks")
         else:
-            critical = [i for i in result["issues"] if i["severity"] in ("CRITICAL", "HIGH")]
+            critical = [i for i in result["issues"] if i["severity"] in ("ERROR", "CRITICAL", "HIGH")]
             if critical:
                 st.error("**Block deployment:**")
                 for i in critical:
-                    st.write(f"- {i['message']}")
+                    st.write(f"- Line {i['line']}: {i['message']}")
             for i in result["issues"]:
                 if i["severity"] == "WARNING":
                     st.warning(i["message"])
@@ -0,0 +1,240 @@
+"""
+In-memory knowledge repository for the coaching server.
+
+knowledge/{explanations,diagnostics,anti_patterns}/*.yaml and
+prompts/coaching_prompts.yaml are parsed once into an immutable Snapshot.
+A poll watcher (or a throttled check on access when no watcher runs, e.g.
+inside Streamlit) stats the files and, if any changed, builds a new
+snapshot -- re-parsing only the changed files -- and swaps it in with a
+single reference assignment. Readers never see a half-updated knowledge base.
+
+Each snapshot also carries pre-serialized JSON responses with ETags,
+produced by the `build_responses` callback the server passes in, so request
+handling is a dict lookup plus a bytes write.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+CATEGORIES = ("explanations", "diagnostics", "anti_patterns")
+PROMPTS_FILE = "coaching_prompts.yaml"
+POLL_INTERVAL = 2.0
+
+
+def _empty() -> Mapping[str, Any]:
+    return MappingProxyType({})
+
+
+def _load_yaml(path: Path) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
+def serialize(payload: Any) -> tuple[bytes, str]:
+    """(JSON body, strong ETag) for a response payload."""
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return body, '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+
+
+_ENTITY_TAG = re.compile(r'\*|(?:W/)?"[^"]*"')
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header lists etag (weak comparison, so W/ is ignored) or is "*"."""
+    for tag in _ENTITY_TAG.findall(if_none_match or ""):
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """One consistent, read-only view of the knowledge base."""
+
+    version: str = ""
+    explanations: Mapping[str, dict] = field(default_factory=_empty)
+    diagnostics: Mapping[str, dict] = field(default_factory=_empty)
+    anti_patterns: Mapping[str, dict] = field(default_factory=_empty)
+    prompts: Mapping[str, Any] = field(default_factory=_empty)
+    # path -> (mtime_ns, size) and path -> parsed data, for incremental reloads
+    stamps: Mapping[str, tuple[int, int]] = field(default_factory=_empty)
+    files: Mapping[str, dict] = field(default_factory=_empty)
+    changed: frozenset[str] = frozenset()
+    responses: Mapping[str, tuple[bytes, str]] = field(default_factory=_empty, repr=False)
+
+    def category(self, name: str) -> Mapping[str, dict]:
+        return getattr(self, name)
+
+
+class KnowledgeRepository:
+    """Holds the current Snapshot and swaps in a new one when files change."""
+
+    def __init__(
+        self,
+        knowledge_dir: str | Path,
+        prompts_dir: str | Path,
+        build_responses: Callable[[Snapshot], dict[str, Any]] | None = None,
+        poll_interval: float = POLL_INTERVAL,
+    ) -> None:
+        self.knowledge_dir = Path(knowledge_dir)
+        self.prompts_dir = Path(prompts_dir)
+        self.build_responses = build_responses
+        self.poll_interval = poll_interval
+        self._snapshot = Snapshot()
+        self._lock = threading.Lock()
+        self._last_check = 0.0
+        self._unparseable: dict[str, tuple[int, int]] = {}  # path -> stamp that failed to parse
+        self._listeners: list[Callable[[Snapshot, Snapshot], None]] = []
+        self._watcher: threading.Thread | None = None
+        self._stop = threading.Event()
+        self.reload()
+
+    # ------------------------------------------------------------------
+    # Snapshot access
+    # ------------------------------------------------------------------
+    @property
+    def snapshot(self) -> Snapshot:
+        """Current snapshot; without a watcher, re-checks files at most once per poll_interval."""
+        self.refresh_if_stale()
+        return self._snapshot
+
+    def refresh_if_stale(self) -> bool:
+        """Without a watcher, reload if poll_interval has passed since the last check; returns whether it swapped."""
+        if self._watcher is None and time.monotonic() - self._last_check >= self.poll_interval:
+            return self.reload()
+        return False
+
+    def response(self, key: str) -> tuple[bytes, str] | None:
+        return self.snapshot.responses.get(key)
+
+    def on_swap(self, listener: Callable[[Snapshot, Snapshot], None]) -> None:
+        """Call listener(old, new) after every swap (new.changed lists changed paths)."""
+        self._listeners.append(listener)
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        stamps: dict[str, tuple[int, int]] = {}
+        for category in CATEGORIES:
+            try:
+                with os.scandir(self.knowledge_dir / category) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".yaml") and entry.is_file():
+                            st = entry.stat()
+                            stamps[entry.path] = (st.st_mtime_ns, st.st_size)
+            except FileNotFoundError:
+                continue
+        prompts = self.prompts_dir / PROMPTS_FILE
+        try:
+            st = prompts.stat()
+            stamps[str(prompts)] = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            pass
+        return stamps
+
+    def reload(self, force: bool = False) -> bool:
+        """Swap in a new snapshot if any file changed; returns whether a swap happened."""
+        with self._lock:
+            self._last_check = time.monotonic()
+            old = self._snapshot
+            stamps = self._scan()
+            for path, bad in list(self._unparseable.items()):
+                if stamps.get(path) != bad:
+                    del self._unparseable[path]
+                elif path in old.stamps:
+                    stamps[path] = old.stamps[path]
+                else:
+                    del stamps[path]
+            if stamps == old.stamps and not force and old.version:
+                return False
+
+            files: dict[str, dict] = {}
+            changed: set[str] = set(old.stamps) - set(stamps)
+            for path, stamp in list(stamps.items()):
+                if not force and old.stamps.get(path) == stamp:
+                    files[path] = old.files[path]
+                    continue
+                changed.add(path)
+                try:
+                    files[path] = _load_yaml(Path(path))
+                except (OSError, yaml.YAMLError) as e:
+                    # Keep serving the last good version of a half-saved file
+                    logger.warning("Could not load %s: %s", path, e)
+                    self._unparseable[path] = stamp
+                    if path in old.files:
+                        files[path] = old.files[path]
+                        stamps[path] = old.stamps[path]
+                    else:
+                        del stamps[path]
+
+            by_category: dict[str, dict[str, dict]] = {c: {} for c in CATEGORIES}
+            prompts: dict[str, Any] = {}
+            prompts_path = str(self.prompts_dir / PROMPTS_FILE)
+            for path in sorted(files):
+                if path == prompts_path:
+                    prompts = files[path]
+                    continue
+                category = Path(path).parent.name
+                if category in by_category:
+                    by_category[category][Path(path).stem] = files[path]
+
+            version = hashlib.sha1(repr(sorted(stamps.items())).encode()).hexdigest()[:12]
+            new = Snapshot(
+                version=version,
+                explanations=MappingProxyType(by_category["explanations"]),
+                diagnostics=MappingProxyType(by_category["diagnostics"]),
+                anti_patterns=MappingProxyType(by_category["anti_patterns"]),
+                prompts=MappingProxyType(prompts),
+                stamps=MappingProxyType(stamps),
+                files=MappingProxyType(files),
+                changed=frozenset(changed),
+            )
+            if self.build_responses is not None:
+                prebuilt = {key: serialize(payload) for key, payload in self.build_responses(new).items()}
+                new = replace(new, responses=MappingProxyType(prebuilt))
+            self._snapshot = new
+        logger.info("Knowledge snapshot %s loaded (%d changed file(s))", version, len(changed))
+        for listener in self._listeners:
+            try:
+                listener(old, new)
+            except Exception:
+                logger.exception("Knowledge snapshot listener failed")
+        return True
+
+    # ------------------------------------------------------------------
+    # Watcher
+    # ------------------------------------------------------------------
+    def start_watcher(self) -> None:
+        if self._watcher is not None:
+            return
+        self._stop.clear()
+        self._watcher = threading.Thread(target=self._watch, name="knowledge-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watcher(self) -> None:
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=self.poll_interval + 1)
+        self._watcher = None
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.reload()
+            except Exception:
+                logger.exception("Knowledge reload failed")
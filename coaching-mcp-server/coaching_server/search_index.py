@@ -0,0 +1,196 @@
+"""
+Full-text search over coaching knowledge (explanations, diagnostics,
+anti-patterns and prompts).
+
+Scoring is BM25F-style: each document has three fields, and a term's
+frequency is weighted by field (title > why_it_matters > body) before the
+BM25 saturation. For diagnostics the "why" field is when_to_escalate, for
+anti-patterns it is impact, and for prompts it is empty.
+
+The index is keyed by source file. sync(old, new) is registered as a
+KnowledgeRepository swap listener and re-indexes only the files listed in
+new.changed, so updating one YAML file costs one document's postings.
+"""
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Iterator
+
+from coaching_server.knowledge_repo import PROMPTS_FILE, Snapshot
+
+K1 = 1.2
+B = 0.75
+FIELD_WEIGHTS = {"title": 3.0, "why": 2.0, "body": 1.0}
+WHY_FIELDS = {
+    "explanations": "why_it_matters",
+    "diagnostics": "when_to_escalate",
+    "anti_patterns": "impact",
+}
+SNIPPET_CHARS = 160
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from _strings(v)
+    elif isinstance(value, list):
+        for v in value:
+            yield from _strings(v)
+    elif value is not None:
+        yield str(value)
+
+
+def documents_for(path: str, data: Any) -> list[dict[str, Any]]:
+    """Search documents for one knowledge file: {key, type, id, title, why, body}."""
+    p = Path(path)
+    if not isinstance(data, dict):
+        return []
+    if p.name == PROMPTS_FILE:
+        docs = []
+        for category, prompts in (data.get("categories") or {}).items():
+            for prompt in prompts or []:
+                if not isinstance(prompt, dict):
+                    continue
+                pid = str(prompt.get("id") or prompt.get("name", ""))
+                docs.append({
+                    "key": f"prompts/{category}/{pid}",
+                    "type": "prompt",
+                    "id": pid,
+                    "category": category,
+                    "title": str(prompt.get("name", pid)),
+                    "why": "",
+                    "body": str(prompt.get("text", "")),
+                })
+        return docs
+    category = p.parent.name
+    why_field = WHY_FIELDS.get(category, "")
+    why = str(data.get(why_field, "") or "")
+    body = "\n".join(
+        s for k, v in data.items() if k not in ("title", why_field) for s in _strings(v)
+    )
+    return [{
+        "key": f"{category}/{p.stem}",
+        "type": category[:-1],  # explanation / diagnostic / anti_pattern
+        "id": p.stem,
+        "title": str(data.get("title", p.stem)),
+        "why": why,
+        "body": body,
+    }]
+
+
+class SearchIndex:
+    """Incrementally maintained BM25F index."""
+
+    def __init__(self) -> None:
+        self._postings: dict[str, dict[str, float]] = defaultdict(dict)
+        self._doc_terms: dict[str, dict[str, float]] = {}
+        self._doc_len: dict[str, float] = {}
+        self._docs: dict[str, dict[str, Any]] = {}
+        self._by_file: dict[str, list[str]] = {}
+        self._total_len = 0.0
+        self._norms: dict[str, float] | None = None  # BM25 length norms, rebuilt after changes
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    def _remove_doc(self, key: str) -> None:
+        for term in self._doc_terms.pop(key, {}):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[term]
+        self._total_len -= self._doc_len.pop(key, 0.0)
+        self._docs.pop(key, None)
+        self._norms = None
+
+    def _add_doc(self, doc: dict[str, Any]) -> None:
+        key = doc["key"]
+        if key in self._docs:
+            self._remove_doc(key)
+        weighted: Counter[str] = Counter()
+        for fname, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(doc[fname]):
+                weighted[term] += weight
+        for term, wtf in weighted.items():
+            self._postings[term][key] = wtf
+        self._doc_terms[key] = dict(weighted)
+        length = sum(weighted.values())
+        self._doc_len[key] = length
+        self._total_len += length
+        self._docs[key] = doc
+        self._norms = None
+
+    def _length_norms(self) -> dict[str, float]:
+        if self._norms is None:
+            avg_len = self._total_len / len(self._docs) if self._docs else 1.0
+            self._norms = {k: K1 * (1 - B + B * length / avg_len) for k, length in self._doc_len.items()}
+        return self._norms
+
+    def update_file(self, path: str, data: Any | None) -> None:
+        """(Re)index one knowledge file; data=None removes it."""
+        with self._lock:
+            for key in self._by_file.pop(path, []):
+                self._remove_doc(key)
+            if data is None:
+                return
+            docs = documents_for(path, data)
+            for doc in docs:
+                self._add_doc(doc)
+            self._by_file[path] = [d["key"] for d in docs]
+
+    def sync(self, old: Snapshot | None, new: Snapshot) -> None:
+        """Swap listener: re-index only the files that changed between snapshots."""
+        paths = new.changed if old is not None and old.version else new.files.keys()
+        for path in list(paths):
+            self.update_file(path, new.files.get(path))
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+    def search(self, query: str, limit: int = 10, doc_type: str | None = None) -> dict[str, Any]:
+        terms = set(tokenize(query))
+        with self._lock:
+            n = len(self._docs)
+            norms = self._length_norms()
+            scores: dict[str, float] = defaultdict(float)
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf_k = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5)) * (K1 + 1)
+                for key, wtf in postings.items():
+                    scores[key] += idf_k * wtf / (wtf + norms[key])
+            if doc_type:
+                scores = {k: v for k, v in scores.items() if self._docs[k]["type"] == doc_type}
+            top = heapq.nsmallest(max(0, limit), scores, key=lambda k: (-scores[k], k))
+            results = []
+            for key in top:
+                doc = self._docs[key]
+                text = doc["why"] or doc["body"]
+                results.append({
+                    "type": doc["type"],
+                    "id": doc["id"],
+                    **({"category": doc["category"]} if "category" in doc else {}),
+                    "title": doc["title"],
+                    "snippet": " ".join(text.split())[:SNIPPET_CHARS],
+                    "score": round(scores[key], 4),
+                })
+        return {"query": query, "total": len(scores), "results": results}
@@ -3,19 +3,21 @@
 Coaching MCP Server - Teaches WHY, validates against industry standards.
 Runs on port 8001.
 """
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
-import yaml
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from pydantic import BaseModel
 
+from coaching_server.code_analyzer import analyze
+from coaching_server.knowledge_repo import KnowledgeRepository, Snapshot, etag_matches, serialize
+from coaching_server.search_index import SearchIndex
+
 APP_DIR = Path(__file__).resolve().parent.parent
 KNOWLEDGE_DIR = APP_DIR / "knowledge"
 PROMPTS_DIR = APP_DIR / "prompts"
 
-app = FastAPI(title="Coaching MCP Server", version="1.0.0")
-
 # ---------------------------------------------------------------------------
 # Load knowledge
 # ---------------------------------------------------------------------------
@@ -23,99 +25,122 @@ EXPLANATIONS_DIR = KNOWLEDGE_DIR / "explanations"
 DIAGNOSTICS_DIR = KNOWLEDGE_DIR / "diagnostics"
 ANTI_PATTERNS_DIR = KNOWLEDGE_DIR / "anti_patterns"
 
+EXPLAIN_VARIANTS = [
+    (detailed, code, refs) for detailed in (True, False) for code in (True, False) for refs in (True, False)
+]
+
+
+def _explain_payload(topic: str, data: dict, detailed: bool, code: bool, refs: bool) -> dict:
+    response = {
+        "topic": topic,
+        "title": data.get("title", ""),
+        "why_it_matters": data.get("why_it_matters", ""),
+        "detailed_explanation": data.get("detailed_explanation", "") if detailed else "",
+        "common_misconceptions": data.get("common_misconceptions", []),
+        "alternatives": data.get("alternatives", []),
+        "validation_checklist": data.get("validation_checklist", []),
+    }
+    if code:
+        response["wrong_code"] = data.get("wrong_code", "")
+        response["correct_code"] = data.get("correct_code", "")
+    if refs:
+        response["references"] = data.get("references", [])
+    return response
+
 
-def _load_yaml(path: Path) -> dict:
-    if not path.exists():
-        return {}
-    with open(path, encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+def _explain_key(topic: str, detailed: bool, code: bool, refs: bool) -> str:
+    return f"explain:{topic}:{int(detailed)}{int(code)}{int(refs)}"
+
+
+def _build_responses(snap: Snapshot) -> dict[str, Any]:
+    """Every knowledge-backed response body, serialized once per snapshot."""
+    responses: dict[str, Any] = {
+        "explain/topics": {"topics": list(snap.explanations)},
+        "diagnose/symptoms": {"symptoms": list(snap.diagnostics)},
+        "anti-patterns": {"anti_patterns": list(snap.anti_patterns)},
+    }
+    for topic, data in snap.explanations.items():
+        for variant in EXPLAIN_VARIANTS:
+            responses[_explain_key(topic, *variant)] = _explain_payload(topic, data, *variant)
+    for symptom, data in snap.diagnostics.items():
+        responses[f"diagnose:{symptom}"] = data
+    for name, data in snap.anti_patterns.items():
+        responses[f"anti-pattern:{name}"] = data
+    categories = snap.prompts.get("categories", {}) or {}
+    responses["prompts"] = {"categories": list(categories.keys()), "prompts": categories}
+    for category, prompts in categories.items():
+        responses[f"prompts:{category}"] = {"category": category, "prompts": prompts}
+    return responses
+
+
+repository = KnowledgeRepository(KNOWLEDGE_DIR, PROMPTS_DIR, build_responses=_build_responses)
+search_index = SearchIndex()
+search_index.sync(None, repository.snapshot)
+repository.on_swap(search_index.sync)
 
 
 def get_explanation(topic: str) -> dict | None:
-    """Load explanation for topic."""
-    path = EXPLANATIONS_DIR / f"{topic}.yaml"
-    return _load_yaml(path) if path.exists() else None
+    """Explanation for topic (read-only, from the in-memory snapshot)."""
+    return repository.snapshot.explanations.get(topic)
 
 
 def list_explanations() -> list[str]:
     """List available explanation topics."""
-    if not EXPLANATIONS_DIR.exists():
-        return []
-    return [p.stem for p in EXPLANATIONS_DIR.glob("*.yaml")]
+    return list(repository.snapshot.explanations)
 
 
 def get_diagnostic(symptom: str) -> dict | None:
-    """Load diagnostic for symptom."""
-    path = DIAGNOSTICS_DIR / f"{symptom}.yaml"
-    return _load_yaml(path) if path.exists() else None
+    """Diagnostic for symptom (read-only)."""
+    return repository.snapshot.diagnostics.get(symptom)
 
 
 def list_diagnostics() -> list[str]:
     """List available diagnostics."""
-    if not DIAGNOSTICS_DIR.exists():
-        return []
-    return [p.stem for p in DIAGNOSTICS_DIR.glob("*.yaml")]
+    return list(repository.snapshot.diagnostics)
 
 
 def get_anti_pattern(name: str) -> dict | None:
-    """Load anti-pattern."""
-    path = ANTI_PATTERNS_DIR / f"{name}.yaml"
-    return _load_yaml(path) if path.exists() else None
+    """Anti-pattern details (read-only)."""
+    return repository.snapshot.anti_patterns.get(name)
 
 
 def list_anti_patterns() -> list[str]:
     """List available anti-patterns."""
-    if not ANTI_PATTERNS_DIR.exists():
-        return []
-    return [p.stem for p in ANTI_PATTERNS_DIR.glob("*.yaml")]
+    return list(repository.snapshot.anti_patterns)
 
 
 def load_coaching_prompts() -> dict:
-    """Load coaching prompt library."""
-    path = PROMPTS_DIR / "coaching_prompts.yaml"
-    return _load_yaml(path)
+    """Coaching prompt library (read-only)."""
+    return dict(repository.snapshot.prompts)
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    repository.start_watcher()
+    yield
+    repository.stop_watcher()
+
+
+app = FastAPI(title="Coaching MCP Server", version="1.0.0", lifespan=_lifespan)
+
+
+def _cached(request: Request, key: str) -> Response | None:
+    """Pre-serialized response for key, or 304 if the client's ETag still matches."""
+    hit = repository.response(key)
+    if hit is None:
+        return None
+    body, etag = hit
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 # ---------------------------------------------------------------------------
 # Code validation (production readiness)
 # ---------------------------------------------------------------------------
 def validate_code(code: str) -> dict[str, Any]:
-    """Validate code for production readiness. Returns issues and strengths."""
-    issues = []
-    strengths = []
-
-    # Check random_state
-    if "train_test_split" in code and "random_state" not in code:
-        issues.append({"severity": "HIGH", "rule": "random_state", "message": "train_test_split missing random_state"})
-    if "random_state" in code:
-        strengths.append("random_state present for reproducibility")
-
-    # Check Pipeline
-    if ("fit_transform" in code or "fit(" in code) and "Pipeline" not in code and "pipeline" not in code.lower():
-        if "StandardScaler" in code or "SimpleImputer" in code:
-            issues.append({
-                "severity": "CRITICAL",
-                "rule": "pipeline",
-                "message": "Preprocessing outside Pipeline - data leakage risk"
-            })
-    elif "Pipeline" in code or "pipeline" in code:
-        strengths.append("Using Pipeline - reduces leakage risk")
-
-    # Check MLflow / tracking
-    if "mlflow" not in code.lower() and "log_" not in code.lower() and "wandb" not in code.lower():
-        issues.append({
-            "severity": "WARNING",
-            "rule": "experiment_tracking",
-            "message": "No MLflow or experiment tracking detected"
-        })
-    else:
-        strengths.append("Experiment tracking present")
-
-    return {
-        "valid": len([i for i in issues if i["severity"] in ("CRITICAL", "HIGH")]) == 0,
-        "issues": issues,
-        "strengths": strengths,
-    }
+    """Validate code for production readiness. Returns issues (with line/col) and strengths."""
+    return analyze(code)
 
 
 # ---------------------------------------------------------------------------
@@ -144,34 +169,19 @@ class AntiPatternRequest(BaseModel):
 # Endpoints
 # ---------------------------------------------------------------------------
 @app.post("/explain")
-def api_explain(req: ExplainRequest) -> dict:
+def api_explain(req: ExplainRequest, request: Request) -> Response:
     """Get WHY explanation for a topic."""
-    data = get_explanation(req.topic)
-    if not data:
+    key = _explain_key(req.topic, req.depth == "detailed", req.include_code_examples, req.include_references)
+    response = _cached(request, key)
+    if response is None:
         raise HTTPException(404, f"Unknown topic: {req.topic}")
-
-    response = {
-        "topic": req.topic,
-        "title": data.get("title", ""),
-        "why_it_matters": data.get("why_it_matters", ""),
-        "detailed_explanation": data.get("detailed_explanation", "") if req.depth == "detailed" else "",
-        "common_misconceptions": data.get("common_misconceptions", []),
-        "alternatives": data.get("alternatives", []),
-        "validation_checklist": data.get("validation_checklist", []),
-    }
-    if req.include_code_examples:
-        response["wrong_code"] = data.get("wrong_code", "")
-        response["correct_code"] = data.get("correct_code", "")
-    if req.include_references:
-        response["references"] = data.get("references", [])
-
     return response
 
 
 @app.get("/explain/topics")
-def api_list_explain_topics() -> dict:
+def api_list_explain_topics(request: Request) -> Response:
     """List available explanation topics."""
-    return {"topics": list_explanations()}
+    return _cached(request, "explain/topics")
 
 
 @app.post("/validate-code")
@@ -181,48 +191,55 @@ def api_validate_code(req: ValidateCodeRequest) -> dict:
 
 
 @app.post("/diagnose")
-def api_diagnose(req: DiagnosticRequest) -> dict:
+def api_diagnose(req: DiagnosticRequest, request: Request) -> Response:
     """Get diagnostic workflow for a symptom."""
-    data = get_diagnostic(req.symptom)
-    if not data:
+    response = _cached(request, f"diagnose:{req.symptom}")
+    if response is None:
         raise HTTPException(404, f"Unknown symptom: {req.symptom}")
-    return data
+    return response
 
 
 @app.get("/diagnose/symptoms")
-def api_list_diagnose_symptoms() -> dict:
+def api_list_diagnose_symptoms(request: Request) -> Response:
     """List available diagnostic symptoms."""
-    return {"symptoms": list_diagnostics()}
+    return _cached(request, "diagnose/symptoms")
 
 
 @app.post("/anti-pattern")
-def api_anti_pattern(req: AntiPatternRequest) -> dict:
+def api_anti_pattern(req: AntiPatternRequest, request: Request) -> Response:
     """Get anti-pattern details."""
-    data = get_anti_pattern(req.name)
-    if not data:
+    response = _cached(request, f"anti-pattern:{req.name}")
+    if response is None:
         raise HTTPException(404, f"Unknown anti-pattern: {req.name}")
-    return data
+    return response
 
 
 @app.get("/anti-patterns")
-def api_list_anti_patterns() -> dict:
+def api_list_anti_patterns(request: Request) -> Response:
     """List available anti-patterns."""
-    return {"anti_patterns": list_anti_patterns()}
+    return _cached(request, "anti-patterns")
 
 
 @app.get("/prompts")
-def api_get_prompts(category: str | None = None) -> dict:
+def api_get_prompts(request: Request, category: str | None = None) -> Response:
     """Get coaching prompts, optionally filtered by category."""
-    data = load_coaching_prompts()
-    categories = data.get("categories", {})
-    if category:
-        return {"category": category, "prompts": categories.get(category, [])}
-    return {"categories": list(categories.keys()), "prompts": categories}
+    response = _cached(request, f"prompts:{category}" if category else "prompts")
+    if response is None:
+        body, etag = serialize({"category": category, "prompts": []})
+        response = Response(content=body, media_type="application/json", headers={"ETag": etag})
+    return response
+
+
+@app.get("/search")
+def api_search(q: str, limit: int = 10, type: str | None = None) -> dict:
+    """Ranked full-text search across explanations, diagnostics, anti-patterns and prompts."""
+    repository.refresh_if_stale()  # search_index follows swaps; without a watcher nothing else triggers one
+    return search_index.search(q, limit=limit, doc_type=type)
 
 
 @app.get("/health")
 def health() -> dict:
-    return {"status": "ok", "service": "coaching-mcp"}
+    return {"status": "ok", "service": "coaching-mcp", "knowledge_version": repository.snapshot.version}
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,180 @@
+"""Tests for the AST code review."""
+
+import textwrap
+
+from coaching_server.code_analyzer import analyze
+
+
+def _review(code):
+    return analyze(textwrap.dedent(code))
+
+
+def _rules(result, severity=None):
+    return [i["rule"] for i in result["issues"] if severity is None or i["severity"] == severity]
+
+
+class TestFitBeforeSplit:
+    """Leakage: fitting on data that is split afterwards."""
+
+    def test_scaler_fit_on_full_data(self):
+        result = _review("""
+            from sklearn.model_selection import train_test_split
+            X_scaled = scaler.fit_transform(X)
+            X_train, X_test, y_train, y_test = train_test_split(X_scaled, y, random_state=42)
+        """)
+        issue = result["issues"][0]
+        assert (issue["rule"], issue["severity"], issue["line"], issue["col"]) == ("fit_before_split", "CRITICAL", 3, 11)
+        assert result["valid"] is False
+
+    def test_leak_through_a_helper_function(self):
+        result = _review("""
+            def prepare(df):
+                return scaler.fit_transform(df)
+
+            features = prepare(raw)
+            X_train, X_test = train_test_split(features, random_state=0)
+        """)
+        assert "fit_before_split" in _rules(result, "CRITICAL")
+
+    def test_helper_applied_after_the_split_is_fine(self):
+        result = _review("""
+            def prepare(df):
+                return scaler.fit_transform(df)
+
+            X_train, X_test = train_test_split(X, random_state=0)
+            X_train = prepare(X_train)
+        """)
+        assert "fit_before_split" not in _rules(result)
+
+    def test_helper_defined_before_the_split_and_called_after_is_fine(self):
+        result = _review("""
+            from sklearn.model_selection import train_test_split
+
+            def train(X, y):
+                model.fit(X, y)
+                return model
+
+            X_train, X_test, y_train, y_test = train_test_split(X, y, random_state=42)
+            train(X_train, y_train)
+        """)
+        assert "fit_before_split" not in _rules(result)
+        assert "Fitting happens after the train/test split" in result["strengths"]
+
+    def test_helper_called_before_the_split_is_reported_at_the_call(self):
+        result = _review("""
+            def scale(data):
+                scaled = scaler.fit_transform(data)
+                return scaled
+
+            X_scaled = scale(X)
+            X_train, X_test = train_test_split(X_scaled, random_state=0)
+        """)
+        issue = result["issues"][0]
+        assert (issue["rule"], issue["line"]) == ("fit_before_split", 6)
+        assert "via scale()" in issue["message"] and " on X " in issue["message"]
+
+    def test_split_and_fit_inside_one_function(self):
+        result = _review("""
+            def run(df):
+                scaler.fit(df)
+                return train_test_split(df, random_state=0)
+
+            def ok(df):
+                parts = train_test_split(df, random_state=0)
+                scaler.fit(parts[0])
+        """)
+        assert [i["line"] for i in result["issues"] if i["rule"] == "fit_before_split"] == [3]
+
+    def test_label_encoder_is_exempt(self):
+        result = _review("""
+            encoder = LabelEncoder()
+            y_enc = encoder.fit_transform(y)
+            y_other = LabelBinarizer().fit_transform(y)
+            X_train, X_test, y_train, y_test = train_test_split(X, y_enc, random_state=42)
+        """)
+        assert "fit_before_split" not in _rules(result)
+
+    def test_fit_after_split_is_a_strength(self):
+        result = _review("""
+            import mlflow
+            mlflow.sklearn.autolog()
+            X_train, X_test, y_train, y_test = train_test_split(X, y, random_state=42)
+            scaler.fit(X_train)
+            model = RandomForestClassifier(random_state=42).fit(scaler.transform(X_train), y_train)
+        """)
+        assert result["issues"] == []
+        assert result["valid"] is True
+        assert "Fitting happens after the train/test split" in result["strengths"]
+
+
+class TestRandomState:
+    """Seeds for random splits and estimators."""
+
+    def test_kfold_shuffle_without_seed(self):
+        result = _review("""
+            cv = KFold(n_splits=5, shuffle=True)
+            ok = KFold(n_splits=5)
+            seeded = StratifiedKFold(n_splits=5, shuffle=True, random_state=1)
+        """)
+        issues = result["issues"]
+        assert [(i["severity"], i["line"]) for i in issues] == [("HIGH", 2)]
+        assert result["valid"] is False
+
+    def test_random_estimator_without_seed_is_high(self):
+        result = _review("model = RandomForestClassifier(n_estimators=10)\n")
+        assert _rules(result, "HIGH") == ["random_state"]
+
+    def test_deterministic_by_default_estimators_are_info(self):
+        result = _review("""
+            clf = LogisticRegression(max_iter=500)
+            svc = LinearSVC(dual=False)
+            pca = PCA(n_components=2)
+        """)
+        assert [i["severity"] for i in result["issues"]] == ["INFO", "INFO", "INFO"]
+        assert result["valid"] is True
+
+    def test_random_solver_without_seed_is_high(self):
+        result = _review("""
+            clf = LogisticRegression(solver="saga")
+            pca = PCA(n_components=2, svd_solver="randomized")
+        """)
+        assert [i["severity"] for i in result["issues"]] == ["HIGH", "HIGH"]
+        assert result["valid"] is False
+
+
+class TestTracking:
+    """Experiment tracking detection."""
+
+    def test_fit_without_tracking_warns(self):
+        result = _review("model = Ridge()\nmodel.fit(X, y)\n")
+        issue = result["issues"][0]
+        assert (issue["rule"], issue["severity"], issue["line"]) == ("experiment_tracking", "WARNING", 2)
+        assert result["valid"] is True
+
+    def test_mlflow_or_log_calls_count_as_tracking(self):
+        assert _rules(_review("import mlflow\nmlflow.autolog()\nmodel.fit(X, y)\n")) == []
+        assert _rules(_review("model.fit(X, y)\nrun.log_metrics({'acc': 1})\n")) == []
+        assert _rules(_review("with mlflow.start_run():\n    model.fit(X, y)\n")) == []
+        assert "Experiment tracking present" in _review("import wandb\nwandb.log({'acc': 1})\n")["strengths"]
+
+    def test_import_alone_is_not_tracking(self):
+        result = _review("import mlflow\nimport wandb\nmodel.fit(X, y)\n")
+        assert _rules(result) == ["experiment_tracking"]
+        assert "Experiment tracking present" not in result["strengths"]
+
+
+class TestSyntaxError:
+    """Unparseable code reports where parsing failed."""
+
+    def test_line_and_col(self):
+        result = analyze("x = 1\ny = (2,\nz = 3 +\n")
+        issue = result["issues"][0]
+        assert issue["rule"] == "syntax"
+        assert issue["severity"] == "ERROR"
+        assert issue["line"] >= 2
+        assert issue["col"] >= 0
+        assert result["valid"] is False
+
+    def test_exact_position(self):
+        issue = analyze("def f(:\n    pass\n")["issues"][0]
+        assert (issue["line"], issue["col"]) == (1, 6)
@@ -0,0 +1,167 @@
+"""Tests for the in-memory knowledge snapshot and its pre-serialized responses."""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from coaching_server.knowledge_repo import KnowledgeRepository, etag_matches, serialize
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    knowledge, prompts = tmp_path / "knowledge", tmp_path / "prompts"
+    _write(knowledge / "explanations" / "random_state.yaml", "title: Seeds\nwhy_it_matters: reproducibility\n")
+    _write(knowledge / "diagnostics" / "overfitting.yaml", "title: Overfitting\n")
+    _write(prompts / "coaching_prompts.yaml", "categories:\n  learning:\n    - id: a\n      name: A\n")
+    return knowledge, prompts
+
+
+def _repo(dirs, **kwargs):
+    knowledge, prompts = dirs
+    return KnowledgeRepository(knowledge, prompts, poll_interval=0, **kwargs)
+
+
+def _topics(snap):
+    return {"topics": {"topics": list(snap.explanations)}}
+
+
+class TestSnapshot:
+    """Files are parsed into one immutable snapshot, swapped when they change."""
+
+    def test_initial_snapshot(self, dirs):
+        snap = _repo(dirs).snapshot
+        assert snap.explanations["random_state"]["title"] == "Seeds"
+        assert list(snap.diagnostics) == ["overfitting"]
+        assert snap.prompts["categories"]["learning"][0]["id"] == "a"
+        with pytest.raises(TypeError):
+            snap.explanations["new"] = {}
+
+    def test_change_swaps_in_a_new_snapshot(self, dirs):
+        knowledge, _ = dirs
+        repo = _repo(dirs)
+        old = repo.snapshot
+        assert repo.reload() is False
+        _write(knowledge / "explanations" / "pipelines.yaml", "title: Pipelines\n")
+        new = repo.snapshot
+        assert new is not old
+        assert new.version != old.version
+        assert set(new.explanations) == {"random_state", "pipelines"}
+        assert set(old.explanations) == {"random_state"}  # readers holding old are unaffected
+        assert new.changed == {str(knowledge / "explanations" / "pipelines.yaml")}
+        assert new.files[str(knowledge / "diagnostics" / "overfitting.yaml")] is old.files[
+            str(knowledge / "diagnostics" / "overfitting.yaml")
+        ]  # unchanged files are not re-parsed
+
+    def test_deleted_file_is_dropped(self, dirs):
+        knowledge, _ = dirs
+        repo = _repo(dirs)
+        (knowledge / "diagnostics" / "overfitting.yaml").unlink()
+        assert repo.reload() is True
+        assert dict(repo.snapshot.diagnostics) == {}
+
+    def test_bad_yaml_keeps_the_last_good_copy(self, dirs):
+        knowledge, _ = dirs
+        path = knowledge / "explanations" / "random_state.yaml"
+        repo = _repo(dirs)
+        version = repo.snapshot.version
+        path.write_text("title: [unclosed\n")
+        repo.reload()
+        assert repo.snapshot.explanations["random_state"]["title"] == "Seeds"
+        assert repo.snapshot.version == version
+        assert repo.reload() is False  # the bad file is not re-parsed until it changes again
+
+        path.write_text("title: Fixed seeds\n")
+        assert repo.reload() is True
+        assert repo.snapshot.explanations["random_state"]["title"] == "Fixed seeds"
+
+    def test_bad_new_file_is_not_served(self, dirs):
+        knowledge, _ = dirs
+        repo = _repo(dirs)
+        _write(knowledge / "anti_patterns" / "broken.yaml", "a: [\n")
+        repo.reload()
+        assert "broken" not in repo.snapshot.anti_patterns
+
+    def test_listeners_see_old_and_new(self, dirs):
+        knowledge, _ = dirs
+        repo = _repo(dirs)
+        seen = []
+        repo.on_swap(lambda old, new: seen.append((old.version, new.version)))
+        _write(knowledge / "explanations" / "cv.yaml", "title: CV\n")
+        repo.reload()
+        assert len(seen) == 1 and seen[0][0] != seen[0][1]
+
+    def test_refresh_if_stale_honours_the_poll_interval(self, dirs):
+        knowledge, _ = dirs
+        repo = _repo(dirs)
+        seen = []
+        repo.on_swap(lambda old, new: seen.append(new.version))
+        _write(knowledge / "explanations" / "cv.yaml", "title: CV\n")
+        repo.poll_interval = 3600
+        assert repo.refresh_if_stale() is False
+        repo.poll_interval = 0
+        assert repo.refresh_if_stale() is True
+        assert seen == [repo.snapshot.version]
+
+
+class TestResponses:
+    """Pre-serialized bodies and ETags are rebuilt with each snapshot."""
+
+    def test_responses_follow_the_snapshot(self, dirs):
+        knowledge, _ = dirs
+        repo = _repo(dirs, build_responses=_topics)
+        body, etag = repo.response("topics")
+        assert json.loads(body) == {"topics": ["random_state"]}
+        assert (body, etag) == serialize({"topics": ["random_state"]})
+
+        _write(knowledge / "explanations" / "cv.yaml", "title: CV\n")
+        body2, etag2 = repo.response("topics")
+        assert json.loads(body2)["topics"] == ["cv", "random_state"]
+        assert etag2 != etag
+        assert repo.response("missing") is None
+
+
+class TestServerEtags:
+    """The HTTP layer serves the prebuilt bodies and answers If-None-Match with 304."""
+
+    @pytest.fixture
+    def client(self):
+        from coaching_server import server
+
+        return TestClient(server.app)
+
+    def test_etag_and_304(self, client):
+        first = client.get("/explain/topics")
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert "random_state" in first.json()["topics"]
+
+        cached = client.get("/explain/topics", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+        assert cached.content == b""
+        assert client.get("/explain/topics", headers={"If-None-Match": '"stale"'}).status_code == 200
+        listed = f'"stale", W/{etag}'
+        assert client.get("/explain/topics", headers={"If-None-Match": listed}).status_code == 304
+
+    def test_if_none_match_parsing(self):
+        assert etag_matches('"a", "b"', '"b"')
+        assert etag_matches('W/"b"', '"b"')
+        assert etag_matches("*", '"b"')
+        assert not etag_matches('"abc"', '"b"')
+        assert not etag_matches('"xb"', '"b"')  # no substring matches
+        assert not etag_matches(None, '"b"')
+
+    def test_explain_variants_and_unknown_topic(self, client):
+        full = client.post("/explain", json={"topic": "random_state"}).json()
+        brief = client.post("/explain", json={
+            "topic": "random_state", "depth": "brief", "include_code_examples": False,
+        }).json()
+        assert full["detailed_explanation"] and not brief["detailed_explanation"]
+        assert "wrong_code" in full and "wrong_code" not in brief
+        assert client.post("/explain", json={"topic": "nope"}).status_code == 404
@@ -0,0 +1,89 @@
+"""Tests for ranked search over coaching knowledge."""
+
+import pytest
+
+from coaching_server.knowledge_repo import KnowledgeRepository
+from coaching_server.search_index import SearchIndex, documents_for
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    knowledge = tmp_path / "knowledge"
+    _write(knowledge / "explanations" / "random_state.yaml",
+           "title: Reproducibility with random_state\nwhy_it_matters: seeds make runs repeatable\n")
+    _write(knowledge / "explanations" / "pipelines.yaml",
+           "title: Pipelines\nwhy_it_matters: stop leakage\ndetailed_explanation: fit scalers inside a pipeline\n")
+    _write(knowledge / "anti_patterns" / "data_leakage.yaml",
+           "title: Data leakage\nimpact: inflated scores from leakage\n")
+    _write(tmp_path / "prompts" / "coaching_prompts.yaml",
+           "categories:\n  learning:\n    - id: explain_this\n      name: Explain this\n      text: explain leakage\n")
+    return KnowledgeRepository(knowledge, tmp_path / "prompts", poll_interval=0)
+
+
+@pytest.fixture
+def index(repo):
+    idx = SearchIndex()
+    idx.sync(None, repo.snapshot)
+    repo.on_swap(idx.sync)
+    return idx
+
+
+def _ids(found):
+    return [r["id"] for r in found["results"]]
+
+
+class TestSearch:
+    """BM25F ranking with field weights."""
+
+    def test_title_and_why_matches_rank_above_body(self, index):
+        found = index.search("leakage")
+        assert found["total"] == 3
+        assert _ids(found)[0] == "data_leakage"
+        assert _ids(found)[-1] == "explain_this"
+
+    def test_type_filter_and_limit(self, index):
+        assert _ids(index.search("leakage", doc_type="prompt")) == ["explain_this"]
+        assert index.search("leakage", doc_type="prompt")["results"][0]["category"] == "learning"
+        assert len(index.search("leakage", limit=1)["results"]) == 1
+        assert index.search("nothing matches")["total"] == 0
+
+    def test_documents_for_prompts_and_categories(self):
+        docs = documents_for("/k/prompts/coaching_prompts.yaml",
+                             {"categories": {"review": [{"id": "r1", "name": "Review", "text": "check"}, "bad"]}})
+        assert [(d["key"], d["type"]) for d in docs] == [("prompts/review/r1", "prompt")]
+        (doc,) = documents_for("/k/diagnostics/overfitting.yaml", {"title": "Overfit", "when_to_escalate": "soon"})
+        assert (doc["type"], doc["why"]) == ("diagnostic", "soon")
+        assert documents_for("/k/explanations/x.yaml", ["not", "a", "dict"]) == []
+
+
+class TestIncrementalSync:
+    """Snapshot swaps re-index only the changed files."""
+
+    def test_changed_file_is_reindexed(self, repo, index, tmp_path):
+        _write(tmp_path / "knowledge" / "explanations" / "pipelines.yaml", "title: Pipelines\nwhy_it_matters: tidy code\n")
+        repo.reload()
+        assert "pipelines" not in _ids(index.search("leakage"))
+        assert _ids(index.search("tidy")) == ["pipelines"]
+
+    def test_added_and_deleted_files(self, repo, index, tmp_path):
+        _write(tmp_path / "knowledge" / "diagnostics" / "overfitting.yaml", "title: Overfitting\n")
+        repo.reload()
+        assert _ids(index.search("overfitting")) == ["overfitting"]
+        (tmp_path / "knowledge" / "anti_patterns" / "data_leakage.yaml").unlink()
+        repo.reload()
+        assert "data_leakage" not in _ids(index.search("leakage"))
+        assert len(index) == 4
+
+    def test_only_changed_files_are_touched(self, repo, index, tmp_path, monkeypatch):
+        touched = []
+        original = index.update_file
+        monkeypatch.setattr(index, "update_file", lambda path, data: touched.append(path) or original(path, data))
+        path = tmp_path / "knowledge" / "explanations" / "random_state.yaml"
+        _write(path, "title: Seeds\n")
+        repo.reload()
+        assert touched == [str(path)]
@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Synthetic large-scale telemetry for load tests and benchmarks.
+
+Streams realistic MCP telemetry in the same shape the servers write it:
+
+- coaching_log.jsonl            (mcp_server.log_coaching_interaction)
+- violations.jsonl              (week 1 observation-mode events)
+- entropy_log.jsonl             (entropy_tracker.log_entropy)
+- scaffolding_effectiveness.jsonl
+
+Sampling is vectorized per chunk (NumPy when available, stdlib random
+otherwise) and records are written chunk by chunk, so memory stays bounded by
+chunk_size regardless of how many millions of records are generated.
+
+Run: python -m data.telemetry_generator --out-dir /tmp/telemetry --events 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Iterator, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from entropy_tracker import (  # noqa: E402
+    BLOAT_WEIGHT,
+    PREMATURE_WEIGHT,
+    REVERT_WEIGHT,
+    REWORK_WEIGHT,
+)
+
+ROLES = ["Novice", "Intermediate", "Expert", "Champion"]
+ZONES = ["Green", "Yellow", "Red"]
+DEFAULT_ROLE_MIX = {"Novice": 0.45, "Intermediate": 0.35, "Expert": 0.15, "Champion": 0.05}
+DEFAULT_ZONE_MIX = {"Green": 0.45, "Yellow": 0.35, "Red": 0.20}
+ZONE_PATHS = {
+    "Green": ["src/utils/helpers.py", "tests/unit/test_utils.py", "docs/guide.md", "scripts/seed.py"],
+    "Yellow": ["src/api/endpoints.py", "src/services/billing.py", "tests/integration/test_api.py"],
+    "Red": ["src/payment/processor.py", "src/security/auth.py", "migrations/20240115_add_payment.py"],
+}
+COACHING_EVENTS = [
+    "coaching_request", "coaching_provided", "pattern_referenced",
+    "coaching_accepted", "coaching_modified", "coaching_rejected",
+]
+COACHING_EVENT_WEIGHTS = [0.30, 0.25, 0.15, 0.15, 0.10, 0.05]
+DOMAINS = ["payment_processing", "production_database", "api_design", "security"]
+DEFAULT_CHUNK_SIZE = 50_000
+STREAMS = ("coaching_log", "violations", "entropy_log", "scaffolding_effectiveness")
+
+
+class _Sampler:
+    """Batch sampling over NumPy when installed, stdlib random otherwise."""
+
+    def __init__(self, seed: int) -> None:
+        self._np = np.random.default_rng(seed) if np is not None else None
+        self._rand = random.Random(seed)
+
+    def choice(self, options: Sequence[Any], weights: Sequence[float], size: int) -> list[Any]:
+        if self._np is not None:
+            p = np.asarray(weights, dtype=float)
+            idx = self._np.choice(len(options), size=size, p=p / p.sum())
+            return [options[i] for i in idx.tolist()]
+        return self._rand.choices(options, weights=weights, k=size)
+
+    def integers(self, low: int, high: int, size: int) -> list[int]:
+        """Uniform ints in [low, high)."""
+        if self._np is not None:
+            return self._np.integers(low, high, size=size).tolist()
+        return [self._rand.randrange(low, high) for _ in range(size)]
+
+    def uniform(self, low: float, high: float, size: int) -> list[float]:
+        if self._np is not None:
+            return self._np.uniform(low, high, size=size).tolist()
+        return [self._rand.uniform(low, high) for _ in range(size)]
+
+    def sorted_uniform(self, low: float, high: float, size: int) -> list[float]:
+        if self._np is not None:
+            return np.sort(self._np.uniform(low, high, size=size)).tolist()
+        return sorted(self.uniform(low, high, size))
+
+    def bernoulli(self, p: float, size: int) -> list[bool]:
+        if self._np is not None:
+            return (self._np.random(size) < p).tolist()
+        return [self._rand.random() < p for _ in range(size)]
+
+
+class _Team:
+    """Fixed developer roster: each developer keeps one role for the whole span."""
+
+    def __init__(self, size: int, role_mix: dict[str, float], sampler: _Sampler) -> None:
+        roles = list(role_mix)
+        self.developers = [f"dev_{i:04d}" for i in range(size)]
+        self.roles = sampler.choice(roles, [role_mix[r] for r in roles], size)
+
+    def draw(self, sampler: _Sampler, size: int) -> tuple[list[str], list[str]]:
+        idx = sampler.integers(0, len(self.developers), size)
+        return [self.developers[i] for i in idx], [self.roles[i] for i in idx]
+
+
+def _chunk_bounds(total: int, chunk_size: int) -> Iterator[tuple[int, int]]:
+    for start in range(0, total, chunk_size):
+        yield start, min(chunk_size, total - start)
+
+
+def _timestamps(sampler: _Sampler, start: datetime, span_s: float, total: int, offset: int, size: int) -> list[str]:
+    """Monotonic timestamps: each chunk covers its proportional slice of the span."""
+    lo = span_s * offset / total
+    hi = span_s * (offset + size) / total
+    return [(start + timedelta(seconds=s)).isoformat() for s in sampler.sorted_uniform(lo, hi, size)]
+
+
+def iter_violations(
+    total: int,
+    team: _Team,
+    sampler: _Sampler,
+    start: datetime,
+    span_s: float,
+    zone_mix: dict[str, float],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield chunks of violations.jsonl records."""
+    zones = list(zone_mix)
+    for offset, size in _chunk_bounds(total, chunk_size):
+        ts = _timestamps(sampler, start, span_s, total, offset, size)
+        devs, roles = team.draw(sampler, size)
+        zone_col = sampler.choice(zones, [zone_mix[z] for z in zones], size)
+        complexity = sampler.choice([3, 4, 5, 6, 7, 8, 10, 12, 15],
+                                    [0.1, 0.15, 0.25, 0.2, 0.1, 0.08, 0.06, 0.04, 0.02], size)
+        touches = sampler.choice([1, 2, 3, 4, 5], [0.6, 0.25, 0.08, 0.05, 0.02], size)
+        bloat = sampler.bernoulli(0.12, size)
+        path_idx = sampler.integers(0, 12, size)
+        yield [
+            {
+                "timestamp": t,
+                "zone": z,
+                "user_role": r,
+                "developer": d,
+                "complexity_score": c,
+                "allowed": z == "Green",
+                "file_path": ZONE_PATHS[z][p % len(ZONE_PATHS[z])],
+                "enforced": False,
+                "touch_count": tc,
+                "has_bloat": b and z == "Green",
+            }
+            for t, z, r, d, c, tc, b, p in zip(ts, zone_col, roles, devs, complexity, touches, bloat, path_idx)
+        ]
+
+
+def iter_scaffolding(
+    total: int,
+    team: _Team,
+    sampler: _Sampler,
+    start: datetime,
+    span_s: float,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield chunks of scaffolding_effectiveness.jsonl records."""
+    for offset, size in _chunk_bounds(total, chunk_size):
+        ts = _timestamps(sampler, start, span_s, total, offset, size)
+        devs, roles = team.draw(sampler, size)
+        tta = sampler.choice([2, 4, 8, 15, 25, 45, 90], [0.25, 0.15, 0.15, 0.15, 0.12, 0.12, 0.06], size)
+        lines = sampler.integers(3, 26, size)
+        modified = sampler.bernoulli(0.35, size)
+        reverted = sampler.bernoulli(0.08, size)
+        yield [
+            {
+                "timestamp": t,
+                "user_role": r,
+                "developer": d,
+                "time_to_accept": a,
+                "lines_explained": n,
+                "modification_required": m,
+                "was_reverted": rv,
+            }
+            for t, r, d, a, n, m, rv in zip(ts, roles, devs, tta, lines, modified, reverted)
+        ]
+
+
+def _maturity(score: float) -> str:
+    if score >= 70:
+        return "M1"
+    if score >= 50:
+        return "M2"
+    if score >= 30:
+        return "M3"
+    return "M4"
+
+
+def iter_entropy(
+    total: int,
+    sampler: _Sampler,
+    start: datetime,
+    span_s: float,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield chunks of entropy_log.jsonl records (one per commit)."""
+    for offset, size in _chunk_bounds(total, chunk_size):
+        ts = _timestamps(sampler, start, span_s, total, offset, size)
+        bloat = sampler.uniform(0, 30, size)
+        rework = sampler.uniform(5, 45, size)
+        reverts = sampler.uniform(0, 20, size)
+        premature = sampler.uniform(5, 50, size)
+        hashes = sampler.integers(0, 2**40, size)
+        chunk = []
+        for t, b, rw, rv, p, h in zip(ts, bloat, rework, reverts, premature, hashes):
+            score = round(b * BLOAT_WEIGHT + rw * REWORK_WEIGHT + rv * REVERT_WEIGHT + p * PREMATURE_WEIGHT, 2)
+            chunk.append({
+                "timestamp": t + "Z",
+                "commit_hash": f"{h:010x}",
+                "metrics": {"bloat": round(b, 2), "rework": round(rw, 2), "reverts": round(rv, 2), "premature": round(p, 2)},
+                "score": score,
+                "maturity": _maturity(score),
+            })
+        yield chunk
+
+
+def iter_coaching(
+    total: int,
+    team: _Team,
+    sampler: _Sampler,
+    start: datetime,
+    span_s: float,
+    zone_mix: dict[str, float],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield chunks of coaching_log.jsonl records."""
+    zones = list(zone_mix)
+    sessions_per_dev = 20
+    for offset, size in _chunk_bounds(total, chunk_size):
+        ts = _timestamps(sampler, start, span_s, total, offset, size)
+        devs, roles = team.draw(sampler, size)
+        events = sampler.choice(COACHING_EVENTS, COACHING_EVENT_WEIGHTS, size)
+        zone_col = sampler.choice(zones, [zone_mix[z] for z in zones], size)
+        session_idx = sampler.integers(0, sessions_per_dev, size)
+        domains = sampler.choice(DOMAINS, [1] * len(DOMAINS), size)
+        lines = sampler.integers(0, 80, size)
+        mentor = sampler.bernoulli(0.2, size)
+        chunk = []
+        for t, dev, role, ev, z, s, dom, n, m in zip(ts, devs, roles, events, zone_col, session_idx, domains, lines, mentor):
+            data: dict[str, Any] = {"zone": z, "developer_role": role.lower()}
+            if ev == "coaching_request":
+                data["file_path"] = ZONE_PATHS[z][0]
+            elif ev == "coaching_provided":
+                data.update({"file_path": ZONE_PATHS[z][0], "code_generated": n > 0, "lines_generated": n})
+            elif ev == "pattern_referenced":
+                data.update({"domain": dom, "pattern": dom, "pattern_zone": z})
+            else:
+                data.update({"outcome": ev.split("_", 1)[1], "mentor_consulted": m})
+            chunk.append({
+                "timestamp": t + "Z",
+                "event_type": ev,
+                "session_id": f"{dev}-{s:02d}",
+                "governance_context": {"role": role.lower(), "mentor": None, "repo_path": "."},
+                "data": data,
+            })
+        yield chunk
+
+
+def write_jsonl(path: Path, chunks: Iterator[list[dict[str, Any]]]) -> int:
+    """Write chunked records to a JSONL file. Returns number of records written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for chunk in chunks:
+            f.write("".join(json.dumps(rec) + "\n" for rec in chunk))
+            written += len(chunk)
+    return written
+
+
+def generate_telemetry(
+    out_dir: str | Path,
+    counts: dict[str, int],
+    team_size: int = 50,
+    role_mix: dict[str, float] | None = None,
+    zone_mix: dict[str, float] | None = None,
+    days: int = 30,
+    end: datetime | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    seed: int = 42,
+) -> dict[str, int]:
+    """
+    Write the requested telemetry streams into out_dir.
+    counts maps stream name (coaching_log, violations, entropy_log,
+    scaffolding_effectiveness) to record count; missing streams are skipped.
+    """
+    out = Path(out_dir)
+    sampler = _Sampler(seed)
+    role_mix = role_mix or DEFAULT_ROLE_MIX
+    zone_mix = zone_mix or DEFAULT_ZONE_MIX
+    team = _Team(max(1, team_size), role_mix, sampler)
+    span_s = days * 86400.0
+    start = (end or datetime.utcnow()) - timedelta(days=days)
+
+    written: dict[str, int] = {}
+    if counts.get("violations"):
+        written["violations"] = write_jsonl(
+            out / "violations.jsonl",
+            iter_violations(counts["violations"], team, sampler, start, span_s, zone_mix, chunk_size),
+        )
+    if counts.get("scaffolding_effectiveness"):
+        written["scaffolding_effectiveness"] = write_jsonl(
+            out / "scaffolding_effectiveness.jsonl",
+            iter_scaffolding(counts["scaffolding_effectiveness"], team, sampler, start, span_s, chunk_size),
+        )
+    if counts.get("entropy_log"):
+        written["entropy_log"] = write_jsonl(
+            out / "entropy_log.jsonl",
+            iter_entropy(counts["entropy_log"], sampler, start, span_s, chunk_size),
+        )
+    if counts.get("coaching_log"):
+        written["coaching_log"] = write_jsonl(
+            out / "coaching_log.jsonl",
+            iter_coaching(counts["coaching_log"], team, sampler, start, span_s, zone_mix, chunk_size),
+        )
+    return written
+
+
+def _parse_mix(valid: list[str]) -> Callable[[str], dict[str, float] | None]:
+    """argparse type= that parses 'Novice=0.5,Expert=0.5' into a weight dict over valid names."""
+    def parse(text: str) -> dict[str, float] | None:
+        if not text:
+            return None
+        mix: dict[str, float] = {}
+        for part in text.split(","):
+            name, _, weight = part.partition("=")
+            name = name.strip().capitalize()
+            if name not in valid:
+                raise argparse.ArgumentTypeError(f"Unknown value '{name}', expected one of {valid}")
+            try:
+                mix[name] = float(weight)
+            except ValueError:
+                raise argparse.ArgumentTypeError(f"Weight for '{name}' is not a number: '{weight}'") from None
+        return mix
+
+    return parse
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate synthetic governance telemetry")
+    parser.add_argument("--out-dir", type=Path, required=True)
+    parser.add_argument("--events", type=int, default=1_000_000, help="Default record count per stream")
+    for stream in STREAMS:
+        parser.add_argument(f"--{stream.replace('_', '-')}", type=int, default=None,
+                            help=f"Record count for {stream}.jsonl (default: --events)")
+    parser.add_argument("--team-size", type=int, default=50)
+    parser.add_argument("--role-mix", type=_parse_mix(ROLES), help="e.g. Novice=0.5,Intermediate=0.3,Expert=0.15,Champion=0.05")
+    parser.add_argument("--zone-mix", type=_parse_mix(ZONES), help="e.g. Green=0.5,Yellow=0.3,Red=0.2")
+    parser.add_argument("--days", type=int, default=30, help="Time span covered by the records")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    counts = {}
+    for stream in STREAMS:
+        value = getattr(args, stream)
+        counts[stream] = args.events if value is None else value
+    written = generate_telemetry(
+        args.out_dir,
+        counts,
+        team_size=args.team_size,
+        role_mix=args.role_mix,
+        zone_mix=args.zone_mix,
+        days=args.days,
+        chunk_size=args.chunk_size,
+        seed=args.seed,
+    )
+    for stream, n in written.items():
+        print(f"{stream}.jsonl: {n} records")
+    print(f"Backend: {'numpy' if np is not None else 'stdlib random'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+"""
+Week 1 calibration data source.
+Reads the real MCP telemetry (.ai-governance/violations.jsonl and
+scaffolding_effectiveness.jsonl) when present and falls back to the demo
+fixtures in week1_fake_data otherwise.
+
+source_versions() returns a cheap fingerprint (stat only) so callers such as
+the Streamlit page can cache parsed data and metrics per data version.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from data.week1_fake_data import generate_scaffolding, generate_violations
+
+logger = logging.getLogger(__name__)
+
+VIOLATIONS_FILE = "violations.jsonl"
+SCAFFOLDING_FILE = "scaffolding_effectiveness.jsonl"
+
+
+def source_versions(gov_dir: str | Path) -> tuple[tuple[str, int, int] | None, ...]:
+    """(name, mtime_ns, size) per telemetry file, None when the file is missing."""
+    versions = []
+    for name in (VIOLATIONS_FILE, SCAFFOLDING_FILE):
+        try:
+            st = (Path(gov_dir) / name).stat()
+            versions.append((name, st.st_mtime_ns, st.st_size))
+        except OSError:
+            versions.append(None)
+    return tuple(versions)
+
+
+def _read_jsonl(path: Path) -> list[dict[str, Any]]:
+    entries: list[dict[str, Any]] = []
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    except OSError as e:
+        logger.warning("Could not read %s: %s", path, e)
+    return entries
+
+
+def load_week1_records(gov_dir: str | Path) -> tuple[list[dict[str, Any]], list[dict[str, Any]], str]:
+    """
+    Load violations and scaffolding records.
+    Returns (violations, scaffolding, source) where source is "telemetry",
+    "demo", or "mixed" when only one of the two files exists.
+    """
+    gov = Path(gov_dir)
+    violations_path = gov / VIOLATIONS_FILE
+    scaffolding_path = gov / SCAFFOLDING_FILE
+
+    if violations_path.exists():
+        # ADR / champion decision records share violations.jsonl; they are not edit attempts
+        violations = [e for e in _read_jsonl(violations_path) if "adr_id" not in e]
+    else:
+        violations = []
+    scaffolding = _read_jsonl(scaffolding_path) if scaffolding_path.exists() else []
+
+    real = (bool(violations), bool(scaffolding))
+    if not violations:
+        violations = generate_violations()
+    if not scaffolding:
+        scaffolding = generate_scaffolding()
+    source = "telemetry" if all(real) else "mixed" if any(real) else "demo"
+    return violations, scaffolding, source
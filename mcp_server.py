@@ -31,6 +31,7 @@ import json
 import logging
 import os
 import re
+import sqlite3
 import subprocess
 import sys
 import uuid
@@ -45,7 +46,13 @@ from mcp import types
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 
+import quiz_store
+from audit_chain import ChainedLog, verify_log
 from entropy_tracker import (
+    BLOAT_WEIGHT,
+    PREMATURE_WEIGHT,
+    REVERT_WEIGHT,
+    REWORK_WEIGHT,
     calculate_entropy,
     get_current_average,
     get_maturity_level,
@@ -70,11 +77,12 @@ GOV_DIR = REPO_PATH / ".ai-governance"
 ENTROPY_LOG = GOV_DIR / "entropy_log.jsonl"
 VIOLATIONS_LOG = GOV_DIR / "violations.jsonl"
 COACHING_LOG = GOV_DIR / "coaching_log.jsonl"
-QUIZ_RESULTS_PATH = GOV_DIR / "quiz_results.json"
+SCAFFOLDING_LOG = GOV_DIR / "scaffolding_effectiveness.jsonl"
 TRIBAL_KNOWLEDGE_DIR = GOV_DIR / "tribal-knowledge"
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
 GOVERNANCE_ROLE = os.environ.get("GOVERNANCE_ROLE", "novice")
 GOVERNANCE_MENTOR = os.environ.get("GOVERNANCE_MENTOR", "")
+GOVERNANCE_DEVELOPER = quiz_store.default_developer()
 
 # Log to stderr (stdio transport uses stdin/stdout for MCP protocol)
 logging.basicConfig(
@@ -112,15 +120,12 @@ def _normalize_role(role: str) -> str:
     return {"novice": "Novice", "intermediate": "Intermediate", "expert": "Expert", "champion": "Champion"}.get(r, role.strip().capitalize())
 
 
-def _quiz_passed() -> bool:
-    """Check if novice has passed the governance quiz (unlocks YELLOW zone)."""
-    if not QUIZ_RESULTS_PATH.exists():
-        return False
+def _quiz_passed(developer: str | None = None) -> bool:
+    """Check if the developer has passed a governance quiz that unlocks YELLOW zone (False if unreadable)."""
     try:
-        with open(QUIZ_RESULTS_PATH, encoding="utf-8") as f:
-            data = json.load(f)
-        return data.get("v1", {}).get("passed", False)
-    except (json.JSONDecodeError, OSError):
+        return "yellow" in quiz_store.for_governance_dir(GOV_DIR).unlocked_zones_cached(developer or GOVERNANCE_DEVELOPER)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Could not read quiz results: %s", e)
         return False
 
 
@@ -539,10 +544,10 @@ async def _calculate_entropy(args: dict[str, Any]) -> dict[str, Any]:
         "trend": trend,
         "logged": logged,
         "formula_breakdown": {
-            "bloat_contribution": round(bloat * 0.25, 2),
-            "rework_contribution": round(rework * 0.25, 2),
-            "reverts_contribution": round(revert * 0.20, 2),
-            "premature_contribution": round(premature * 0.30, 2),
+            "bloat_contribution": round(bloat * BLOAT_WEIGHT, 2),
+            "rework_contribution": round(rework * REWORK_WEIGHT, 2),
+            "reverts_contribution": round(revert * REVERT_WEIGHT, 2),
+            "premature_contribution": round(premature * PREMATURE_WEIGHT, 2),
         },
     }
 
@@ -599,12 +604,22 @@ async def _validate_code_patterns(args: dict[str, Any]) -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 # Tool 5: record_decision
 # ---------------------------------------------------------------------------
+_chained_logs: dict[Path, ChainedLog] = {}
+
+
+def _chained_log(path: Path) -> ChainedLog:
+    """One ChainedLog writer per file (keeps the chain head in memory)."""
+    log = _chained_logs.get(path)
+    if log is None:
+        log = _chained_logs[path] = ChainedLog(path)
+    return log
+
+
 def _log_violation(entry: dict[str, Any]) -> bool:
-    """Append to violations.jsonl."""
+    """Append to violations.jsonl (hash-chained; see audit_chain)."""
     _ensure_gov_dir()
     try:
-        with open(VIOLATIONS_LOG, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
+        _chained_log(VIOLATIONS_LOG).append(entry)
         return True
     except OSError as e:
         logger.error("Failed to log violation: %s", e)
@@ -694,6 +709,36 @@ async def _calculate_architectural_drift(args: dict[str, Any]) -> dict[str, Any]
     return calculate_architectural_drift(repo_path=repo_path, days=days)
 
 
+# ---------------------------------------------------------------------------
+# Tool: calibrate_from_telemetry
+# ---------------------------------------------------------------------------
+async def _calibrate_from_telemetry(args: dict[str, Any]) -> dict[str, Any]:
+    """Derive calculate_entropy inputs from violations + scaffolding telemetry."""
+    from calibration_metrics import calibrate, load_jsonl_frame
+
+    violations_path = Path(args.get("violations_path") or VIOLATIONS_LOG)
+    scaffolding_path = Path(args.get("scaffolding_path") or SCAFFOLDING_LOG)
+    violations = load_jsonl_frame(violations_path, skip_adr=True)
+    scaffolding = load_jsonl_frame(scaffolding_path)
+    result = calibrate(violations, scaffolding)
+    result["sources"] = {
+        "violations": str(violations_path) if violations_path.exists() else None,
+        "scaffolding": str(scaffolding_path) if scaffolding_path.exists() else None,
+    }
+    if args.get("log_entropy"):
+        result["calculate_entropy"] = await _calculate_entropy(dict(result["entropy_inputs"]))
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Tool: verify_audit
+# ---------------------------------------------------------------------------
+async def _verify_audit(args: dict[str, Any]) -> dict[str, Any]:
+    """Verify the violations.jsonl hash chain (tail since last checkpoint unless full)."""
+    path = Path(args.get("path") or VIOLATIONS_LOG)
+    return verify_log(path, full=bool(args.get("full", False)))
+
+
 # ---------------------------------------------------------------------------
 # Tool: get_coaching_analytics
 # ---------------------------------------------------------------------------
@@ -940,6 +985,29 @@ TOOL_DEFS = [
             },
         },
     ),
+    types.Tool(
+        name="calibrate_from_telemetry",
+        description="Compute bloat, rework, revert and premature-acceptance percentages (calculate_entropy inputs) from violations.jsonl and scaffolding_effectiveness.jsonl, with per-role and per-zone breakdowns.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "violations_path": {"type": "string", "description": "Default: .ai-governance/violations.jsonl"},
+                "scaffolding_path": {"type": "string", "description": "Default: .ai-governance/scaffolding_effectiveness.jsonl"},
+                "log_entropy": {"type": "boolean", "description": "Also run calculate_entropy with the derived inputs and log the score"},
+            },
+        },
+    ),
+    types.Tool(
+        name="verify_audit",
+        description="Verify the tamper-evident hash chain of violations.jsonl (ADR and violation records). Checks only records since the last checkpoint unless full=true.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {"type": "string", "description": "Default: .ai-governance/violations.jsonl"},
+                "full": {"type": "boolean", "description": "Re-verify the whole log and every checkpoint"},
+            },
+        },
+    ),
     types.Tool(
         name="get_coaching_analytics",
         description="Get coaching interaction analytics: acceptance rate, patterns used, outcomes by role/zone, and tuning insights.",
@@ -1030,6 +1098,8 @@ TOOL_HANDLERS = {
     "get_ai_context": _get_ai_context,
     "calculate_architectural_drift": _calculate_architectural_drift,
     "get_coaching_analytics": _get_coaching_analytics,
+    "calibrate_from_telemetry": _calibrate_from_telemetry,
+    "verify_audit": _verify_audit,
 }
 
 
@@ -1,30 +1,42 @@
 """Experiment Tracker - GREEN zone experiment management."""
+import os
 import streamlit as st
-import json
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from mcp.client import ServerUnavailable, get_client
+from mcp.experiment_registry import ExperimentRegistry, init_experiment
+
 APP_DIR = Path(__file__).resolve().parent.parent
 EXPERIMENTS_DIR = APP_DIR / "experiments"
+EXPERIMENT_DB = Path(os.environ.get("MY_ML_EXPERIMENT_DB", str(APP_DIR / "experiments.db")))
+PAGE_SIZE = 25
+
+
+@st.cache_resource
+def _registry() -> ExperimentRegistry:
+    return ExperimentRegistry(EXPERIMENT_DB)
+
 
 st.title("🟢 Experiment Tracker")
 st.caption("GREEN zone experiment management")
 
-# List experiments
-if EXPERIMENTS_DIR.exists():
-    experiments = [d.name for d in EXPERIMENTS_DIR.iterdir() if d.is_dir()]
-else:
-    experiments = []
-    EXPERIMENTS_DIR.mkdir(parents=True, exist_ok=True)
+EXPERIMENTS_DIR.mkdir(parents=True, exist_ok=True)
+registry = _registry()
+registry.sync(EXPERIMENTS_DIR)
 
 st.subheader("Your Experiments")
-if experiments:
-    for exp in experiments:
-        manifest_path = EXPERIMENTS_DIR / exp / "manifest.json"
-        if manifest_path.exists():
-            data = json.loads(manifest_path.read_text())
-            st.write(f"- **{data.get('name', exp)}** — {data.get('description', '')}")
-        else:
-            st.write(f"- {exp}")
+name_filter = st.text_input("Filter by name", placeholder="e.g. iris")
+total = registry.count(name=name_filter or None)
+if total:
+    pages = (total + PAGE_SIZE - 1) // PAGE_SIZE
+    page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1) if pages > 1 else 1
+    for data in registry.page(offset=(page - 1) * PAGE_SIZE, limit=PAGE_SIZE, name=name_filter or None):
+        st.write(f"- **{data.get('name', data['slug'])}** — {data.get('description', '')}")
+    st.caption(f"{total} experiment(s)")
+elif name_filter:
+    st.info("No experiments match that name.")
 else:
     st.info("No experiments yet. Create one below.")
 
@@ -35,23 +47,12 @@ with st.form("create_experiment"):
     if st.form_submit_button("Create"):
         if name:
             try:
-                import requests
-                r = requests.post("http://localhost:8000/init-experiment", json={"name": name, "description": desc})
-                if r.ok:
-                    st.success(f"Created: {r.json().get('path', '')}")
-                    st.rerun()
-                else:
-                    raise ConnectionError("Server error")
-            except Exception:
+                result = get_client().post("/init-experiment", {"name": name, "description": desc})
+                st.success(f"Created: {result.get('path', '')}")
+                st.rerun()
+            except ServerUnavailable:
                 # Fallback: create locally without MCP server
-                import json
-                from datetime import datetime
-                exp_dir = EXPERIMENTS_DIR / name.replace(" ", "_").lower()
-                exp_dir.mkdir(parents=True, exist_ok=True)
-                manifest = {"name": name, "description": desc, "zone": "green", "created": datetime.now().isoformat()}
-                (exp_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
-                nb = {"cells": [], "metadata": {}, "nbformat": 4, "nbformat_minor": 4}
-                (exp_dir / "notebook.ipynb").write_text(json.dumps(nb))
+                exp_dir, _ = init_experiment(registry, EXPERIMENTS_DIR, name, desc)
                 st.success(f"Created: {exp_dir}")
                 st.rerun()
         else:
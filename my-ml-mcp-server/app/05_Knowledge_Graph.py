@@ -1,8 +1,12 @@
 """Knowledge Graph - Personal ML knowledge exploration."""
 import streamlit as st
 import json
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from mcp.client import ServerUnavailable, get_client
+
 APP_DIR = Path(__file__).resolve().parent.parent
 KG_PATH = APP_DIR / "knowledge_graph" / "experiments.json"
 
@@ -25,16 +29,11 @@ else:
 
 st.divider()
 st.subheader("Query (when MCP server is running)")
-query = st.text_input("Search experiments", placeholder="e.g. iris, accuracy")
+query = st.text_input("Search experiments", placeholder="e.g. random forest dataset:iris metric>0.9")
 if query:
     try:
-        import requests
-        r = requests.post("http://localhost:8000/query-knowledge-graph", json={"query": query})
-        if r.ok:
-            results = r.json().get("results", [])
-            for r in results:
-                st.write(r)
-        else:
-            st.warning("MCP server not running on port 8000")
-    except Exception as e:
+        results = get_client().post("/query-knowledge-graph", {"query": query}).get("results", [])
+        for item in results:
+            st.write(item)
+    except ServerUnavailable as e:
         st.warning(f"Could not query: {e}")
@@ -0,0 +1,145 @@
+"""
+HTTP client for the local MCP server, shared by the Streamlit pages.
+
+- One pooled requests.Session (keep-alive) per process instead of a new
+  connection per interaction.
+- Short connect timeout so a stopped server fails fast; pages then use
+  their local fallback.
+- Circuit breaker: after `failure_threshold` consecutive connection
+  failures the server is skipped for `cooldown` seconds.
+- TTL cache for idempotent GETs such as /prompts/{zone}.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+MCP_SERVER_URL = os.environ.get("MY_ML_MCP_URL", "http://localhost:8000")
+CONNECT_TIMEOUT = 0.5
+READ_TIMEOUT = 5.0
+FAILURE_THRESHOLD = 2
+COOLDOWN_SECONDS = 30.0
+GET_CACHE_TTL = 60.0
+
+
+class ServerUnavailable(Exception):
+    """MCP server unreachable, erroring, or skipped by the circuit breaker."""
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures; allows a trial request once cooldown passes."""
+
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD, cooldown: float = COOLDOWN_SECONDS) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            return time.monotonic() - self._opened_at >= self.cooldown
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+    @property
+    def open(self) -> bool:
+        return not self.allow()
+
+
+class MCPClient:
+    """Pooled, fail-fast client for the Personal ML MCP server."""
+
+    def __init__(
+        self,
+        base_url: str = MCP_SERVER_URL,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        read_timeout: float = READ_TIMEOUT,
+        breaker: CircuitBreaker | None = None,
+        cache_ttl: float = GET_CACHE_TTL,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = (connect_timeout, read_timeout)
+        self.breaker = breaker or CircuitBreaker()
+        self.cache_ttl = cache_ttl
+        self._cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._cache_lock = threading.Lock()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=10, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> dict[str, Any]:
+        if not self.breaker.allow():
+            raise ServerUnavailable(f"MCP server skipped for up to {self.breaker.cooldown:.0f}s after failures")
+        try:
+            r = self.session.request(method, f"{self.base_url}{path}", timeout=self.timeout, **kwargs)
+        except requests.RequestException as e:
+            self.breaker.record_failure()
+            raise ServerUnavailable(f"MCP server not reachable at {self.base_url}: {e}") from e
+        if r.status_code >= 500:
+            self.breaker.record_failure()
+            raise ServerUnavailable(f"MCP server error {r.status_code} on {path}")
+        self.breaker.record_success()
+        if not r.ok:
+            raise ServerUnavailable(f"MCP server rejected {path}: {r.status_code} {r.text[:200]}")
+        try:
+            return r.json()
+        except ValueError as e:
+            raise ServerUnavailable(f"MCP server returned non-JSON for {path}") from e
+
+    def get(self, path: str, ttl: float | None = None) -> dict[str, Any]:
+        """GET with TTL caching (ttl=0 bypasses the cache)."""
+        ttl = self.cache_ttl if ttl is None else ttl
+        now = time.monotonic()
+        if ttl > 0:
+            with self._cache_lock:
+                hit = self._cache.get(path)
+            if hit and hit[0] > now:
+                return hit[1]
+        data = self._request("GET", path)
+        if ttl > 0:
+            with self._cache_lock:
+                self._cache[path] = (now + ttl, data)
+        return data
+
+    def post(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
+        return self._request("POST", path, json=payload)
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+
+    @property
+    def available(self) -> bool:
+        """False while the circuit breaker is skipping the server."""
+        return self.breaker.allow()
+
+
+_client: MCPClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> MCPClient:
+    """Process-wide shared client (Streamlit reruns reuse its connection pool)."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = MCPClient()
+        return _client
@@ -0,0 +1,175 @@
+"""
+Experiment registry: one SQLite catalog of experiment manifests.
+
+/init-experiment writes experiments/<slug>/manifest.json as before and also
+upserts the manifest here, with name, created and zone indexed. The tracker
+lists experiments a page at a time from the catalog instead of opening every
+manifest on each render.
+
+sync() picks up experiment directories created outside the server (manual
+copies, older checkouts). It only runs when the experiments/ directory's
+mtime changes and parses manifests for directories not yet registered.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+MAX_PAGE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS experiments (
+    slug TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    zone TEXT,
+    created TEXT,
+    path TEXT,
+    manifest TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_experiments_name ON experiments(name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_experiments_created ON experiments(created);
+CREATE INDEX IF NOT EXISTS idx_experiments_zone ON experiments(zone, created);
+"""
+
+
+def experiment_slug(name: str) -> str:
+    return name.replace(" ", "_").lower()
+
+
+class ExperimentRegistry:
+    """Indexed catalog of experiment manifests."""
+
+    def __init__(self, db_path: str | Path) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=10)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _upsert(conn: sqlite3.Connection, slug: str, manifest: dict[str, Any], path: str) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO experiments VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                slug,
+                str(manifest.get("name", slug)),
+                manifest.get("description", ""),
+                str(manifest.get("zone", "green")).lower(),
+                manifest.get("created"),
+                path,
+                json.dumps(manifest),
+            ),
+        )
+
+    def register(self, slug: str, manifest: dict[str, Any], path: str | Path) -> None:
+        with closing(self._connect()) as conn, conn:
+            self._upsert(conn, slug, manifest, str(path))
+
+    def sync(self, experiments_dir: str | Path, force: bool = False) -> int:
+        """Register new experiment directories and drop deleted ones; returns how many were added."""
+        experiments_dir = Path(experiments_dir)
+        try:
+            stamp = str(experiments_dir.stat().st_mtime_ns)
+        except OSError:
+            return 0
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'dir_mtime'").fetchone()
+            if row and row[0] == stamp and not force:
+                return 0
+            known = {r[0] for r in conn.execute("SELECT slug FROM experiments")}
+            added = 0
+            present: set[str] = set()
+            with os.scandir(experiments_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    present.add(entry.name)
+                    if entry.name in known:
+                        continue
+                    manifest_path = Path(entry.path) / "manifest.json"
+                    try:
+                        manifest = json.loads(manifest_path.read_text())
+                    except (OSError, json.JSONDecodeError):
+                        manifest = {"name": entry.name}
+                    self._upsert(conn, entry.name, manifest, entry.path)
+                    added += 1
+            conn.executemany("DELETE FROM experiments WHERE slug = ?", [(slug,) for slug in known - present])
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('dir_mtime', ?)", (stamp,))
+        return added
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _where(zone: str | None, name: str | None) -> tuple[str, list[Any]]:
+        clauses, params = [], []
+        if zone:
+            clauses.append("zone = ?")
+            params.append(zone.lower())
+        if name:
+            clauses.append("name LIKE ? COLLATE NOCASE")
+            params.append(f"%{name}%")
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def count(self, zone: str | None = None, name: str | None = None) -> int:
+        where, params = self._where(zone, name)
+        with closing(self._connect()) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM experiments{where}", params).fetchone()[0]
+
+    def page(
+        self,
+        offset: int = 0,
+        limit: int = 50,
+        zone: str | None = None,
+        name: str | None = None,
+        order: str = "created",
+    ) -> list[dict[str, Any]]:
+        """One page of manifests, newest first by default (order="name" for A-Z)."""
+        where, params = self._where(zone, name)
+        order_by = "name COLLATE NOCASE ASC" if order == "name" else "created DESC, slug"
+        limit = max(1, min(int(limit), MAX_PAGE))
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT slug, path, manifest FROM experiments{where} ORDER BY {order_by} LIMIT ? OFFSET ?",
+                params + [limit, max(0, int(offset))],
+            ).fetchall()
+        return [{**json.loads(manifest), "slug": slug, "path": path} for slug, path, manifest in rows]
+
+    def get(self, slug: str) -> dict[str, Any] | None:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT path, manifest FROM experiments WHERE slug = ?", (slug,)).fetchone()
+        return {**json.loads(row[1]), "slug": slug, "path": row[0]} if row else None
+
+
+def init_experiment(
+    registry: ExperimentRegistry, experiments_dir: str | Path, name: str, description: str = ""
+) -> tuple[Path, dict[str, Any]]:
+    """Create experiments/<slug>/ with manifest and empty notebook, and register it."""
+    slug = experiment_slug(name)
+    exp_dir = Path(experiments_dir) / slug
+    exp_dir.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "name": name,
+        "description": description,
+        "zone": "green",
+        "created": datetime.now().isoformat(),
+    }
+    (exp_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    (exp_dir / "notebook.ipynb").write_text(
+        json.dumps({"cells": [], "metadata": {}, "nbformat": 4, "nbformat_minor": 4})
+    )
+    registry.register(slug, manifest, exp_dir)
+    return exp_dir, manifest
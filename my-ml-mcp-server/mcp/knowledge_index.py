@@ -0,0 +1,233 @@
+"""
+In-memory inverted index over knowledge_graph/experiments.json.
+
+Each experiment is flattened to dotted field paths ("metrics.accuracy",
+"dataset"). String values are tokenized into a global BM25 posting list and
+per-field postings; numeric values go into sorted per-field lists for range
+filters. An index is not modified once it is shared: the server builds a
+new one when experiments.json changes on disk, and for an added experiment
+swaps in with_added(), a copy that shares every posting list the new
+document does not touch.
+
+Query syntax (terms are ANDed as filters, free text is ranked by BM25):
+  iris random forest           free text
+  dataset:iris                 field contains token(s)
+  metric>0.9  accuracy>=0.95   numeric comparison (>, >=, <, <=, =, !=)
+
+A filter field matches a full path, any path segment, or a segment without
+its trailing "s" -- so `metric>0.9` matches any value under `metrics`.
+"""
+from __future__ import annotations
+
+import bisect
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Any, Iterator
+
+K1 = 1.2
+B = 0.75
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:\.[0-9]+)?")
+_FILTER_RE = re.compile(r"^([A-Za-z_][\w.]*)(>=|<=|!=|>|<|=|:)(.+)$")
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _flatten(value: Any, prefix: str = "") -> Iterator[tuple[str, Any]]:
+    if isinstance(value, dict):
+        for k, v in value.items():
+            yield from _flatten(v, f"{prefix}.{k}" if prefix else str(k))
+    elif isinstance(value, list):
+        for v in value:
+            yield from _flatten(v, prefix)
+    else:
+        yield prefix, value
+
+
+def _field_keys(path: str) -> set[str]:
+    """Names a filter can use for a dotted path."""
+    path = path.lower()
+    keys = {path}
+    for seg in path.split("."):
+        keys.add(seg)
+        if len(seg) > 1 and seg.endswith("s"):
+            keys.add(seg[:-1])
+    keys.discard("")
+    return keys
+
+
+def _as_number(value: str) -> float | None:
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _entries(experiment: Any) -> tuple[Counter[str], set[tuple[str, str]], dict[str, list[float]]]:
+    """One experiment's (token counts, (field key, token) pairs, numeric values by field key)."""
+    tokens: list[str] = []
+    field_terms: set[tuple[str, str]] = set()
+    numbers: dict[str, list[float]] = defaultdict(list)
+    for path, value in _flatten(experiment):
+        keys = _field_keys(path) if path else set()
+        if isinstance(value, bool) or value is None:
+            value = str(value)
+        if isinstance(value, (int, float)):
+            for key in keys:
+                numbers[key].append(float(value))
+            value = str(value)
+        field_tokens = tokenize(value) + tokenize(path.replace(".", " "))
+        tokens.extend(field_tokens)
+        field_terms.update((key, tok) for key in keys for tok in field_tokens)
+    return Counter(tokens), field_terms, numbers
+
+
+class KnowledgeIndex:
+    """Inverted index with BM25 ranking and field filters."""
+
+    def __init__(self, experiments: list[Any] | None = None) -> None:
+        self.docs: list[Any] = []
+        self._postings: dict[str, dict[int, int]] = defaultdict(dict)
+        self._doc_len: list[int] = []
+        self._total_len = 0
+        self._field_terms: dict[tuple[str, str], set[int]] = defaultdict(set)
+        self._numeric: dict[str, list[tuple[float, int]]] = defaultdict(list)
+        for exp in experiments or []:
+            self.add(exp)
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def add(self, experiment: Any) -> int:
+        """Index one experiment in place; returns its document id."""
+        doc_id = len(self.docs)
+        self.docs.append(experiment)
+        self._insert(doc_id, *_entries(experiment), copy=False)
+        return doc_id
+
+    def with_added(self, experiment: Any) -> KnowledgeIndex:
+        """
+        A new index with one more experiment; self is left as it is. Only the
+        new document is tokenized, and only the postings it appears in are
+        copied -- the rest are shared with self.
+        """
+        new = KnowledgeIndex()
+        new.docs = self.docs + [experiment]
+        new._postings = defaultdict(dict, self._postings)
+        new._doc_len = list(self._doc_len)
+        new._total_len = self._total_len
+        new._field_terms = defaultdict(set, self._field_terms)
+        new._numeric = defaultdict(list, self._numeric)
+        new._insert(len(self.docs), *_entries(experiment), copy=True)
+        return new
+
+    def _insert(
+        self,
+        doc_id: int,
+        tokens: Counter[str],
+        field_terms: set[tuple[str, str]],
+        numbers: dict[str, list[float]],
+        copy: bool,
+    ) -> None:
+        # copy=True: the containers may be shared with another index, so each touched one is copied first
+        for key, values in numbers.items():
+            entries = list(self._numeric[key]) if copy else self._numeric[key]
+            for value in values:
+                bisect.insort(entries, (value, doc_id))
+            self._numeric[key] = entries
+        for field_term in field_terms:
+            docs = set(self._field_terms[field_term]) if copy else self._field_terms[field_term]
+            docs.add(doc_id)
+            self._field_terms[field_term] = docs
+        for tok, tf in tokens.items():
+            postings = dict(self._postings[tok]) if copy else self._postings[tok]
+            postings[doc_id] = tf
+            self._postings[tok] = postings
+        length = sum(tokens.values())
+        self._doc_len.append(length)
+        self._total_len += length
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+    def _numeric_docs(self, field: str, op: str, target: float) -> set[int]:
+        values = self._numeric.get(field, [])
+        if op in (">", ">="):
+            i = bisect.bisect_right(values, (target, math.inf)) if op == ">" else bisect.bisect_left(values, (target, -1))
+            return {d for _, d in values[i:]}
+        if op in ("<", "<="):
+            i = bisect.bisect_left(values, (target, -1)) if op == "<" else bisect.bisect_right(values, (target, math.inf))
+            return {d for _, d in values[:i]}
+        lo = bisect.bisect_left(values, (target, -1))
+        hi = bisect.bisect_right(values, (target, math.inf))
+        equal = {d for _, d in values[lo:hi]}
+        if op == "!=":
+            return {d for _, d in values} - equal
+        return equal
+
+    def _filter_docs(self, field: str, op: str, raw: str) -> set[int]:
+        field = field.lower()
+        number = _as_number(raw)
+        if op == ":" or (op == "=" and number is None):
+            matched: set[int] | None = None
+            for tok in tokenize(raw):
+                docs = self._field_terms.get((field, tok), set())
+                matched = set(docs) if matched is None else matched & docs
+            result = matched or set()
+            if number is not None:
+                result |= self._numeric_docs(field, "=", number)
+            return result
+        if number is None:
+            return set()
+        return self._numeric_docs(field, op, number)
+
+    def parse(self, query: str) -> tuple[list[str], list[tuple[str, str, str]]]:
+        """(free-text tokens, [(field, op, value)]) for a query string."""
+        terms: list[str] = []
+        filters: list[tuple[str, str, str]] = []
+        for part in query.split():
+            m = _FILTER_RE.match(part)
+            if m:
+                filters.append((m.group(1), m.group(2), m.group(3)))
+            else:
+                terms.extend(tokenize(part))
+        return terms, filters
+
+    def search(self, query: str, limit: int = 10) -> dict[str, Any]:
+        """Ranked matches: {"results": [...], "scores": [...], "total": n}."""
+        terms, filters = self.parse(query)
+        candidates: set[int] | None = None
+        for field, op, value in filters:
+            docs = self._filter_docs(field, op, value)
+            candidates = docs if candidates is None else candidates & docs
+            if not candidates:
+                return {"results": [], "scores": [], "total": 0}
+
+        scores: dict[int, float] = defaultdict(float)
+        if terms:
+            n = len(self.docs)
+            avg_len = (self._total_len / n) if n else 0.0
+            for tok in set(terms):
+                postings = self._postings.get(tok)
+                if not postings:
+                    continue
+                idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, tf in postings.items():
+                    if candidates is not None and doc_id not in candidates:
+                        continue
+                    norm = K1 * (1 - B + B * self._doc_len[doc_id] / avg_len) if avg_len else K1
+                    scores[doc_id] += idf * tf * (K1 + 1) / (tf + norm)
+            ranked = sorted(scores, key=lambda d: (-scores[d], d))
+        else:
+            # Filters only: newest (last added) first
+            ranked = sorted(candidates if candidates is not None else range(len(self.docs)), reverse=True)
+
+        top = ranked[: max(0, limit)]
+        return {
+            "results": [self.docs[d] for d in top],
+            "scores": [round(scores.get(d, 0.0), 4) for d in top],
+            "total": len(ranked),
+        }
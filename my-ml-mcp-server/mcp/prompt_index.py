@@ -0,0 +1,84 @@
+"""
+Tag index over one zone's curated prompts, for /suggest-pattern.
+
+Built once per load of <zone>_prompts.yaml. Tags and tasks are split into
+word tokens with a light suffix stem ("features" -> "feature", "training" ->
+"train"), so a tag matches a task by words instead of by substring. A
+multi-word tag ("model-card") matches when all of its words appear in the
+task. Prompts are ranked by the number of tags matched, then by file order.
+
+Suggestion previews are truncated once at build time, and the results for
+recent tasks are kept in a small LRU. A reload builds a new index, which
+starts with an empty LRU.
+"""
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Any
+
+PREVIEW_CHARS = 200
+FALLBACK_COUNT = 3
+MEMO_SIZE = 1024
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _stem(word: str) -> str:
+    for suffix in ("ing", "s"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[: -len(suffix)]
+    return word
+
+
+def tokenize(text: str) -> list[str]:
+    return [_stem(w) for w in _TOKEN_RE.findall(text.lower())]
+
+
+class PromptIndex:
+    """Curated prompts for one zone with a tag -> prompt inverted index."""
+
+    def __init__(self, prompts: list[dict[str, Any]]) -> None:
+        self.prompts = prompts
+        self._previews = [
+            {"name": p.get("name", ""), "text": str(p.get("text", ""))[:PREVIEW_CHARS] + "..."} for p in prompts
+        ]
+        # first token of a tag -> [(prompt position, all tokens of the tag)]
+        self._tags: dict[str, list[tuple[int, frozenset[str]]]] = defaultdict(list)
+        for i, prompt in enumerate(prompts):
+            for tag in prompt.get("tags", []) or []:
+                tokens = tokenize(str(tag))
+                if tokens:
+                    self._tags[tokens[0]].append((i, frozenset(tokens)))
+        self._memo: OrderedDict[str, list[dict[str, str]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.prompts)
+
+    def _rank(self, task: str) -> list[dict[str, str]]:
+        words = set(tokenize(task))
+        matched: dict[int, set[frozenset[str]]] = defaultdict(set)
+        for word in words:
+            for i, tag in self._tags.get(word, ()):
+                if tag <= words:
+                    matched[i].add(tag)
+        if not matched:
+            return self._previews[:FALLBACK_COUNT]
+        order = sorted(matched, key=lambda i: (-len(matched[i]), i))
+        return [self._previews[i] for i in order]
+
+    def suggest(self, task: str) -> list[dict[str, str]]:
+        """Name + text preview of the prompts whose tags match task (shared; do not mutate)."""
+        key = task.strip().lower()
+        with self._lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                return self._memo[key]
+        result = self._rank(key)
+        with self._lock:
+            self._memo[key] = result
+            if len(self._memo) > MEMO_SIZE:
+                self._memo.popitem(last=False)
+        return result
@@ -0,0 +1,255 @@
+"""
+Repository scan: zone-detect and validate every Python file / notebook in a
+project tree and emit one JSON or SARIF 2.1.0 report.
+
+- Zones come from the compiled zone matcher (one zone_rules.yaml parse).
+- Files are validated with validate_code(code, zone) in a process pool.
+- Results are cached per root in SCAN_CACHE_DIR (outside the scanned tree),
+  keyed by path and SHA-256 of the content (plus the zone and a rules
+  fingerprint). Unchanged files are recognised by mtime/size without being
+  read; a file whose stamp changed is hashed first and only validated when
+  its digest differs from the cached one.
+- The pool never has more workers than CPUs.
+
+CLI:
+  python -m mcp.repo_scan path/to/repo [--format sarif] [--output report.sarif] [--workers 8]
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from mcp.server import GOVERNANCE_DIR, SCAN_CACHE_DIR, _walk_files, _zone_matcher, validate_code
+
+SCAN_SUFFIXES = {".py", ".ipynb"}
+INLINE_THRESHOLD = 32  # below this many files a pool costs more than it saves
+MAX_SCAN_FILES = 50000
+CACHE_VERSION = 1
+
+_SEVERITY = {"RED": "error", "YELLOW": "warning", "GREEN": "note"}
+
+
+def _rules_fingerprint() -> str:
+    path = GOVERNANCE_DIR / "zone_rules.yaml"
+    digest = hashlib.sha256(f"v{CACHE_VERSION}".encode())
+    if path.exists():
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _source(path: Path, raw: bytes) -> str:
+    """Python source of a file; notebooks contribute their code cells."""
+    text = raw.decode("utf-8", errors="replace")
+    if path.suffix != ".ipynb":
+        return text
+    try:
+        nb = json.loads(text)
+    except json.JSONDecodeError:
+        return ""
+    cells = [c for c in nb.get("cells", []) if c.get("cell_type") == "code"]
+    return "\n".join("".join(c.get("source", [])) if isinstance(c.get("source"), list) else str(c.get("source", ""))
+                     for c in cells)
+
+
+def _validate_file(job: tuple[str, str, str]) -> tuple[str, str, dict[str, Any]]:
+    """Worker: (rel_path, abs_path, zone) -> (rel_path, sha256, result)."""
+    rel, abs_path, zone = job
+    try:
+        raw = Path(abs_path).read_bytes()
+    except OSError as e:
+        return rel, "", {"valid": True, "violations": [], "suggestions": [], "zone": zone, "error": str(e)}
+    digest = hashlib.sha256(raw).hexdigest()
+    if zone == "GREEN":
+        result = {"valid": True, "violations": [], "suggestions": [], "zone": zone}
+    else:
+        result = validate_code(_source(Path(abs_path), raw), zone)
+    return rel, digest, result
+
+
+def _digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def cache_path_for(root: Path, cache_dir: str | Path | None = None) -> Path:
+    """Scan cache file for a resolved root, kept in cache_dir (default SCAN_CACHE_DIR)."""
+    key = hashlib.sha256(str(root).encode("utf-8")).hexdigest()[:16]
+    return Path(cache_dir or SCAN_CACHE_DIR) / f"{root.name or 'root'}-{key}.json"
+
+
+def _load_cache(path: Path, fingerprint: str) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data.get("files", {}) if data.get("fingerprint") == fingerprint else {}
+
+
+def _save_cache(path: Path, fingerprint: str, files: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"fingerprint": fingerprint, "files": files}))
+    os.replace(tmp, path)
+
+
+def scan_repo(
+    root: str | Path,
+    workers: int | None = None,
+    cache_path: str | Path | None = None,
+    use_cache: bool = True,
+) -> dict[str, Any]:
+    """Scan root; returns the JSON report (see to_sarif for SARIF)."""
+    root = Path(root).resolve()
+    cache_path = Path(cache_path) if cache_path else cache_path_for(root)
+    cpus = os.cpu_count() or 1
+    workers = max(1, min(workers or cpus, cpus))
+    fingerprint = _rules_fingerprint()
+    cache = _load_cache(cache_path, fingerprint) if use_cache else {}
+    matcher = _zone_matcher()
+
+    paths = [p for p in _walk_files(root, MAX_SCAN_FILES) if Path(p).suffix in SCAN_SUFFIXES]
+    entries: dict[str, Any] = {}
+    jobs: list[tuple[str, str, str]] = []
+    reused = 0
+    for rel in paths:
+        abs_path = root / rel
+        try:
+            st = abs_path.stat()
+        except OSError:
+            continue
+        zone = matcher.detect(rel)
+        stamp = [st.st_mtime_ns, st.st_size]
+        hit = cache.get(rel)
+        if hit and hit.get("zone") == zone and "result" in hit:
+            if hit.get("stamp") == stamp:
+                entries[rel] = hit
+                reused += 1
+                continue
+            # Touched: hash it, and keep the cached result if the content is unchanged
+            try:
+                if _digest(abs_path) == hit.get("sha256"):
+                    entries[rel] = {**hit, "stamp": stamp}
+                    reused += 1
+                    continue
+            except OSError:
+                pass
+        jobs.append((rel, str(abs_path), zone))
+        entries[rel] = {"stamp": stamp, "zone": zone}
+
+    if len(jobs) < INLINE_THRESHOLD or workers == 1:
+        done = [_validate_file(job) for job in jobs]
+    else:
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            done = list(pool.map(_validate_file, jobs, chunksize=chunksize))
+    for rel, digest, result in done:
+        entries[rel] = {**entries[rel], "sha256": digest, "result": result}
+    revalidated = len(done)
+
+    if use_cache:
+        _save_cache(cache_path, fingerprint, entries)
+
+    files = []
+    counts = {"RED": 0, "YELLOW": 0, "GREEN": 0}
+    for rel in sorted(entries):
+        entry = entries[rel]
+        result = entry.get("result", {})
+        counts[entry["zone"]] = counts.get(entry["zone"], 0) + 1
+        files.append({
+            "path": rel,
+            "zone": entry["zone"],
+            "valid": result.get("valid", True),
+            "violations": result.get("violations", []),
+            "suggestions": result.get("suggestions", []),
+        })
+    return {
+        "root": str(root),
+        "files_scanned": len(files),
+        "files_validated": revalidated,
+        "files_cached": reused,
+        "zones": counts,
+        "invalid_files": sum(1 for f in files if not f["valid"]),
+        "files": files,
+    }
+
+
+def _rule_id(zone: str, message: str) -> str:
+    words = re.findall(r"[a-z_]+", message.lower())
+    key = next((w for w in words if w in ("random_state", "mlflow", "validation", "deterministic")), "rule")
+    return f"{zone.lower()}/{key}"
+
+
+def to_sarif(report: dict[str, Any]) -> dict[str, Any]:
+    """SARIF 2.1.0 log for a scan report (file-level locations)."""
+    rules: dict[str, dict[str, Any]] = {}
+    results = []
+    for f in report["files"]:
+        for i, message in enumerate(f["violations"]):
+            rule_id = _rule_id(f["zone"], message)
+            rules.setdefault(rule_id, {
+                "id": rule_id,
+                "shortDescription": {"text": message},
+                "properties": {"zone": f["zone"]},
+            })
+            suggestion = f["suggestions"][i] if i < len(f["suggestions"]) else ""
+            results.append({
+                "ruleId": rule_id,
+                "level": _SEVERITY.get(f["zone"], "warning"),
+                "message": {"text": f"{message}. {suggestion}".strip()},
+                "locations": [{
+                    "physicalLocation": {
+                        "artifactLocation": {"uri": f["path"], "uriBaseId": "SRCROOT"},
+                        "region": {"startLine": 1},
+                    }
+                }],
+                "properties": {"zone": f["zone"]},
+            })
+    return {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {"driver": {"name": "my-ml-zone-scan", "rules": list(rules.values())}},
+            "originalUriBaseIds": {"SRCROOT": {"uri": Path(report["root"]).as_uri() + "/"}},
+            "results": results,
+        }],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Zone-aware production-readiness scan of a project tree")
+    parser.add_argument("root", type=Path)
+    parser.add_argument("--format", choices=["json", "sarif"], default="json")
+    parser.add_argument("--output", type=Path, help="Write the report here instead of stdout")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (default and maximum: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not write the scan cache")
+    args = parser.parse_args(argv)
+
+    if not args.root.is_dir():
+        sys.stderr.write(f"Not a directory: {args.root}\n")
+        return 2
+    report = scan_repo(args.root, workers=args.workers, use_cache=not args.no_cache)
+    out = to_sarif(report) if args.format == "sarif" else report
+    text = json.dumps(out, indent=2)
+    if args.output:
+        args.output.write_text(text)
+    else:
+        print(text)
+    sys.stderr.write(
+        f"{report['files_scanned']} file(s): {report['files_validated']} validated, "
+        f"{report['files_cached']} from cache, {report['invalid_files']} with violations\n"
+    )
+    return 1 if report["invalid_files"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
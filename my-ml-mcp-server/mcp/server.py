@@ -3,28 +3,119 @@
 Personal ML MCP Server - FastAPI
 Zone-based governance: GREEN (experiment) | YELLOW (develop) | RED (production)
 """
+import asyncio
+import functools
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import fnmatch
+import os
 import re
+import threading
 import yaml
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 
+from mcp.experiment_registry import ExperimentRegistry, init_experiment
+from mcp.knowledge_index import KnowledgeIndex
+from mcp.prompt_index import PromptIndex
+
 APP_DIR = Path(__file__).resolve().parent.parent
 GOVERNANCE_DIR = APP_DIR / "governance"
 PROMPTS_DIR = APP_DIR / "prompts"
 PATTERNS_DIR = APP_DIR / "patterns"
 KNOWLEDGE_DIR = APP_DIR / "knowledge_graph"
+EXPERIMENTS_DIR = Path(os.environ.get("MY_ML_EXPERIMENTS_DIR", str(APP_DIR / "experiments")))
+EXPERIMENT_DB = Path(os.environ.get("MY_ML_EXPERIMENT_DB", str(APP_DIR / "experiments.db")))
+# Directories /scan-repo and /detect-zone/batch may read (os.pathsep-separated); default: this app
+SCAN_ROOTS = [
+    Path(p).expanduser().resolve()
+    for p in os.environ.get("MY_ML_SCAN_ROOTS", "").split(os.pathsep) if p.strip()
+] or [APP_DIR]
+SCAN_CACHE_DIR = Path(os.environ.get("MY_ML_SCAN_CACHE_DIR", str(APP_DIR / ".scan_cache")))
 
 app = FastAPI(title="Personal ML MCP Server", version="1.0.0")
 
+# ---------------------------------------------------------------------------
+# File I/O offloading and file-backed caches
+# ---------------------------------------------------------------------------
+# Handlers are async; anything that touches disk runs on this pool so the
+# event loop only ever does in-memory work.
+IO_POOL = ThreadPoolExecutor(max_workers=int(os.environ.get("MY_ML_IO_THREADS", "8")), thread_name_prefix="mcp-io")
+STAT_INTERVAL = 1.0  # seconds between mtime checks of a cached file
+
+
+async def _offload(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(IO_POOL, functools.partial(fn, *args, **kwargs))
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class _FileCache:
+    """
+    Value derived from one file, rebuilt when its mtime/size changes. The
+    file is stat'ed at most once per STAT_INTERVAL; in between, get() and
+    aget() are pure memory reads.
+    """
+
+    def __init__(self, path: Callable[[], Path], loader: Callable[[Path], Any]) -> None:
+        self._path = path  # callable so tests can repoint the module-level dirs
+        self._loader = loader
+        self._value: Any = None
+        self._stamp: tuple[int, int] | None = None
+        self._checked = -STAT_INTERVAL
+        self._loaded = False
+        self.lock = threading.Lock()
+
+    def _fresh(self) -> bool:
+        return self._loaded and time.monotonic() - self._checked < STAT_INTERVAL
+
+    def get(self) -> Any:
+        if self._fresh():
+            return self._value
+        with self.lock:
+            return self.current()
+
+    def current(self) -> Any:
+        """The value for the file as it is now, reloaded if it changed (call with lock held)."""
+        path = self._path()
+        stamp = _file_stamp(path)
+        if not self._loaded or stamp != self._stamp:
+            self._value = self._loader(path)
+            self._stamp = stamp
+            self._loaded = True
+        self._checked = time.monotonic()
+        return self._value
+
+    async def aget(self) -> Any:
+        """Like get(), but the stat/reload (when due) runs on the I/O pool."""
+        return self._value if self._fresh() else await _offload(self.get)
+
+    def replace(self, value: Any) -> None:
+        """Install a value the caller just wrote to the file (call with lock held)."""
+        self._value = value
+        self._stamp = _file_stamp(self._path())
+        self._checked = time.monotonic()
+        self._loaded = True
+
+
 # ---------------------------------------------------------------------------
 # Load governance
 # ---------------------------------------------------------------------------
-def _load_zone_rules() -> dict:
+ZONE_PRIORITY = ("red", "yellow", "green")
+
+
+def _read_zone_rules() -> dict:
     path = GOVERNANCE_DIR / "zone_rules.yaml"
     if not path.exists():
         return {}
@@ -51,19 +142,67 @@ def _path_matches_any(file_path: str, patterns: list[str]) -> bool:
     return False
 
 
-def detect_zone(file_path: str) -> str:
-    """Auto-detect which zone a file belongs to. Priority: Red > Yellow > Green."""
-    rules = _load_zone_rules()
-    zones = rules.get("zones", {})
-    norm = _normalize_path(file_path)
+def _compile_patterns(patterns: list[str]) -> tuple[re.Pattern | None, re.Pattern | None]:
+    """
+    Fold a zone's globs into two regexes with the same semantics as
+    _path_matches_any: one tested against the path, one against "/" + path
+    (only for patterns starting with "*").
+    """
+    plain, slashed = [], []
+    for pattern in patterns:
+        pat = pattern.replace("**/", "*/").replace("/**", "/*")
+        plain.append(fnmatch.translate(pat))
+        if pat.startswith("*"):
+            slashed.append(fnmatch.translate("/" + pat))
+    return (
+        re.compile("|".join(plain)) if plain else None,
+        re.compile("|".join(slashed)) if slashed else None,
+    )
+
+
+class ZoneMatcher:
+    """zone_rules.yaml parsed once, with each zone's file patterns precompiled."""
+
+    def __init__(self, rules: dict) -> None:
+        self.rules = rules
+        self.zones = rules.get("zones", {}) or {}
+        self._compiled = []
+        for zone_name in ZONE_PRIORITY:
+            patterns = self.zones.get(zone_name, {}).get("file_patterns", [])
+            if patterns:
+                self._compiled.append((zone_name.upper(), *_compile_patterns(patterns)))
+
+    def detect(self, file_path: str) -> str:
+        norm = _normalize_path(file_path)
+        for zone, plain, slashed in self._compiled:
+            if (plain and plain.match(norm)) or (slashed and slashed.match("/" + norm)):
+                return zone
+        return "GREEN"  # default: experimentation
+
+    def info(self, zone: str) -> dict:
+        zone_info = self.zones.get(zone.lower(), {})
+        return {
+            "description": zone_info.get("description", ""),
+            "cursor_mode": zone_info.get("cursor_mode", ""),
+        }
+
+
+_zone_rules_cache = _FileCache(lambda: GOVERNANCE_DIR / "zone_rules.yaml", lambda _path: ZoneMatcher(_read_zone_rules()))
 
-    for zone_name in ["red", "yellow", "green"]:
-        zone = zones.get(zone_name, {})
-        patterns = zone.get("file_patterns", [])
-        if patterns and _path_matches_any(file_path, patterns):
-            return zone_name.upper()
 
-    return "GREEN"  # default: experimentation
+def _zone_matcher() -> ZoneMatcher:
+    """Compiled matcher for zone_rules.yaml, rebuilt only when the file changes."""
+    return _zone_rules_cache.get()
+
+
+def _load_zone_rules() -> dict:
+    """Parsed zone_rules.yaml (cached; do not mutate)."""
+    return _zone_matcher().rules
+
+
+def detect_zone(file_path: str) -> str:
+    """Auto-detect which zone a file belongs to. Priority: Red > Yellow > Green."""
+    return _zone_matcher().detect(file_path)
 
 
 def validate_code(code: str, zone: str) -> dict[str, Any]:
@@ -97,16 +236,30 @@ def validate_code(code: str, zone: str) -> dict[str, Any]:
     }
 
 
-def load_prompts(zone: str) -> list[dict]:
-    """Load curated prompts for zone."""
-    zone_map = {"green": "green_prompts", "yellow": "yellow_prompts", "red": "red_prompts"}
-    fname = zone_map.get(zone.lower(), "green_prompts") + ".yaml"
-    path = PROMPTS_DIR / fname
+PROMPT_FILES = {"green": "green_prompts", "yellow": "yellow_prompts", "red": "red_prompts"}
+
+
+def _read_prompts(path: Path) -> PromptIndex:
     if not path.exists():
-        return []
+        return PromptIndex([])
     with open(path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-    return data.get("prompts", [])
+        data = yaml.safe_load(f) or {}
+    return PromptIndex(data.get("prompts", []) or [])
+
+
+_prompt_caches = {
+    zone: _FileCache(functools.partial(lambda name: PROMPTS_DIR / f"{name}.yaml", fname), _read_prompts)
+    for zone, fname in PROMPT_FILES.items()
+}
+
+
+def _prompt_cache(zone: str) -> _FileCache:
+    return _prompt_caches.get(zone.lower(), _prompt_caches["green"])
+
+
+def load_prompts(zone: str) -> list[dict]:
+    """Curated prompts for zone (cached; do not mutate)."""
+    return _prompt_cache(zone).get().prompts
 
 
 # ---------------------------------------------------------------------------
@@ -116,6 +269,18 @@ class DetectZoneRequest(BaseModel):
     file_path: str
 
 
+class DetectZoneBatchRequest(BaseModel):
+    file_paths: list[str] = []
+    root: str | None = None  # also classify every file under this directory
+
+
+class ScanRepoRequest(BaseModel):
+    root: str
+    format: str = "json"  # "json" | "sarif"
+    workers: int | None = None
+    use_cache: bool = True
+
+
 class ValidateCodeRequest(BaseModel):
     code: str
     zone: str
@@ -133,63 +298,136 @@ class InitExperimentRequest(BaseModel):
 
 class QueryKnowledgeRequest(BaseModel):
     query: str
+    limit: int = 10
+
+
+class AddExperimentRequest(BaseModel):
+    experiment: dict[str, Any]
 
 
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
 @app.post("/detect-zone")
-def api_detect_zone(req: DetectZoneRequest) -> dict:
+async def api_detect_zone(req: DetectZoneRequest) -> dict:
     """Auto-detect which zone a file belongs to."""
-    zone = detect_zone(req.file_path)
-    rules = _load_zone_rules()
-    zone_info = rules.get("zones", {}).get(zone.lower(), {})
+    matcher = await _zone_rules_cache.aget()
+    zone = matcher.detect(req.file_path)
+    return {"file_path": req.file_path, "zone": zone, **matcher.info(zone)}
+
+
+MAX_BATCH_FILES = 20000
+_SKIP_DIRS = {".git", "__pycache__", ".venv", "venv", "node_modules", ".ipynb_checkpoints"}
+
+
+def _scan_root(raw: str) -> Path:
+    """
+    Resolved directory for a client-supplied root. It must be inside one of
+    SCAN_ROOTS (symlinks are resolved first); anything else is a 403.
+    """
+    root = Path(raw).expanduser().resolve()
+    if not any(root == allowed or root.is_relative_to(allowed) for allowed in SCAN_ROOTS):
+        raise HTTPException(status_code=403, detail=f"Root is outside the allowed scan roots: {raw}")
+    if not root.is_dir():
+        raise HTTPException(status_code=404, detail=f"Directory not found: {raw}")
+    return root
+
+
+def _walk_files(root: Path, limit: int) -> list[str]:
+    """Relative POSIX paths of files under root (hidden/tool dirs skipped)."""
+    found: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in _SKIP_DIRS and not d.startswith("."))
+        rel_dir = Path(dirpath).relative_to(root).as_posix()
+        for name in sorted(filenames):
+            found.append(name if rel_dir == "." else f"{rel_dir}/{name}")
+            if len(found) >= limit:
+                return found
+    return found
+
+
+@app.post("/detect-zone/batch")
+async def api_detect_zone_batch(req: DetectZoneBatchRequest) -> dict:
+    """Classify many files (or a whole project tree inside SCAN_ROOTS) with one rules load."""
+    paths = list(req.file_paths)
+    if req.root:
+        root = await _offload(_scan_root, req.root)
+        paths += await _offload(_walk_files, root, MAX_BATCH_FILES - len(paths))
+    if len(paths) > MAX_BATCH_FILES:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BATCH_FILES} files per batch")
+    matcher = await _zone_rules_cache.aget()
+    results = [{"file_path": fp, "zone": matcher.detect(fp)} for fp in paths]
+    counts = {zone.upper(): 0 for zone in ZONE_PRIORITY}
+    for r in results:
+        counts[r["zone"]] += 1
     return {
-        "file_path": req.file_path,
-        "zone": zone,
-        "description": zone_info.get("description", ""),
-        "cursor_mode": zone_info.get("cursor_mode", ""),
+        "results": results,
+        "counts": counts,
+        "zones": {zone: matcher.info(zone) for zone in counts},
     }
 
 
 @app.post("/validate-code")
-def api_validate_code(req: ValidateCodeRequest) -> dict:
+async def api_validate_code(req: ValidateCodeRequest) -> dict:
     """Validate code against zone rules."""
     return validate_code(req.code, req.zone)
 
 
+@app.post("/scan-repo")
+async def api_scan_repo(req: ScanRepoRequest) -> dict:
+    """Zone-detect and validate every .py/.ipynb under root (must be inside SCAN_ROOTS; content-hash cached)."""
+    from mcp.repo_scan import cache_path_for, scan_repo, to_sarif
+
+    root = await _offload(_scan_root, req.root)
+    report = await _offload(
+        scan_repo, root, workers=req.workers, cache_path=cache_path_for(root, SCAN_CACHE_DIR), use_cache=req.use_cache
+    )
+    return to_sarif(report) if req.format == "sarif" else report
+
+
 @app.post("/suggest-pattern")
-def api_suggest_pattern(req: SuggestPatternRequest) -> dict:
+async def api_suggest_pattern(req: SuggestPatternRequest) -> dict:
     """Suggest patterns based on task."""
     zone = req.zone or "yellow"
-    prompts = load_prompts(zone)
-    # Simple keyword match for now
-    task_lower = req.task.lower()
-    relevant = [p for p in prompts if any(t in task_lower for t in p.get("tags", []))]
-    if not relevant:
-        relevant = prompts[:3]
+    index = await _prompt_cache(zone).aget()
     return {
         "task": req.task,
         "zone": zone,
-        "suggestions": [{"name": p["name"], "text": p["text"][:200] + "..."} for p in relevant],
+        "suggestions": index.suggest(req.task),  # ranked by matched tags, LRU-cached per task
+    }
+
+
+_registries: dict[str, ExperimentRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def _experiment_registry() -> ExperimentRegistry:
+    key = str(EXPERIMENT_DB)
+    with _registries_lock:
+        if key not in _registries:
+            _registries[key] = ExperimentRegistry(EXPERIMENT_DB)
+        return _registries[key]
+
+
+def _init_experiment(name: str, description: str) -> tuple[Path, dict[str, Any]]:
+    return init_experiment(_experiment_registry(), EXPERIMENTS_DIR, name, description)
+
+
+def _list_experiments(offset: int, limit: int, zone: str | None, name: str | None, order: str) -> dict:
+    registry = _experiment_registry()
+    registry.sync(EXPERIMENTS_DIR)
+    return {
+        "experiments": registry.page(offset=offset, limit=limit, zone=zone, name=name, order=order),
+        "total": registry.count(zone=zone, name=name),
+        "offset": offset,
+        "limit": limit,
     }
 
 
 @app.post("/init-experiment")
-def api_init_experiment(req: InitExperimentRequest) -> dict:
+async def api_init_experiment(req: InitExperimentRequest) -> dict:
     """Initialize new experiment with proper structure."""
-    exp_dir = Path(APP_DIR) / "experiments" / req.name.replace(" ", "_").lower()
-    exp_dir.mkdir(parents=True, exist_ok=True)
-    manifest = {
-        "name": req.name,
-        "description": req.description,
-        "zone": "green",
-        "created": __import__("datetime").datetime.now().isoformat(),
-    }
-    (exp_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
-    (exp_dir / "notebook.ipynb").write_text(
-        json.dumps({"cells": [], "metadata": {}, "nbformat": 4, "nbformat_minor": 4})
-    )
+    exp_dir, manifest = await _offload(_init_experiment, req.name, req.description)
     return {
         "status": "created",
         "path": str(exp_dir),
@@ -197,27 +435,73 @@ def api_init_experiment(req: InitExperimentRequest) -> dict:
     }
 
 
-@app.post("/query-knowledge-graph")
-def api_query_knowledge(req: QueryKnowledgeRequest) -> dict:
-    """Query personal ML history."""
+@app.get("/experiments")
+async def api_list_experiments(
+    offset: int = 0, limit: int = 50, zone: str | None = None, name: str | None = None, order: str = "created"
+) -> dict:
+    """Paged experiment listing from the registry."""
+    return await _offload(_list_experiments, offset, limit, zone, name, order)
+
+
+def _read_experiments(path: Path) -> list[Any]:
+    data = json.loads(path.read_text()) if path.exists() else []
+    return data if isinstance(data, list) else []
+
+
+def _read_knowledge(path: Path) -> KnowledgeIndex:
+    return KnowledgeIndex(_read_experiments(path))
+
+
+_knowledge_cache = _FileCache(lambda: KNOWLEDGE_DIR / "experiments.json", _read_knowledge)
+
+
+def _knowledge_index() -> KnowledgeIndex:
+    """Index over experiments.json; rebuilt only when the file changes on disk."""
+    return _knowledge_cache.get()
+
+
+def _add_experiment(experiment: dict[str, Any]) -> tuple[int, int]:
+    """
+    Append to experiments.json and swap in the index with the experiment
+    added. Under the lock the cache is first brought up to date with the
+    file, so edits made on disk are kept; the new index is with_added(), so
+    only the new experiment is tokenized, and the index readers hold is never
+    mutated (search() runs on the event loop without the lock).
+    """
     path = KNOWLEDGE_DIR / "experiments.json"
-    if not path.exists():
-        return {"results": [], "query": req.query}
-    data = json.loads(path.read_text())
-    # Simple filter for now
-    results = [e for e in data if isinstance(e, dict) and req.query.lower() in str(e).lower()]
-    return {"results": results[:10], "query": req.query}
+    with _knowledge_cache.lock:
+        index = _knowledge_cache.current().with_added(experiment)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(index.docs, indent=2))
+        os.replace(tmp, path)
+        _knowledge_cache.replace(index)
+    return len(index) - 1, len(index)
+
+
+@app.post("/query-knowledge-graph")
+async def api_query_knowledge(req: QueryKnowledgeRequest) -> dict:
+    """Query personal ML history (BM25 text search plus field filters like metric>0.9, dataset:iris)."""
+    index = await _knowledge_cache.aget()
+    found = index.search(req.query, limit=req.limit)
+    return {**found, "query": req.query}
+
+
+@app.post("/knowledge-graph/experiments")
+async def api_add_experiment(req: AddExperimentRequest) -> dict:
+    """Append an experiment to the knowledge graph and swap in the updated index."""
+    doc_id, total = await _offload(_add_experiment, req.experiment)
+    return {"status": "added", "id": doc_id, "total": total}
 
 
 @app.get("/prompts/{zone}")
-def api_get_prompts(zone: str) -> dict:
+async def api_get_prompts(zone: str) -> dict:
     """Get curated prompts for zone."""
-    prompts = load_prompts(zone)
-    return {"zone": zone.upper(), "prompts": prompts}
+    index = await _prompt_cache(zone).aget()
+    return {"zone": zone.upper(), "prompts": index.prompts}
 
 
 @app.get("/health")
-def health() -> dict:
+async def health() -> dict:
     return {"status": "ok", "service": "personal-ml-mcp"}
 
 
@@ -0,0 +1,53 @@
+"""
+Fixtures for importing the server's `mcp` package.
+
+The package shares its name with the MCP SDK that the repo-root and MLDLC
+servers import, so a test that needs it gets the package swapped into
+sys.modules and the previous `mcp` modules are put back afterwards. The
+server's modules are imported once and reused across tests.
+"""
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+SERVER_DIR = str(Path(__file__).resolve().parent.parent)
+_server_modules: dict = {}
+
+
+def _mcp_modules() -> dict:
+    return {k: v for k, v in sys.modules.items() if k == "mcp" or k.startswith("mcp.")}
+
+
+@pytest.fixture
+def mcp_import():
+    """importlib.import_module for the server's mcp.* modules."""
+    saved = _mcp_modules()
+    for name in saved:
+        del sys.modules[name]
+    sys.modules.update(_server_modules)
+    sys.path.insert(0, SERVER_DIR)
+    try:
+        yield importlib.import_module
+    finally:
+        sys.path.remove(SERVER_DIR)
+        loaded = _mcp_modules()
+        _server_modules.update(loaded)
+        for name in loaded:
+            del sys.modules[name]
+        sys.modules.update(saved)
+
+
+@pytest.fixture
+def server(mcp_import, tmp_path, monkeypatch):
+    """mcp.server with its knowledge graph and experiment stores in tmp_path."""
+    module = mcp_import("mcp.server")
+    monkeypatch.setattr(module, "KNOWLEDGE_DIR", tmp_path / "knowledge_graph")
+    monkeypatch.setattr(module, "EXPERIMENTS_DIR", tmp_path / "experiments")
+    monkeypatch.setattr(module, "EXPERIMENT_DB", tmp_path / "experiments.db")
+    monkeypatch.setattr(module, "_knowledge_cache", module._FileCache(
+        lambda: module.KNOWLEDGE_DIR / "experiments.json", module._read_knowledge
+    ))
+    (tmp_path / "knowledge_graph").mkdir()
+    return module
@@ -0,0 +1,114 @@
+"""Tests for the dashboard's MCP HTTP client."""
+
+import time
+
+import pytest
+import requests
+
+
+class _Response:
+    def __init__(self, status_code=200, body=None):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.text = "" if body is None else str(body)
+        self._body = body
+
+    def json(self):
+        if self._body is None:
+            raise ValueError("no JSON")
+        return self._body
+
+
+@pytest.fixture
+def client_module(mcp_import):
+    return mcp_import("mcp.client")
+
+
+@pytest.fixture
+def fake_server():
+    """Scripted responses for session.request; records (method, url) of each call."""
+
+    class Fake:
+        def __init__(self):
+            self.calls = []
+            self.responses = []
+
+        def request(self, method, url, timeout=None, **kwargs):
+            self.calls.append((method, url))
+            outcome = self.responses.pop(0) if self.responses else _Response(200, {"ok": True})
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+    return Fake()
+
+
+@pytest.fixture
+def client(client_module, fake_server, monkeypatch):
+    c = client_module.MCPClient("http://mcp.test/", breaker=client_module.CircuitBreaker(2, cooldown=0.05))
+    monkeypatch.setattr(c.session, "request", fake_server.request)
+    return c
+
+
+class TestCircuitBreaker:
+    """Consecutive failures open the breaker; a success closes it."""
+
+    def test_opens_after_threshold_and_half_opens_after_cooldown(self, client_module):
+        breaker = client_module.CircuitBreaker(failure_threshold=2, cooldown=0.05)
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.open
+        time.sleep(0.06)
+        assert breaker.allow()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.allow()  # the failure count was reset
+
+    def test_client_skips_the_server_while_open(self, client, client_module, fake_server):
+        fake_server.responses = [requests.ConnectionError("refused"), _Response(503)]
+        for _ in range(2):
+            with pytest.raises(client_module.ServerUnavailable):
+                client.post("/validate-code", {})
+        assert client.available is False
+        with pytest.raises(client_module.ServerUnavailable, match="skipped"):
+            client.post("/validate-code", {})
+        assert len(fake_server.calls) == 2
+
+        time.sleep(0.06)
+        assert client.post("/validate-code", {}) == {"ok": True}
+        assert client.available is True
+
+    def test_client_errors_do_not_open_the_breaker(self, client, client_module, fake_server):
+        fake_server.responses = [_Response(422, {"detail": "bad"}), _Response(404, {"detail": "no"})]
+        for _ in range(2):
+            with pytest.raises(client_module.ServerUnavailable, match="rejected"):
+                client.post("/detect-zone", {})
+        assert client.available is True
+
+
+class TestGetCache:
+    """GET responses are cached for the TTL."""
+
+    def test_get_is_cached_per_path(self, client, fake_server):
+        fake_server.responses = [_Response(200, {"n": 1}), _Response(200, {"n": 2}), _Response(200, {"n": 3})]
+        assert client.get("/prompts/green") == {"n": 1}
+        assert client.get("/prompts/green") == {"n": 1}
+        assert client.get("/prompts/red") == {"n": 2}
+        assert fake_server.calls == [("GET", "http://mcp.test/prompts/green"), ("GET", "http://mcp.test/prompts/red")]
+        assert client.get("/prompts/green", ttl=0) == {"n": 3}
+
+    def test_entries_expire_and_clear(self, client, fake_server):
+        client.cache_ttl = 0.05
+        fake_server.responses = [_Response(200, {"n": 1}), _Response(200, {"n": 2}), _Response(200, {"n": 3})]
+        client.get("/health")
+        time.sleep(0.06)
+        assert client.get("/health") == {"n": 2}
+        client.clear_cache()
+        assert client.get("/health") == {"n": 3}
+
+    def test_failures_are_not_cached(self, client, client_module, fake_server):
+        fake_server.responses = [_Response(500), _Response(200, {"n": 1})]
+        with pytest.raises(client_module.ServerUnavailable):
+            client.get("/health")
+        assert client.get("/health") == {"n": 1}
@@ -0,0 +1,107 @@
+"""Tests for the SQLite experiment registry."""
+
+import json
+import shutil
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def registry_module(mcp_import):
+    return mcp_import("mcp.experiment_registry")
+
+
+@pytest.fixture
+def registry(registry_module, tmp_path):
+    return registry_module.ExperimentRegistry(tmp_path / "experiments.db")
+
+
+def _register(registry, n, zone="green"):
+    for i in range(n):
+        registry.register(f"exp_{i:03d}", {
+            "name": f"Exp {i:03d}", "zone": zone, "created": f"2024-01-01T00:{i // 60:02d}:{i % 60:02d}",
+        }, f"/tmp/exp_{i:03d}")
+
+
+class TestPaging:
+    """page() and count() with filters and ordering."""
+
+    def test_newest_first_pages(self, registry):
+        _register(registry, 120)
+        first = registry.page(offset=0, limit=50)
+        second = registry.page(offset=50, limit=50)
+        last = registry.page(offset=100, limit=50)
+        assert [e["slug"] for e in first[:2]] == ["exp_119", "exp_118"]
+        assert (len(first), len(second), len(last)) == (50, 50, 20)
+        assert len({e["slug"] for e in first + second + last}) == 120
+        assert registry.count() == 120
+
+    def test_name_order_and_filters(self, registry):
+        _register(registry, 5)
+        registry.register("churn", {"name": "churn model", "zone": "YELLOW", "created": "2023-01-01"}, "/tmp/churn")
+        assert registry.page(order="name")[0]["name"] == "churn model"
+        assert [e["slug"] for e in registry.page(zone="yellow")] == ["churn"]
+        assert registry.count(zone="yellow") == 1
+        assert registry.count(name="EXP 00") == 5
+        assert registry.page(name="churn")[0]["path"] == "/tmp/churn"
+
+    def test_limit_is_clamped(self, registry, registry_module):
+        _register(registry, 3)
+        assert len(registry.page(limit=0)) == 1
+        assert len(registry.page(limit=10**6, offset=-5)) == 3
+        assert registry_module.MAX_PAGE >= 50
+
+    def test_get_and_reregister(self, registry):
+        registry.register("a", {"name": "A", "created": "1"}, "/x")
+        registry.register("a", {"name": "A2", "created": "2"}, "/y")
+        assert registry.get("a")["name"] == "A2"
+        assert registry.get("a")["path"] == "/y"
+        assert registry.get("missing") is None
+        assert registry.count() == 1
+
+
+class TestSync:
+    """sync() mirrors experiment directories created outside the server."""
+
+    def test_picks_up_and_drops_directories(self, registry, tmp_path):
+        experiments = tmp_path / "experiments"
+        (experiments / "manual").mkdir(parents=True)
+        (experiments / "manual" / "manifest.json").write_text(json.dumps({"name": "Manual run", "zone": "yellow"}))
+        (experiments / "broken").mkdir()
+        (experiments / "broken" / "manifest.json").write_text("{not json")
+        (experiments / "README.md").write_text("not an experiment")
+        assert registry.sync(experiments) == 2
+        assert registry.get("manual")["name"] == "Manual run"
+        assert registry.get("broken")["name"] == "broken"
+
+        shutil.rmtree(experiments / "broken")
+        registry.sync(experiments, force=True)
+        assert registry.get("broken") is None
+        assert registry.count() == 1
+
+    def test_unchanged_directory_is_not_rescanned(self, registry, tmp_path, monkeypatch):
+        experiments = tmp_path / "experiments"
+        (experiments / "one").mkdir(parents=True)
+        registry.sync(experiments)
+        monkeypatch.setattr("os.scandir", lambda *a: pytest.fail("rescanned"))
+        assert registry.sync(experiments) == 0
+
+    def test_missing_directory(self, registry, tmp_path):
+        assert registry.sync(tmp_path / "nope") == 0
+
+
+class TestExperimentsEndpoint:
+    """/init-experiment registers and /experiments pages the registry."""
+
+    def test_init_then_list(self, server):
+        client = TestClient(server.app)
+        for name in ("Iris baseline", "Churn model", "Iris tuned"):
+            assert client.post("/init-experiment", json={"name": name}).status_code == 200
+        assert (server.EXPERIMENTS_DIR / "iris_baseline" / "manifest.json").exists()
+
+        body = client.get("/experiments", params={"limit": 2}).json()
+        assert body["total"] == 3
+        assert [e["name"] for e in body["experiments"]] == ["Iris tuned", "Churn model"]
+        body = client.get("/experiments", params={"name": "iris", "order": "name"}).json()
+        assert [e["name"] for e in body["experiments"]] == ["Iris baseline", "Iris tuned"]
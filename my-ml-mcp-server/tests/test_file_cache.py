@@ -0,0 +1,71 @@
+"""Tests for the async handlers' file-backed caches."""
+
+import asyncio
+import inspect
+import os
+import threading
+
+from fastapi.routing import APIRoute
+
+
+def _bump(path, text):
+    """Rewrite path with a later mtime, so the change is visible even on coarse clocks."""
+    st = path.stat()
+    path.write_text(text)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+class TestFileCache:
+    """_FileCache stats at most once per STAT_INTERVAL and reloads on change."""
+
+    def test_reload_only_after_interval_and_change(self, server, tmp_path, monkeypatch):
+        path = tmp_path / "value.txt"
+        path.write_text("one")
+        loads = []
+        cache = server._FileCache(lambda: path, lambda p: loads.append(p) or p.read_text())
+        monkeypatch.setattr(server, "STAT_INTERVAL", 60.0)
+        assert cache.get() == "one"
+        _bump(path, "two")
+        assert cache.get() == "one"  # within the interval: memory only
+
+        monkeypatch.setattr(server, "STAT_INTERVAL", 0.0)
+        assert cache.get() == "two"
+        assert cache.get() == "two"
+        assert len(loads) == 2  # unchanged stamp: no reload
+
+    def test_missing_file_then_created(self, server, tmp_path, monkeypatch):
+        monkeypatch.setattr(server, "STAT_INTERVAL", 0.0)
+        path = tmp_path / "later.txt"
+        cache = server._FileCache(lambda: path, lambda p: p.read_text() if p.exists() else None)
+        assert cache.get() is None
+        path.write_text("here")
+        assert cache.get() == "here"
+
+    def test_replace_installs_a_written_value(self, server, tmp_path, monkeypatch):
+        monkeypatch.setattr(server, "STAT_INTERVAL", 0.0)
+        path = tmp_path / "value.txt"
+        path.write_text("one")
+        cache = server._FileCache(lambda: path, lambda p: ("loaded", p.read_text()))
+        cache.get()
+        with cache.lock:
+            path.write_text("three")
+            cache.replace(("written", "three"))
+        assert cache.get() == ("written", "three")  # stamp matches the write: no reload
+
+    def test_aget_reloads_on_the_io_pool(self, server, tmp_path, monkeypatch):
+        monkeypatch.setattr(server, "STAT_INTERVAL", 0.0)
+        path = tmp_path / "value.txt"
+        path.write_text("one")
+        threads = []
+        cache = server._FileCache(lambda: path, lambda p: threads.append(threading.current_thread().name) or 1)
+        assert asyncio.run(cache.aget()) == 1
+        assert threads and threads[0].startswith("mcp-io")
+
+
+class TestAsyncHandlers:
+    """Every route is async, so blocking work has to go through _offload."""
+
+    def test_all_routes_are_coroutines(self, server):
+        routes = [r for r in server.app.routes if isinstance(r, APIRoute)]
+        assert routes
+        assert [r.path for r in routes if not inspect.iscoroutinefunction(r.endpoint)] == []
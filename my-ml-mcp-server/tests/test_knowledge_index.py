@@ -0,0 +1,136 @@
+"""Tests for the knowledge-graph index and the server's add path."""
+
+import json
+import threading
+
+import pytest
+
+EXPERIMENTS = [
+    {"name": "iris random forest", "dataset": "iris", "model": "RandomForestClassifier",
+     "metrics": {"accuracy": 0.95, "f1": 0.94}},
+    {"name": "iris logistic baseline", "dataset": "iris", "model": "LogisticRegression",
+     "metrics": {"accuracy": 0.88}},
+    {"name": "churn gradient boosting", "dataset": "churn", "model": "GradientBoosting",
+     "metrics": {"accuracy": 0.91, "auc": 0.97}},
+]
+
+
+@pytest.fixture
+def index(mcp_import):
+    return mcp_import("mcp.knowledge_index").KnowledgeIndex(EXPERIMENTS)
+
+
+class TestSearch:
+    """BM25 ranking and field filters."""
+
+    def test_free_text_ranks_best_match_first(self, index):
+        found = index.search("random forest")
+        assert found["total"] == 1
+        assert found["results"][0]["name"] == "iris random forest"
+
+        found = index.search("iris forest")
+        assert [r["name"] for r in found["results"]][:2] == ["iris random forest", "iris logistic baseline"]
+        assert found["scores"][0] > found["scores"][1] > 0
+
+    def test_field_token_filter(self, index):
+        found = index.search("dataset:churn")
+        assert [r["name"] for r in found["results"]] == ["churn gradient boosting"]
+        assert index.search("model:iris")["total"] == 0
+
+    def test_numeric_filters_match_plural_field_segments(self, index):
+        assert {r["name"] for r in index.search("metric>0.9")["results"]} == {
+            "iris random forest", "churn gradient boosting"
+        }
+        assert [r["name"] for r in index.search("accuracy<=0.88")["results"]] == ["iris logistic baseline"]
+        assert index.search("accuracy>0.95")["total"] == 0
+        assert index.search("accuracy>=0.95")["total"] == 1
+
+    def test_filters_and_text_combine(self, index):
+        found = index.search("dataset:iris accuracy>0.9 forest")
+        assert found["total"] == 1
+        assert found["results"][0]["model"] == "RandomForestClassifier"
+
+    def test_filters_only_returns_newest_first(self, index):
+        assert [r["name"] for r in index.search("dataset:iris")["results"]] == [
+            "iris logistic baseline", "iris random forest"
+        ]
+
+    def test_limit(self, index):
+        found = index.search("accuracy>0", limit=1)
+        assert found["total"] == 3
+        assert len(found["results"]) == 1
+
+
+class TestWithAdded:
+    """Copy-on-write adds."""
+
+    def test_matches_a_full_build_and_leaves_the_original(self, index, mcp_import):
+        knowledge_index = mcp_import("mcp.knowledge_index")
+        extra = {"name": "iris svm", "dataset": "iris", "metrics": {"accuracy": 0.97}}
+        added = index.with_added(extra)
+        rebuilt = knowledge_index.KnowledgeIndex(EXPERIMENTS + [extra])
+        for query in ("iris", "dataset:iris accuracy>0.9", "metric>=0.95 svm", "forest"):
+            assert added.search(query) == rebuilt.search(query)
+        assert len(index) == 3
+        assert index.search("svm")["total"] == 0
+        assert index.search("accuracy>0.96")["total"] == 0
+
+    def test_only_the_new_document_is_tokenized(self, index, mcp_import, monkeypatch):
+        knowledge_index = mcp_import("mcp.knowledge_index")
+        entries = knowledge_index._entries
+        seen = []
+
+        def counting(experiment):
+            seen.append(experiment)
+            return entries(experiment)
+
+        monkeypatch.setattr(knowledge_index, "_entries", counting)
+        extra = {"name": "iris svm", "dataset": "iris"}
+        added = index.with_added(extra)
+        assert seen == [extra]
+        assert added._postings["forest"] is index._postings["forest"]  # untouched postings are shared
+        assert added._postings["iris"] is not index._postings["iris"]
+
+
+class TestAddExperiment:
+    """The server appends to experiments.json and swaps in a new index."""
+
+    def test_add_does_not_reindex_existing_experiments(self, server, mcp_import, monkeypatch):
+        for experiment in EXPERIMENTS[:2]:
+            server._add_experiment(experiment)
+        knowledge_index = mcp_import("mcp.knowledge_index")
+        entries = knowledge_index._entries
+        seen = []
+        monkeypatch.setattr(knowledge_index, "_entries", lambda exp: seen.append(exp) or entries(exp))
+        assert server._add_experiment(EXPERIMENTS[2]) == (2, 3)
+        assert seen == [EXPERIMENTS[2]]
+        assert server._knowledge_index().search("dataset:churn")["total"] == 1
+
+    def test_add_swaps_in_a_new_index(self, server):
+        before = server._knowledge_index()
+        doc_id, total = server._add_experiment(EXPERIMENTS[0])
+        after = server._knowledge_index()
+        assert (doc_id, total) == (0, 1)
+        assert after is not before
+        assert len(before) == 0  # the index readers held is untouched
+        assert after.search("forest")["total"] == 1
+
+    def test_add_keeps_edits_made_on_disk(self, server):
+        server._knowledge_index()  # cache the empty file
+        path = server.KNOWLEDGE_DIR / "experiments.json"
+        path.write_text(json.dumps(EXPERIMENTS[:2]))
+        doc_id, total = server._add_experiment(EXPERIMENTS[2])
+        assert (doc_id, total) == (2, 3)
+        assert [e["name"] for e in json.loads(path.read_text())] == [e["name"] for e in EXPERIMENTS]
+
+    def test_concurrent_adds_are_not_lost(self, server):
+        threads = [
+            threading.Thread(target=server._add_experiment, args=({"name": f"run {i}", "metrics": {"accuracy": i / 10}},))
+            for i in range(10)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(json.loads((server.KNOWLEDGE_DIR / "experiments.json").read_text())) == 10
+        assert server._knowledge_index().search("accuracy>=0")["total"] == 10
@@ -0,0 +1,75 @@
+"""Tests for /suggest-pattern's prompt tag index."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+PROMPTS = [
+    {"name": "Train", "text": "train " * 100, "tags": ["training", "mlflow"]},
+    {"name": "Features", "text": "features", "tags": ["features", "pipeline"]},
+    {"name": "Card", "text": "card", "tags": ["model-card", "docs"]},
+    {"name": "Untagged", "text": "misc"},
+]
+
+
+@pytest.fixture
+def prompt_index(mcp_import):
+    return mcp_import("mcp.prompt_index")
+
+
+@pytest.fixture
+def index(prompt_index):
+    return prompt_index.PromptIndex(PROMPTS)
+
+
+def _names(suggestions):
+    return [s["name"] for s in suggestions]
+
+
+class TestRanking:
+    """Tags match tasks by word, ranked by how many matched."""
+
+    def test_stemmed_word_matches(self, index):
+        assert _names(index.suggest("Train a model")) == ["Train"]
+        assert _names(index.suggest("build the feature pipelines")) == ["Features"]
+
+    def test_more_matched_tags_rank_first(self, index):
+        assert _names(index.suggest("pipeline for training with mlflow")) == ["Train", "Features"]
+        assert _names(index.suggest("docs for the pipeline features")) == ["Features", "Card"]
+
+    def test_multi_word_tag_needs_every_word(self, index):
+        assert _names(index.suggest("write a model card")) == ["Card"]
+        assert _names(index.suggest("pick a model")) == _names(PROMPTS[:3])  # fallback
+
+    def test_no_substring_matches(self, index, prompt_index):
+        assert _names(index.suggest("retrain")) == _names(PROMPTS[: prompt_index.FALLBACK_COUNT])
+
+    def test_previews_are_truncated(self, index, prompt_index):
+        preview = index.suggest("training")[0]["text"]
+        assert preview == ("train " * 100)[: prompt_index.PREVIEW_CHARS] + "..."
+
+
+class TestMemo:
+    """Results for recent tasks are kept in an LRU."""
+
+    def test_repeat_task_is_not_reranked(self, index, monkeypatch):
+        first = index.suggest("Training with MLflow")
+        monkeypatch.setattr(index, "_rank", lambda task: pytest.fail("re-ranked"))
+        assert index.suggest("  training with mlflow ") is first
+
+    def test_least_recently_used_is_evicted(self, index, prompt_index, monkeypatch):
+        monkeypatch.setattr(prompt_index, "MEMO_SIZE", 2)
+        index.suggest("a")
+        index.suggest("b")
+        index.suggest("a")  # refresh a
+        index.suggest("c")  # evicts b
+        assert list(index._memo) == ["a", "c"]
+
+
+class TestSuggestEndpoint:
+    """/suggest-pattern serves the shipped prompt files."""
+
+    def test_shipped_yellow_prompts(self, server):
+        body = TestClient(server.app).post(
+            "/suggest-pattern", json={"task": "training with mlflow", "zone": "yellow"}
+        ).json()
+        assert body["suggestions"][0]["name"] == "Train with Pattern"
@@ -0,0 +1,161 @@
+"""Tests for the repository scan and the /scan-repo endpoint."""
+
+import os
+import shutil
+
+import pytest
+from fastapi.testclient import TestClient
+
+TRAIN = "from sklearn.ensemble import RandomForestClassifier\nmodel = RandomForestClassifier()\n"
+TRACKED = "import mlflow\nmodel = RandomForestClassifier(random_state=42)\nmlflow.log_params({})\n"
+
+
+@pytest.fixture
+def validated():
+    """Zones validate_code ran for during the test."""
+    return []
+
+
+@pytest.fixture
+def scan(server, mcp_import, validated, tmp_path, monkeypatch):
+    """mcp.repo_scan with its own zone_rules.yaml, cache dir and a counted validate_code."""
+    repo_scan = mcp_import("mcp.repo_scan")
+    governance = tmp_path / "governance"
+    governance.mkdir()
+    shutil.copy(server.APP_DIR / "governance" / "zone_rules.yaml", governance / "zone_rules.yaml")
+    for module in (server, repo_scan):
+        monkeypatch.setattr(module, "GOVERNANCE_DIR", governance)
+    monkeypatch.setattr(server, "STAT_INTERVAL", 0.0)
+    monkeypatch.setattr(server, "_zone_rules_cache", server._FileCache(
+        lambda: server.GOVERNANCE_DIR / "zone_rules.yaml",
+        lambda _path: server.ZoneMatcher(server._read_zone_rules()),
+    ))
+    monkeypatch.setattr(repo_scan, "SCAN_CACHE_DIR", tmp_path / "scan_cache")
+
+    def counting_validate(code, zone):
+        validated.append(zone)
+        return server.validate_code(code, zone)
+
+    monkeypatch.setattr(repo_scan, "validate_code", counting_validate)
+    return repo_scan
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    (root / "src" / "models").mkdir(parents=True)
+    (root / "src" / "models" / "train.py").write_text(TRAIN)
+    (root / "src" / "features.py").write_text(TRACKED)
+    (root / "notebooks").mkdir()
+    (root / "notebooks" / "eda.ipynb").write_text('{"cells": []}')
+    return root
+
+
+class TestScanCache:
+    """Results are reused by stamp, then by content hash."""
+
+    def test_rescan_reuses_every_result(self, scan, validated, project):
+        first = scan.scan_repo(project)
+        assert (first["files_scanned"], first["files_validated"], first["files_cached"]) == (3, 3, 0)
+        assert len(validated) == 2  # GREEN files are not validated
+        second = scan.scan_repo(project)
+        assert (second["files_validated"], second["files_cached"]) == (0, 3)
+        assert len(validated) == 2
+        assert second["files"] == first["files"]
+
+    def test_cache_is_kept_outside_the_scanned_tree(self, scan, project, tmp_path):
+        scan.scan_repo(project)
+        assert not [p for p in project.rglob("*") if "cache" in p.name]
+        assert scan.cache_path_for(project.resolve()).exists()
+        assert scan.cache_path_for(project.resolve()).parent == tmp_path / "scan_cache"
+
+    def test_touched_file_is_hashed_not_revalidated(self, scan, validated, project):
+        scan.scan_repo(project)
+        train = project / "src" / "models" / "train.py"
+        st = train.stat()
+        os.utime(train, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        report = scan.scan_repo(project)
+        assert (report["files_validated"], report["files_cached"]) == (0, 3)
+        assert len(validated) == 2
+
+        train.write_text(TRACKED)
+        report = scan.scan_repo(project)
+        assert (report["files_validated"], report["files_cached"]) == (1, 2)
+        assert report["invalid_files"] == 0
+
+    def test_rules_change_invalidates_the_cache(self, scan, project):
+        scan.scan_repo(project)
+        rules = scan.GOVERNANCE_DIR / "zone_rules.yaml"
+        rules.write_text(rules.read_text() + "\n# tightened\n")
+        report = scan.scan_repo(project)
+        assert (report["files_validated"], report["files_cached"]) == (3, 0)
+
+    def test_workers_are_clamped_to_cpu_count(self, scan, project, monkeypatch):
+        for i in range(scan.INLINE_THRESHOLD):
+            (project / "src" / f"mod_{i}.py").write_text(TRACKED)
+        pools = []
+
+        class InlinePool:
+            def __init__(self, max_workers):
+                pools.append(max_workers)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def map(self, fn, jobs, chunksize=1):
+                return map(fn, jobs)
+
+        monkeypatch.setattr(scan, "ProcessPoolExecutor", InlinePool)
+        monkeypatch.setattr(scan.os, "cpu_count", lambda: 2)
+        scan.scan_repo(project, workers=500)
+        assert pools == [2]
+
+
+class TestSarif:
+    """SARIF 2.1.0 output."""
+
+    def test_violations_become_results(self, scan, project):
+        sarif = scan.to_sarif(scan.scan_repo(project))
+        assert sarif["version"] == "2.1.0"
+        run = sarif["runs"][0]
+        assert run["originalUriBaseIds"]["SRCROOT"]["uri"] == project.resolve().as_uri() + "/"
+        by_rule = {r["ruleId"]: r for r in run["results"]}
+        assert set(by_rule) == {"yellow/random_state", "yellow/mlflow"}
+        result = by_rule["yellow/random_state"]
+        assert result["level"] == "warning"
+        assert result["locations"][0]["physicalLocation"]["artifactLocation"]["uri"] == "src/models/train.py"
+        assert {r["id"] for r in run["tool"]["driver"]["rules"]} == set(by_rule)
+
+
+class TestScanEndpoint:
+    """/scan-repo only reads allowed roots."""
+
+    def test_root_outside_the_allowlist_is_rejected(self, scan, server, project, tmp_path, monkeypatch):
+        monkeypatch.setattr(server, "SCAN_ROOTS", [tmp_path / "elsewhere"])
+        resp = TestClient(server.app).post("/scan-repo", json={"root": str(project)})
+        assert resp.status_code == 403
+
+    def test_symlink_out_of_the_allowlist_is_rejected(self, scan, server, project, tmp_path, monkeypatch):
+        allowed = tmp_path / "allowed"
+        allowed.mkdir()
+        (allowed / "link").symlink_to(project, target_is_directory=True)
+        monkeypatch.setattr(server, "SCAN_ROOTS", [allowed])
+        resp = TestClient(server.app).post("/scan-repo", json={"root": str(allowed / "link")})
+        assert resp.status_code == 403
+
+    def test_allowed_root_is_scanned_with_the_cache_outside_it(self, scan, server, project, tmp_path, monkeypatch):
+        monkeypatch.setattr(server, "SCAN_ROOTS", [tmp_path])
+        monkeypatch.setattr(server, "SCAN_CACHE_DIR", tmp_path / "server_cache")
+        resp = TestClient(server.app).post("/scan-repo", json={"root": str(project), "format": "sarif"})
+        assert resp.status_code == 200
+        assert resp.json()["version"] == "2.1.0"
+        assert list((tmp_path / "server_cache").iterdir())
+        assert not [p for p in project.rglob("*") if "cache" in p.name]
+
+    def test_missing_directory_is_404(self, scan, server, tmp_path, monkeypatch):
+        monkeypatch.setattr(server, "SCAN_ROOTS", [tmp_path])
+        resp = TestClient(server.app).post("/scan-repo", json={"root": str(tmp_path / "missing")})
+        assert resp.status_code == 404
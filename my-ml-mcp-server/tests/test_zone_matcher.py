@@ -0,0 +1,87 @@
+"""Tests for the compiled zone matcher and /detect-zone/batch."""
+
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+PATH_TEMPLATES = [
+    "src/{name}.py", "src/api/{name}.py", "src/models/train_{name}.py", "models/{name}.pkl",
+    "notebooks/{name}.ipynb", "experiments/{name}/run.py", "app/serve/{name}.py", "deploy/{name}.yaml",
+    "pipelines/{name}.py", "lib/pipeline_{name}.py", "sandbox/{name}.py", "scratch/{name}.py",
+    "services/production/{name}.py", "inference_{name}.py", "tools/inference/{name}.py", "README.md",
+    "./src/{name}.py", "/abs/src/api/{name}.py", "src\\\\models\\\\{name}.py", "features/{name}.ipynb",
+]
+
+EXTRA_RULES = {
+    "zones": {
+        "red": {"file_patterns": ["*.prod.py", "release/*", "[abc]*/deploy*"]},
+        "yellow": {"file_patterns": ["**/lib/**", "?rc/*.py"]},
+        "green": {"file_patterns": ["**/*"]},
+    }
+}
+
+
+def _old_detect(server, rules, file_path):
+    """detect_zone as it was before the matcher was compiled."""
+    zones = rules.get("zones", {})
+    for zone_name in ["red", "yellow", "green"]:
+        patterns = zones.get(zone_name, {}).get("file_patterns", [])
+        if patterns and server._path_matches_any(file_path, patterns):
+            return zone_name.upper()
+    return "GREEN"
+
+
+def _paths():
+    rng = random.Random(7)
+    return [rng.choice(PATH_TEMPLATES).format(name=f"m{i}") for i in range(2000)] + [
+        "a.prod.py", "release/x.py", "b/deploy.py", "deep/lib/x.py", "src/x.py", "srcx/y.py", "",
+    ]
+
+
+class TestZoneMatcher:
+    """The compiled matcher agrees with per-pattern fnmatch."""
+
+    @pytest.mark.parametrize("which", ["shipped", "extra"])
+    def test_agrees_with_old_matcher(self, server, which):
+        rules = server._read_zone_rules() if which == "shipped" else EXTRA_RULES
+        matcher = server.ZoneMatcher(rules)
+        for path in _paths():
+            assert matcher.detect(path) == _old_detect(server, rules, path), path
+
+    def test_red_wins_over_yellow(self, server):
+        matcher = server.ZoneMatcher(server._read_zone_rules())
+        assert matcher.detect("src/api/predict.py") == "RED"
+        assert matcher.detect("src/models/train.py") == "YELLOW"
+        assert matcher.detect("notebooks/eda.ipynb") == "GREEN"
+
+    def test_empty_rules_default_to_green(self, server):
+        assert server.ZoneMatcher({}).detect("src/api/predict.py") == "GREEN"
+
+
+class TestDetectZoneBatch:
+    """/detect-zone/batch classifies paths and allowed directory trees."""
+
+    def test_paths_and_root(self, server, tmp_path, monkeypatch):
+        root = tmp_path / "project"
+        (root / "src" / "api").mkdir(parents=True)
+        (root / "src" / "api" / "predict.py").write_text("")
+        (root / "notebooks").mkdir()
+        (root / "notebooks" / "eda.ipynb").write_text("{}")
+        monkeypatch.setattr(server, "SCAN_ROOTS", [tmp_path])
+        resp = TestClient(server.app).post(
+            "/detect-zone/batch", json={"file_paths": ["src/models/train.py"], "root": str(root)}
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert [(r["file_path"], r["zone"]) for r in body["results"]] == [
+            ("src/models/train.py", "YELLOW"), ("notebooks/eda.ipynb", "GREEN"), ("src/api/predict.py", "RED"),
+        ]
+        assert body["counts"] == {"RED": 1, "YELLOW": 1, "GREEN": 1}
+
+    def test_root_outside_the_allowlist_is_rejected(self, server, tmp_path, monkeypatch):
+        monkeypatch.setattr(server, "SCAN_ROOTS", [tmp_path / "allowed"])
+        resp = TestClient(server.app).post("/detect-zone/batch", json={"root": str(tmp_path)})
+        assert resp.status_code == 403
+        resp = TestClient(server.app).post("/detect-zone/batch", json={"root": str(tmp_path / "allowed" / "..")})
+        assert resp.status_code == 403
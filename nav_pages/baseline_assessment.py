@@ -12,6 +12,7 @@ import streamlit as st
 import pandas as pd
 
 from shared import MATURITY_COLORS, ZONE_COLORS, ROLE_COLORS
+from entropy_tracker import calculate_entropy
 
 st.title("Current State: M2 (Shallow Adoption)")
 st.markdown(f"<h4 style='color: {MATURITY_COLORS['M2']};'>The M2 Trap: Activity Without Governance</h4>", unsafe_allow_html=True)
@@ -36,17 +37,33 @@ with metric_cols[3]:
 st.header("Architectural Drift Metrics", divider=True)
 st.caption("CDI, Layer Violations, Churn-Complexity, Bus Factor (from calculate_architectural_drift)")
 
-if st.button("Calculate Architectural Drift", key="calc_drift"):
-    with st.spinner("Analyzing git history..."):
-        try:
-            from architectural_drift import calculate_architectural_drift
-            drift = calculate_architectural_drift(repo_path=str(_repo), days=90)
-            st.session_state.drift_result = drift
-        except Exception as e:
-            st.error(f"Could not calculate drift: {e}")
-
-if "drift_result" in st.session_state:
-    d = st.session_state.drift_result
+
+@st.cache_resource
+def _drift_provider():
+    from architectural_drift import DriftProvider
+    return DriftProvider(repo_path=_repo, days=90)
+
+
+drift_state = _drift_provider().get()
+d = drift_state["result"]
+drift_retry = f" (retrying automatically in {drift_state['retry_in']}s)" if drift_state["retry_in"] else ""
+refresh_cols = st.columns([3, 1])
+with refresh_cols[0]:
+    if drift_state["refreshing"]:
+        st.info("Refreshing drift metrics for HEAD "
+                f"`{(drift_state['current_head'] or 'unknown')[:8]}` in the background...")
+    elif drift_state["error"] and d is not None:
+        st.error(f"Could not recalculate drift: {drift_state['error']}{drift_retry}")
+    elif drift_state["head"]:
+        st.caption(f"Snapshot for HEAD `{drift_state['head'][:8]}`")
+with refresh_cols[1]:
+    if st.button("Recalculate Drift", key="calc_drift"):
+        _drift_provider().refresh(force=True)
+        st.rerun()
+    if drift_state["refreshing"] and st.button("Check for Update", key="check_drift"):
+        st.rerun()
+
+if d is not None:
     drift_cols = st.columns(4)
     with drift_cols[0]:
         cdi = d["metrics"]["cyclical_dependency_index"]
@@ -72,8 +89,13 @@ if "drift_result" in st.session_state:
         | Churn | < 100 | 100-500 | > 500 |
         | Bus Factor | 3+ | 2 | 1 |
         """)
+elif drift_state["error"] and not drift_state["refreshing"]:
+    st.error(f"Could not calculate the first drift snapshot: {drift_state['error']}{drift_retry}")
+    if st.button("Retry Now", key="retry_drift"):
+        _drift_provider().refresh(force=True)
+        st.rerun()
 else:
-    st.info("Click **Calculate Architectural Drift** to analyze your codebase (uses git history).")
+    st.info("Analyzing git history for the first drift snapshot; results appear here once it finishes.")
 
 # ---------------------------------------------------------------------------
 # Metrics Reference Guide (Educational Dropdown)
@@ -403,7 +425,7 @@ with st.expander("Metrics Definitions & Calculations Reference", expanded=False)
     with sim_col4:
         premature = st.slider("Premature Acceptance %", 0, 100, 41, key="sim_premature")
 
-    calculated_entropy = round((bloat * 0.25) + (rework * 0.25) + (reverts * 0.20) + (premature * 0.30), 1)
+    calculated_entropy = round(calculate_entropy(bloat, rework, reverts, premature), 1)
     sim_result_col1, sim_result_col2 = st.columns([1, 2])
     with sim_result_col1:
         st.metric("Calculated Entropy", f"{calculated_entropy}/100", delta=None)
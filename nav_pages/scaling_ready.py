@@ -9,6 +9,7 @@ import streamlit as st
 import pandas as pd
 
 from shared import MATURITY_COLORS, ZONE_COLORS, ROLE_COLORS
+from entropy_tracker import calculate_entropy
 
 st.title("Target State: M3 (Agentic with Guardrails)")
 st.markdown(f"<h4 style='color: {MATURITY_COLORS['M3']};'>Velocity with Stability: The Three Roles Working</h4>", unsafe_allow_html=True)
@@ -86,7 +87,7 @@ with calc_cols[2]:
 with calc_cols[3]:
     premature = st.slider("Premature Acceptance %", 0, 50, 8, help="M3 target: <10%")
 
-entropy = (bloat * 0.25) + (rework * 0.25) + (reverts * 0.20) + (premature * 0.30)
+entropy = calculate_entropy(bloat, rework, reverts, premature)
 
 st.metric("Calculated Entropy", f"{entropy:.1f}/100")
 
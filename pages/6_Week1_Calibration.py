@@ -2,15 +2,21 @@
 Week 1 Calibration Report - Demo
 Evidence-based data pipeline: violations.jsonl + scaffolding_effectiveness.jsonl → calibration dashboard
 """
+import os
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+_repo = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo))
 
 import streamlit as st
 import pandas as pd
 import json
 from shared import render_sidebar
-from data.week1_fake_data import generate_violations, generate_scaffolding
+from calibration_metrics import SCAFFOLDING_DEFAULTS, VIOLATION_DEFAULTS, compute_calibration, to_frame
+from data.week1_loader import load_week1_records, source_versions
+from entropy_tracker import calculate_entropy
+
+GOV_DIR = Path(os.environ.get("GOVERNANCE_REPO_PATH", str(_repo))) / ".ai-governance"
 
 st.set_page_config(
     page_title="Week 1 Calibration Report",
@@ -109,38 +115,20 @@ st.divider()
 st.markdown("""
 Week 0 is subjective assessment. Week 1 is objective telemetry. By Day 4, I have enough signal to tune the enforcement engine.
 
-This demo uses **fake data** to simulate the MCP telemetry pipeline. In production, data comes from `.ai-governance/violations.jsonl` and `scaffolding_effectiveness.jsonl`.
+Data comes from `.ai-governance/violations.jsonl` and `scaffolding_effectiveness.jsonl` when present; otherwise the page falls back to **fake data** that simulates the MCP telemetry pipeline. Parsing and metrics are cached per file version, so widget interactions do not recompute them.
 """)
 
 st.divider()
 
 # =============================================================================
-# Step 1: Data Ingestion (simulated)
+# Data layer: parse telemetry and compute metrics once per data version
 # =============================================================================
-with st.expander("Step 1: Data Ingestion (Day 3 of Week 1)", expanded=True):
-    st.markdown("*\"By Day 3, the MCP server has generated roughly 100-150 log entries. I pull the raw telemetry files into a Python analysis notebook.\"*")
-
-    violations = generate_violations()
-    scaffolding = generate_scaffolding()
-
-    df_violations = pd.DataFrame(violations)
-    df_scaffolding = pd.DataFrame(scaffolding)
-
-    col1, col2 = st.columns(2)
-    with col1:
-        st.metric("Violation events loaded", len(df_violations))
-        st.dataframe(df_violations.head(10), use_container_width=True, hide_index=True)
-    with col2:
-        st.metric("Scaffolding interactions loaded", len(df_scaffolding))
-        st.dataframe(df_scaffolding.head(10), use_container_width=True, hide_index=True)
-
-st.divider()
-
-# =============================================================================
-# Step 2: Pattern Analysis
-# =============================================================================
-with st.expander("Step 2: Pattern Analysis (Using Cursor as Assistant)", expanded=True):
-    st.markdown("*\"I use Cursor as my data analysis partner. I ask it to identify patterns—which roles hit complexity limits, which file paths are attempted but blocked.\"*")
+@st.cache_data(show_spinner="Loading Week 1 telemetry...", max_entries=4)
+def load_calibration(gov_dir: str, versions: tuple) -> dict:
+    """Load telemetry and compute all calibration metrics. `versions` (file mtimes) keys the cache."""
+    violations, scaffolding, source = load_week1_records(gov_dir)
+    df_violations = to_frame(violations, VIOLATION_DEFAULTS)
+    df_scaffolding = to_frame(scaffolding, SCAFFOLDING_DEFAULTS)
 
     # Pattern analysis
     false_positives = len(df_violations[(df_violations["zone"] == "Green") & (df_violations["allowed"] == False)])
@@ -163,6 +151,57 @@ with st.expander("Step 2: Pattern Analysis (Using Cursor as Assistant)", expande
         "recommended_novice_cap": 5 if complexity_success_5 >= 70 else 3,
     }
 
+    calibration_result = compute_calibration(df_violations, df_scaffolding)
+
+    return {
+        "source": source,
+        "violation_count": len(df_violations),
+        "scaffolding_count": len(df_scaffolding),
+        "violations_head": df_violations.head(10),
+        "scaffolding_head": df_scaffolding.head(10),
+        "analysis": analysis,
+        "fp_rate": fp_rate,
+        "week1_metrics": calibration_result["components"],
+        "by_role": calibration_result["by_role"],
+        "by_zone": calibration_result["by_zone"],
+        "role_complexity": df_violations.groupby(["user_role", "complexity_score"]).size().unstack(fill_value=0),
+        "zone_counts": df_violations["zone"].value_counts(),
+    }
+
+
+calibration = load_calibration(str(GOV_DIR), source_versions(GOV_DIR))
+analysis = calibration["analysis"]
+novice_red_attempts = analysis["novice_red_attempts"]
+explanation_read_rate = analysis["explanation_read_rate"]
+fp_rate = calibration["fp_rate"]
+
+# =============================================================================
+# Step 1: Data Ingestion
+# =============================================================================
+with st.expander("Step 1: Data Ingestion (Day 3 of Week 1)", expanded=True):
+    st.markdown("*\"By Day 3, the MCP server has generated roughly 100-150 log entries. I pull the raw telemetry files into a Python analysis notebook.\"*")
+    source_labels = {
+        "telemetry": f"Live MCP telemetry from `{GOV_DIR}`",
+        "mixed": f"Partly live telemetry from `{GOV_DIR}` (missing file filled with demo data)",
+        "demo": "Demo data (no telemetry files found)",
+    }
+    st.caption(source_labels[calibration["source"]])
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Violation events loaded", calibration["violation_count"])
+        st.dataframe(calibration["violations_head"], use_container_width=True, hide_index=True)
+    with col2:
+        st.metric("Scaffolding interactions loaded", calibration["scaffolding_count"])
+        st.dataframe(calibration["scaffolding_head"], use_container_width=True, hide_index=True)
+
+st.divider()
+
+# =============================================================================
+# Step 2: Pattern Analysis
+# =============================================================================
+with st.expander("Step 2: Pattern Analysis (Using Cursor as Assistant)", expanded=True):
+    st.markdown("*\"I use Cursor as my data analysis partner. I ask it to identify patterns—which roles hit complexity limits, which file paths are attempted but blocked.\"*")
     st.json(analysis)
 
 st.divider()
@@ -170,42 +209,16 @@ st.divider()
 # =============================================================================
 # Step 3: Entropy Calculation
 # =============================================================================
-def calculate_bloat_rate(df):
-    accepted = df[df["allowed"] == True]
-    if len(accepted) == 0:
-        return 0
-    return accepted["has_bloat"].sum() / len(accepted) * 100
-
-def calculate_rework_rate(df):
-    if len(df) == 0:
-        return 0
-    return len(df[df["touch_count"] >= 3]) / len(df) * 100
-
-def calculate_revert_rate(df):
-    if len(df) == 0:
-        return 0
-    return df["was_reverted"].sum() / len(df) * 100
-
-def calculate_premature_acceptance(df):
-    if len(df) == 0:
-        return 0
-    return len(df[df["time_to_accept"] < 5]) / len(df) * 100
-
 with st.expander("Step 3: Calculate Calibrated Entropy", expanded=True):
     st.markdown("*\"Now I calculate the actual entropy score from Week 1 data—not the self-reported 68 from the assessment, but the real behavioral metric.\"*")
 
-    week1_metrics = {
-        "bloat": calculate_bloat_rate(df_violations),
-        "rework": calculate_rework_rate(df_violations),
-        "reverts": calculate_revert_rate(df_scaffolding),
-        "premature": calculate_premature_acceptance(df_scaffolding),
-    }
+    week1_metrics = calibration["week1_metrics"]
 
-    entropy_score = (
-        week1_metrics["bloat"] * 0.25 +
-        week1_metrics["rework"] * 0.25 +
-        week1_metrics["reverts"] * 0.20 +
-        week1_metrics["premature"] * 0.30
+    entropy_score = calculate_entropy(
+        week1_metrics["bloat"],
+        week1_metrics["rework"],
+        week1_metrics["reverts"],
+        week1_metrics["premature"],
     )
     # Scale to 0-100 range (typical entropy)
     entropy_score = min(100, entropy_score * 1.2)
@@ -213,6 +226,14 @@ with st.expander("Step 3: Calculate Calibrated Entropy", expanded=True):
     st.metric("Week 1 Actual Entropy", f"{entropy_score:.1f}", delta=f"{entropy_score - 68:.1f} vs assessment estimate (68)")
     st.dataframe(pd.DataFrame([week1_metrics]).T.rename(columns={0: "Contribution %"}), use_container_width=True, hide_index=True)
 
+    breakdown_cols = st.columns(2)
+    with breakdown_cols[0]:
+        st.caption("Components by role")
+        st.dataframe(pd.DataFrame(calibration["by_role"]).T, use_container_width=True)
+    with breakdown_cols[1]:
+        st.caption("Components by zone (violation-based)")
+        st.dataframe(pd.DataFrame(calibration["by_zone"]).T, use_container_width=True)
+
 st.divider()
 
 # =============================================================================
@@ -223,7 +244,7 @@ st.markdown("*\"I publish this immediately to Streamlit so the client sees the e
 
 col1, col2, col3 = st.columns(3)
 with col1:
-    st.metric("Total Events Logged", len(df_violations))
+    st.metric("Total Events Logged", calibration["violation_count"])
     st.metric("Actual Entropy", f"{entropy_score:.1f}", delta=f"{entropy_score - 68:.1f} vs estimate")
 with col2:
     st.metric("Novice Red Zone Attempts", novice_red_attempts)
@@ -236,12 +257,10 @@ st.divider()
 
 # Visual pattern analysis
 st.subheader("Complexity Distribution by Role")
-role_complexity = df_violations.groupby(["user_role", "complexity_score"]).size().unstack(fill_value=0)
-st.bar_chart(role_complexity)
+st.bar_chart(calibration["role_complexity"])
 
 st.subheader("Zone Violation Summary")
-zone_counts = df_violations["zone"].value_counts()
-st.dataframe(zone_counts.rename("Count").to_frame(), use_container_width=True, hide_index=True)
+st.dataframe(calibration["zone_counts"].rename("Count").to_frame(), use_container_width=True, hide_index=True)
 
 st.divider()
 
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Quiz bank: versioned governance quizzes loaded from .ai-governance/quizzes/*.yaml.
+
+Each file is one quiz:
+
+    id: v2
+    version: 2
+    title: Zones and scaffolding
+    zone: yellow          # zone a pass unlocks
+    pass_score: 5         # default: every question
+    questions:
+      - q: "How does AI behave in the YELLOW zone?"
+        options: ["Suggest only", "Generate with validation", "Full autonomy", "Disabled"]
+        answer: b
+
+Everything a request needs is built when the bank loads:
+- Each answer key is compiled into one set of accepted responses per question.
+  A set holds the option letter and the option text, both lowercased, so
+  letter answers and LMS exports that carry the option text both grade.
+- The /quiz/questions and /quizzes bodies are serialized once, each with an
+  ETag. They never include the answer key.
+
+grade_many() grades an LMS export (JSON, or CSV via parse_submissions_csv) in
+one pass against the compiled keys, for QuizStore.record_many.
+
+The directory is stat'ed at most once per RELOAD_INTERVAL, and a changed file
+set or mtime rebuilds the bank. The compiled quizzes and listings are published
+together as one immutable tuple, swapped with a single assignment, so readers
+never take the lock and never see quizzes from one load with listings from
+another. When the directory is missing or holds no valid quiz, the built-in v1
+quiz is served so existing setups keep working.
+"""
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+RELOAD_INTERVAL = 1.0
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+BUILTIN_V1: dict[str, Any] = {
+    "id": "v1",
+    "version": 1,
+    "title": "Governance fundamentals",
+    "zone": "yellow",
+    "questions": [
+        {"q": "What zone requires Champion approval?", "options": ["Green", "Yellow", "Red", "All"], "answer": "b"},
+        {"q": "Where should tribal knowledge live?", "options": ["Confluence", "In the repo", "Slack", "Email"], "answer": "c"},
+        {"q": "What does VTCO stand for?", "options": ["Verb-Task-Constant-Outcome", "Value-Test-Code-Output", "Very-Tight-Change-Order", "None"], "answer": "a"},
+        {"q": "Novice in Yellow zone needs:", "options": ["Nothing", "Mentor", "Champion", "Quiz pass or mentor"], "answer": "d"},
+        {"q": "Entropy formula includes:", "options": ["Only bloat", "Bloat, rework, reverts, premature", "Only reverts", "Complexity"], "answer": "b"},
+    ],
+}
+
+
+def serialize(payload: Any) -> tuple[bytes, str]:
+    """(JSON body, strong ETag) for a response payload."""
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return body, '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+
+
+_EMPTY_LISTING = serialize({"quizzes": []})
+
+
+def _normalize(answer: Any) -> str:
+    return str(answer).strip().lower()
+
+
+@dataclass(frozen=True)
+class Quiz:
+    """One compiled quiz version."""
+
+    id: str
+    version: int
+    title: str
+    zone: str
+    pass_score: int
+    accepted: tuple[frozenset[str], ...]  # per question: normalized letter + option text
+    questions_response: tuple[bytes, str]  # pre-serialized /quiz/questions body + ETag
+
+    @property
+    def total(self) -> int:
+        return len(self.accepted)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "version": self.version,
+            "title": self.title,
+            "zone": self.zone,
+            "questions": self.total,
+            "pass_score": self.pass_score,
+        }
+
+    def grade(self, answers: list[Any]) -> tuple[int, bool]:
+        """(score, passed); answers must have one entry per question."""
+        score = sum(1 for a, ok in zip(answers, self.accepted) if _normalize(a) in ok)
+        return score, score >= self.pass_score
+
+
+def compile_quiz(data: dict[str, Any]) -> Quiz:
+    """Validate one quiz definition and precompute its answer key and questions body."""
+    quiz_id = str(data.get("id") or "").strip()
+    questions = data.get("questions") or []
+    if not quiz_id or not isinstance(questions, list) or not questions:
+        raise ValueError("a quiz needs an id and at least one question")
+    accepted = []
+    public = []
+    for n, q in enumerate(questions, 1):
+        options = [str(o) for o in (q.get("options") or [])] if isinstance(q, dict) else []
+        answer = _normalize(q.get("answer", "")) if isinstance(q, dict) else ""
+        if not options or answer not in LETTERS[: len(options)] or len(answer) != 1:
+            raise ValueError(f"question {n}: answer must be one of the option letters")
+        accepted.append(frozenset({answer, _normalize(options[LETTERS.index(answer)])}))
+        public.append({"q": str(q.get("q", "")), "options": options})
+    total = len(accepted)
+    pass_score = int(data.get("pass_score") or total)
+    if not 1 <= pass_score <= total:
+        raise ValueError(f"pass_score must be between 1 and {total}")
+    zone = str(data.get("zone") or "yellow").lower()
+    version = int(data.get("version") or 1)
+    title = str(data.get("title") or quiz_id)
+    return Quiz(
+        id=quiz_id,
+        version=version,
+        title=title,
+        zone=zone,
+        pass_score=pass_score,
+        accepted=tuple(accepted),
+        questions_response=serialize({
+            "quiz_id": quiz_id,
+            "version": version,
+            "title": title,
+            "zone": zone,
+            "pass_score": pass_score,
+            "questions": public,
+        }),
+    )
+
+
+class QuizBank:
+    """Compiled quizzes from a directory, rebuilt when its files change."""
+
+    def __init__(self, quiz_dir: str | Path) -> None:
+        self.quiz_dir = Path(quiz_dir)
+        # (quizzes by id, listing bodies by zone); replaced whole, never mutated
+        self._state: tuple[Mapping[str, Quiz], Mapping[str | None, tuple[bytes, str]]] = (
+            MappingProxyType({}), MappingProxyType({}),
+        )
+        self._stamps: dict[str, tuple[int, int]] | None = None
+        self._checked = -RELOAD_INTERVAL
+        self._lock = threading.Lock()
+        self.reload()
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        stamps: dict[str, tuple[int, int]] = {}
+        try:
+            with os.scandir(self.quiz_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith((".yaml", ".yml")) and entry.is_file():
+                        st = entry.stat()
+                        stamps[entry.path] = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            pass
+        return stamps
+
+    def reload(self, force: bool = False) -> bool:
+        """Rebuild the bank if any quiz file changed; returns whether it was rebuilt."""
+        with self._lock:
+            self._checked = time.monotonic()
+            stamps = self._scan()
+            if stamps == self._stamps and not force:
+                return False
+            quizzes: dict[str, Quiz] = {}
+            for path in sorted(stamps):
+                try:
+                    with open(path, encoding="utf-8") as f:
+                        quiz = compile_quiz(yaml.safe_load(f) or {})
+                except (OSError, yaml.YAMLError, ValueError, TypeError, AttributeError) as e:
+                    logger.warning("Skipping quiz %s: %s", path, e)
+                    continue
+                if quiz.id in quizzes:
+                    logger.warning("Duplicate quiz id %s in %s; keeping the first", quiz.id, path)
+                    continue
+                quizzes[quiz.id] = quiz
+            if not quizzes:
+                quizzes = {"v1": compile_quiz(BUILTIN_V1)}
+            listing: dict[str | None, tuple[bytes, str]] = {None: serialize({"quizzes": [q.summary() for q in quizzes.values()]})}
+            for zone in {q.zone for q in quizzes.values()}:
+                listing[zone] = serialize({"quizzes": [q.summary() for q in quizzes.values() if q.zone == zone]})
+            self._state = (MappingProxyType(quizzes), MappingProxyType(listing))
+            self._stamps = stamps
+        logger.info("Quiz bank loaded: %s", ", ".join(sorted(quizzes)))
+        return True
+
+    def _fresh(self) -> None:
+        if time.monotonic() - self._checked >= RELOAD_INTERVAL:
+            self.reload()
+
+    def get(self, quiz_id: str) -> Quiz | None:
+        self._fresh()
+        return self._state[0].get(quiz_id)
+
+    def listing(self, zone: str | None = None) -> tuple[bytes, str]:
+        """Pre-serialized /quizzes body (optionally one zone's quizzes)."""
+        self._fresh()
+        return self._state[1].get(zone.lower() if zone else None) or _EMPTY_LISTING
+
+    def quizzes(self) -> dict[str, Quiz]:
+        self._fresh()
+        return dict(self._state[0])
+
+
+# ---------------------------------------------------------------------------
+# Bulk grading (LMS imports)
+# ---------------------------------------------------------------------------
+MAX_BULK_SUBMISSIONS = 100_000
+MAX_REPORTED_ERRORS = 100
+_ANSWER_SEPARATORS = (";", "|")
+
+
+def _split_answers(cell: str) -> list[str]:
+    for sep in _ANSWER_SEPARATORS:
+        if sep in cell:
+            return [a.strip() for a in cell.split(sep)]
+    return cell.split()
+
+
+def parse_submissions_csv(text: str, default_quiz_id: str = "v1") -> list[dict[str, Any]]:
+    """
+    Submissions from an LMS CSV export. Needs a developer column (or user /
+    email) plus either an answers column (separated by ";", "|" or spaces)
+    or one column per question (q1, q2, ...). quiz_id is optional.
+    """
+    reader = csv.DictReader(io.StringIO(text))
+    fields = {f.strip().lower(): f for f in reader.fieldnames or []}
+    dev_col = next((fields[k] for k in ("developer", "user", "email", "username") if k in fields), None)
+    if dev_col is None:
+        raise ValueError("CSV needs a developer (or user/email) column")
+    quiz_col = fields.get("quiz_id")
+    answers_col = fields.get("answers")
+    question_cols = sorted(
+        (f for k, f in fields.items() if k[1:].isdigit() and k[0] == "q"), key=lambda f: int(f.strip()[1:])
+    )
+    if answers_col is None and not question_cols:
+        raise ValueError("CSV needs an answers column or q1..qN columns")
+    submissions = []
+    for row in reader:
+        answers = _split_answers(row.get(answers_col) or "") if answers_col else [
+            (row.get(col) or "").strip() for col in question_cols
+        ]
+        submissions.append({
+            "developer": (row.get(dev_col) or "").strip(),
+            "quiz_id": ((row.get(quiz_col) or "").strip() if quiz_col else "") or default_quiz_id,
+            "answers": answers,
+        })
+    return submissions
+
+
+def grade_many(bank: QuizBank, submissions: list[Any]) -> tuple[dict[str, Any], list[tuple]]:
+    """
+    Grade submissions against the bank. Returns (report, rows to store); rows
+    are QuizStore.record_many tuples for the valid submissions.
+    """
+    quizzes = bank.quizzes()
+    results: list[dict[str, Any]] = []
+    rows: list[tuple] = []
+    errors: list[dict[str, Any]] = []
+    by_quiz: dict[str, dict[str, int]] = {}
+    invalid = 0
+
+    def reject(i: int, message: str) -> None:
+        nonlocal invalid
+        invalid += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append({"index": i, "error": message})
+
+    for i, sub in enumerate(submissions):
+        if not isinstance(sub, dict):
+            reject(i, "submission must be an object")
+            continue
+        developer = str(sub.get("developer") or "").strip()
+        quiz = quizzes.get(str(sub.get("quiz_id") or "v1"))
+        answers = sub.get("answers")
+        if not developer:
+            reject(i, "missing developer")
+        elif quiz is None:
+            reject(i, f"unknown quiz_id: {sub.get('quiz_id')}")
+        elif not isinstance(answers, list) or len(answers) != quiz.total:
+            reject(i, f"expected {quiz.total} answers")
+        else:
+            score, passed = quiz.grade(answers)
+            counts = by_quiz.setdefault(quiz.id, {"graded": 0, "passed": 0})
+            counts["graded"] += 1
+            counts["passed"] += passed
+            results.append({"developer": developer, "quiz_id": quiz.id, "score": score, "total": quiz.total,
+                            "passed": passed})
+            rows.append((developer, quiz.id, passed, answers, score, quiz.total, quiz.zone))
+    report = {
+        "graded": len(results),
+        "passed": sum(1 for r in results if r["passed"]),
+        "failed": sum(1 for r in results if not r["passed"]),
+        "invalid": invalid,
+        "by_quiz": by_quiz,
+        "errors": errors,
+        "results": results,
+    }
+    return report, rows
@@ -1,119 +1,269 @@
 #!/usr/bin/env python3
 """
-Quiz Server - Unlock YELLOW zone for novice developers.
-Run: python quiz_server.py
+Quiz Server - Unlock zones (YELLOW for novices) by passing governance quizzes.
+Run: python quiz_server.py                 (Flask development server)
+     python quiz_server.py --workers 4     (production: gunicorn, or waitress on Windows)
 POST http://localhost:3001/quiz/submit with {"quiz_id":"v1","answers":["b","c","a","d","b"]}
+
+Quizzes come from .ai-governance/quizzes/*.yaml (see quiz_bank.py); GET
+/quizzes lists them and POST /quiz/bulk-grade imports LMS exports.
+
+Trust model. Results are stored per developer, and a stored pass unlocks
+YELLOW for that developer in the MCP server, so the server decides whose
+result a write records:
+- Without QUIZ_SERVER_TOKEN, client-supplied identities are not trusted.
+  /quiz/submit records for the developer running the server
+  (GOVERNANCE_DEVELOPER or the OS user) and answers 403 if the request names
+  anyone else; /quiz/bulk-grade only grades (?record=false).
+- With QUIZ_SERVER_TOKEN set, writes must send it as "Authorization: Bearer
+  <token>" (401 otherwise). The caller holding it (an LMS bridge, or a portal
+  that has authenticated the user) is trusted to name the developer:
+  "developer" in the body or the X-Developer header, and the developer
+  column of bulk imports.
+Reads (/quiz/status, ?developer= or X-Developer) are not gated; they only
+report pass/fail.
+
+Workers share .ai-governance/quiz_results.db; SQLite (WAL) serializes writes
+across processes, so any number of workers can accept submissions.
 """
-import json
+import argparse
+import hmac
 import os
+import sys
 from pathlib import Path
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 
-REPO_PATH = Path(os.environ.get("GOVERNANCE_REPO_PATH", "."))
-QUIZ_RESULTS_PATH = REPO_PATH / ".ai-governance" / "quiz_results.json"
+import quiz_bank
+import quiz_store
 
-# Quiz v1: Governance fundamentals (correct: b, c, a, d, b)
-QUIZ_V1 = {
-    "id": "v1",
-    "questions": 5,
-    "correct_answers": ["b", "c", "a", "d", "b"],
-}
+REPO_PATH = Path(os.environ.get("GOVERNANCE_REPO_PATH", "."))
+GOV_DIR = REPO_PATH / ".ai-governance"
+QUIZ_DIR = GOV_DIR / "quizzes"
+QUIZ_SERVER_TOKEN = os.environ.get("QUIZ_SERVER_TOKEN", "")
 
 app = Flask(__name__)
+_quiz_bank: quiz_bank.QuizBank | None = None
 
 
-def _ensure_gov_dir():
-    QUIZ_RESULTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+def _store() -> quiz_store.QuizStore:
+    return quiz_store.for_governance_dir(GOV_DIR)
 
 
-def _load_quiz_results() -> dict:
-    if not QUIZ_RESULTS_PATH.exists():
-        return {}
-    try:
-        with open(QUIZ_RESULTS_PATH, encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        return {}
+def _bank() -> quiz_bank.QuizBank:
+    global _quiz_bank
+    if _quiz_bank is None:
+        _quiz_bank = quiz_bank.QuizBank(QUIZ_DIR)
+    return _quiz_bank
+
+
+def _cached_json(prebuilt: tuple[bytes, str]) -> Response:
+    """Pre-serialized JSON body with its ETag; 304 when the client already has it."""
+    body, etag = prebuilt
+    if request.if_none_match.contains_weak(etag.strip('"')):  # parsed list; W/ and * handled
+        return Response(status=304, headers={"ETag": etag})
+    return Response(body, mimetype="application/json", headers={"ETag": etag})
+
 
+def _requested_developer(body: dict | None = None) -> str | None:
+    developer = (body or {}).get("developer") or request.args.get("developer") or request.headers.get("X-Developer")
+    return str(developer or "").strip() or None
 
-def _save_quiz_result(quiz_id: str, passed: bool, answers: list) -> None:
-    _ensure_gov_dir()
-    data = _load_quiz_results()
-    data[quiz_id] = {
-        "passed": passed,
-        "answers": answers,
-        "timestamp": __import__("datetime").datetime.utcnow().isoformat() + "Z",
-    }
-    with open(QUIZ_RESULTS_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+
+def _developer(body: dict | None = None) -> str:
+    """Developer a read is for (client-named, else the server's developer)."""
+    return _requested_developer(body) or quiz_store.default_developer()
+
+
+def _authorized() -> bool:
+    """Whether the request carries QUIZ_SERVER_TOKEN (never true when it is unset)."""
+    if not QUIZ_SERVER_TOKEN:
+        return False
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    return scheme.lower() == "bearer" and hmac.compare_digest(token.strip().encode(), QUIZ_SERVER_TOKEN.encode())
+
+
+def _writer(body: dict | None = None) -> tuple[str | None, tuple[Response, int] | None]:
+    """
+    (developer, None) for a write this request may make, else (None, error
+    response). See the trust model in the module docstring.
+    """
+    if QUIZ_SERVER_TOKEN:
+        if not _authorized():
+            return None, (jsonify({"error": "Missing or invalid quiz server token"}), 401)
+        return _developer(body), None
+    developer = quiz_store.default_developer()
+    requested = _requested_developer(body)
+    if requested is not None and requested != developer:
+        return None, (jsonify({
+            "error": f"This server records results for {developer} only; set QUIZ_SERVER_TOKEN to submit for others",
+        }), 403)
+    return developer, None
 
 
 @app.route("/quiz/submit", methods=["POST"])
 def submit_quiz():
-    """Submit quiz answers. Unlocks YELLOW zone if passed."""
+    """Submit quiz answers. Unlocks the quiz's zone (YELLOW for the governance quizzes) if passed."""
     try:
         body = request.get_json(force=True, silent=True) or {}
+        developer, denied = _writer(body)
+        if denied is not None:
+            return denied
         quiz_id = body.get("quiz_id", "v1")
         answers = body.get("answers", [])
 
-        if quiz_id != "v1":
+        quiz = _bank().get(str(quiz_id))
+        if quiz is None:
             return jsonify({"passed": False, "message": f"Unknown quiz_id: {quiz_id}"}), 400
 
-        correct = QUIZ_V1["correct_answers"]
-        if len(answers) != len(correct):
+        if not isinstance(answers, list) or len(answers) != quiz.total:
+            got = len(answers) if isinstance(answers, list) else 0
             return jsonify({
                 "passed": False,
-                "message": f"Expected {len(correct)} answers, got {len(answers)}",
+                "message": f"Expected {quiz.total} answers, got {got}",
             }), 400
 
-        passed = all(a.lower().strip() == c for a, c in zip(answers, correct))
-        _save_quiz_result(quiz_id, passed, answers)
+        score, passed = quiz.grade(answers)
+        _store().record(
+            developer, quiz.id, passed, answers,
+            score=score, total=quiz.total, unlocked_zone=quiz.zone,
+        )
 
         if passed:
             return jsonify({
                 "passed": True,
-                "message": "Passed! Unlocked YELLOW zone access",
-                "unlocked_zone": "yellow",
+                "message": f"Passed! Unlocked {quiz.zone.upper()} zone access",
+                "unlocked_zone": quiz.zone,
             })
         return jsonify({
             "passed": False,
             "message": "Quiz failed. Review governance patterns and try again.",
-            "correct_answers": len([1 for a, c in zip(answers, correct) if a.lower().strip() == c]),
-            "total": len(correct),
+            "correct_answers": score,
+            "total": quiz.total,
         })
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/quiz/bulk-grade", methods=["POST"])
+def bulk_grade():
+    """
+    Grade and record many submissions at once (LMS export). Accepts JSON
+    {"submissions": [{"developer", "quiz_id", "answers"}, ...]} or a CSV body /
+    "file" upload (see quiz_bank.parse_submissions_csv). ?record=false only grades;
+    ?details=false omits per-submission results. Recording needs QUIZ_SERVER_TOKEN.
+    """
+    record = request.args.get("record", "true").lower() not in ("0", "false", "no")
+    if record and not _authorized():
+        if QUIZ_SERVER_TOKEN:
+            return jsonify({"error": "Missing or invalid quiz server token"}), 401
+        return jsonify({"error": "Recording bulk results needs QUIZ_SERVER_TOKEN; use ?record=false to grade only"}), 403
+    try:
+        upload = request.files.get("file")
+        if upload is not None or (request.mimetype or "").endswith("csv"):
+            raw = upload.read() if upload is not None else request.get_data()
+            default_quiz = request.args.get("quiz_id", "v1")
+            submissions = quiz_bank.parse_submissions_csv(raw.decode("utf-8-sig"), default_quiz)
+        else:
+            body = request.get_json(force=True, silent=True)
+            submissions = body.get("submissions") if isinstance(body, dict) else body
+            if not isinstance(submissions, list):
+                return jsonify({"error": "Expected {\"submissions\": [...]} or a CSV body"}), 400
+    except (ValueError, UnicodeDecodeError) as e:
+        return jsonify({"error": str(e)}), 400
+    if len(submissions) > quiz_bank.MAX_BULK_SUBMISSIONS:
+        return jsonify({"error": f"At most {quiz_bank.MAX_BULK_SUBMISSIONS} submissions per request"}), 413
+
+    report, rows = quiz_bank.grade_many(_bank(), submissions)
+    report["recorded"] = _store().record_many(rows) if record else 0
+    if request.args.get("details", "true").lower() in ("0", "false", "no"):
+        report.pop("results")
+    return jsonify(report)
+
+
 @app.route("/quiz/status", methods=["GET"])
 def quiz_status():
-    """Check if YELLOW zone is unlocked."""
-    data = _load_quiz_results()
-    v1 = data.get("v1", {})
-    passed = v1.get("passed", False)
+    """Zones a developer has unlocked through quizzes."""
+    developer = _developer()
+    results = _store().results(developer)
+    zones = sorted({r["unlocked_zone"] for r in results.values() if r["passed"] and r["unlocked_zone"]})
     return jsonify({
-        "yellow_zone_unlocked": passed,
-        "quiz_v1_passed": passed,
+        "developer": developer,
+        "unlocked_zones": zones,
+        "passed_quizzes": sorted(q for q, r in results.items() if r["passed"]),
+        "yellow_zone_unlocked": "yellow" in zones,
+        "quiz_v1_passed": bool(results.get("v1", {}).get("passed")),
     })
 
 
 @app.route("/quiz/questions", methods=["GET"])
 def quiz_questions():
-    """Get quiz questions (for UI)."""
-    return jsonify({
-        "quiz_id": "v1",
-        "questions": [
-            {"q": "What zone requires Champion approval?", "options": ["Green", "Yellow", "Red", "All"], "answer": "b"},
-            {"q": "Where should tribal knowledge live?", "options": ["Confluence", "In the repo", "Slack", "Email"], "answer": "c"},
-            {"q": "What does VTCO stand for?", "options": ["Verb-Task-Constant-Outcome", "Value-Test-Code-Output", "Very-Tight-Change-Order", "None"], "answer": "a"},
-            {"q": "Novice in Yellow zone needs:", "options": ["Nothing", "Mentor", "Champion", "Quiz pass or mentor"], "answer": "d"},
-            {"q": "Entropy formula includes:", "options": ["Only bloat", "Bloat, rework, reverts, premature", "Only reverts", "Complexity"], "answer": "b"},
-        ],
-    })
+    """Get one quiz's questions (for UI); ?quiz_id=, default v1. Answers are not included."""
+    quiz = _bank().get(request.args.get("quiz_id", "v1"))
+    if quiz is None:
+        return jsonify({"error": f"Unknown quiz_id: {request.args.get('quiz_id')}"}), 404
+    return _cached_json(quiz.questions_response)
 
 
-if __name__ == "__main__":
-    print("Quiz Server starting on http://localhost:3001")
+@app.route("/quizzes", methods=["GET"])
+def list_quizzes():
+    """Available quizzes (?zone= to filter by the zone they unlock)."""
+    return _cached_json(_bank().listing(request.args.get("zone")))
+
+
+def serve_production(host: str, port: int, workers: int, threads: int) -> None:
+    """Serve with gunicorn (pre-fork workers x threads); waitress where gunicorn is unavailable."""
+    _store()  # create the schema and import legacy JSON once, before workers start
+    _bank()
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        BaseApplication = None
+    if BaseApplication is not None and os.name != "nt":
+        options = {
+            "bind": f"{host}:{port}",
+            "workers": workers,
+            "threads": threads,
+            "worker_class": "gthread" if threads > 1 else "sync",
+            "timeout": 30,
+            "keepalive": 5,
+        }
+
+        class QuizApplication(BaseApplication):
+            def load_config(self):
+                for key, value in options.items():
+                    self.cfg.set(key, value)
+
+            def load(self):
+                return app
+
+        QuizApplication().run()
+        return
+    try:
+        from waitress import serve
+    except ImportError:
+        sys.exit("Production mode needs gunicorn (Linux/macOS) or waitress: pip install gunicorn waitress")
+    # waitress is single-process; give it the same total concurrency as threads
+    serve(app, host=host, port=port, threads=workers * threads)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Governance quiz server")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("QUIZ_PORT", "3001")))
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("QUIZ_WORKERS", "0")),
+                        help="Production mode with this many worker processes (0 = Flask development server)")
+    parser.add_argument("--threads", type=int, default=int(os.environ.get("QUIZ_THREADS", "4")),
+                        help="Threads per worker in production mode")
+    args = parser.parse_args(argv)
+
+    print(f"Quiz Server starting on http://localhost:{args.port}")
     print("POST /quiz/submit with {\"quiz_id\":\"v1\",\"answers\":[\"b\",\"c\",\"a\",\"d\",\"b\"]}")
-    app.run(host="0.0.0.0", port=3001, debug=False)
+    if args.workers > 0:
+        serve_production(args.host, args.port, args.workers, max(1, args.threads))
+    else:
+        app.run(host=args.host, port=args.port, debug=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Per-developer quiz results store.
+
+Results live in .ai-governance/quiz_results.db (SQLite, WAL mode), one row per
+(developer, quiz_id). The primary key is the lookup path for /quiz/status and
+the MCP server's Yellow-zone unlock check, so a status read is a single indexed
+row fetch instead of parsing every result ever submitted.
+
+A submission is one INSERT ... ON CONFLICT DO UPDATE, so concurrent submissions
+from the quiz server's threads (or several processes) cannot lose each other's
+updates. The latest attempt wins, as before, and `attempts` counts them.
+
+The legacy quiz_results.json (keyed by quiz_id only) is imported once, on first
+open, under the developer running the server; the JSON file is left in place.
+
+Every write also replaces quiz_results.stamp next to the database. Hot-path
+readers (the MCP server's zoning checks) use passed_cached() and
+unlocked_zones_cached(), which answer
+from memory and stats the stamp file at most once per STAMP_INTERVAL; a new
+stamp drops the cached answers. Zoning checks therefore read no files, and a
+newly passed quiz takes effect within a second.
+
+The developer is GOVERNANCE_DEVELOPER, falling back to the OS user.
+"""
+from __future__ import annotations
+
+import getpass
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+DB_FILE = "quiz_results.db"
+LEGACY_JSON = "quiz_results.json"
+STAMP_FILE = "quiz_results.stamp"
+STAMP_INTERVAL = 1.0  # seconds between stamp checks in passed_cached()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS quiz_results (
+    developer TEXT NOT NULL,
+    quiz_id TEXT NOT NULL,
+    passed INTEGER NOT NULL,
+    score INTEGER,
+    total INTEGER,
+    answers TEXT NOT NULL,
+    unlocked_zone TEXT,
+    attempts INTEGER NOT NULL DEFAULT 1,
+    timestamp TEXT NOT NULL,
+    PRIMARY KEY (developer, quiz_id)
+) WITHOUT ROWID;
+"""
+
+_UPSERT = """
+INSERT INTO quiz_results (developer, quiz_id, passed, score, total, answers, unlocked_zone, timestamp)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (developer, quiz_id) DO UPDATE SET
+    passed = excluded.passed,
+    score = excluded.score,
+    total = excluded.total,
+    answers = excluded.answers,
+    unlocked_zone = excluded.unlocked_zone,
+    attempts = quiz_results.attempts + 1,
+    timestamp = excluded.timestamp
+"""
+
+
+def default_developer() -> str:
+    """Developer the current process acts for (GOVERNANCE_DEVELOPER or the OS user)."""
+    developer = os.environ.get("GOVERNANCE_DEVELOPER", "").strip()
+    if developer:
+        return developer
+    try:
+        return getpass.getuser()
+    except (KeyError, OSError):
+        return "unknown"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns)
+
+
+def _row_to_result(row: tuple) -> dict[str, Any]:
+    developer, quiz_id, passed, score, total, answers, unlocked_zone, attempts, timestamp = row
+    return {
+        "developer": developer,
+        "quiz_id": quiz_id,
+        "passed": bool(passed),
+        "score": score,
+        "total": total,
+        "answers": json.loads(answers),
+        "unlocked_zone": unlocked_zone,
+        "attempts": attempts,
+        "timestamp": timestamp,
+    }
+
+
+class QuizStore:
+    """SQLite-backed quiz results keyed by (developer, quiz_id)."""
+
+    def __init__(self, db_path: str | Path) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.stamp_path = self.db_path.with_name(STAMP_FILE)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+        self._cache: dict[tuple, Any] = {}
+        self._stamp: tuple[int, int] | None = None
+        self._checked = -STAMP_INTERVAL
+        self._cache_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=10)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def _notify(self) -> None:
+        """Replace the stamp file (new inode + mtime) so cached readers reload."""
+        tmp = self.stamp_path.with_name(f"{STAMP_FILE}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(_now())
+        os.replace(tmp, self.stamp_path)
+
+    def record(
+        self,
+        developer: str,
+        quiz_id: str,
+        passed: bool,
+        answers: list[Any],
+        score: int | None = None,
+        total: int | None = None,
+        unlocked_zone: str | None = None,
+        timestamp: str | None = None,
+    ) -> dict[str, Any]:
+        """Store one attempt (replacing the previous one) and return the stored result."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(_UPSERT, (
+                developer, quiz_id, int(bool(passed)), score, total, json.dumps(answers),
+                unlocked_zone if passed else None, timestamp or _now(),
+            ))
+            row = conn.execute(
+                "SELECT * FROM quiz_results WHERE developer = ? AND quiz_id = ?", (developer, quiz_id)
+            ).fetchone()
+        self._notify()
+        return _row_to_result(row)
+
+    def record_many(self, rows: list[tuple[str, str, bool, list[Any], int | None, int | None, str | None]]) -> int:
+        """
+        Store many attempts in one transaction (bulk imports). Each row is
+        (developer, quiz_id, passed, answers, score, total, unlocked_zone).
+        """
+        now = _now()
+        params = [
+            (developer, quiz_id, int(bool(passed)), score, total, json.dumps(answers),
+             unlocked_zone if passed else None, now)
+            for developer, quiz_id, passed, answers, score, total, unlocked_zone in rows
+        ]
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(_UPSERT, params)
+        if params:
+            self._notify()
+        return len(params)
+
+    def migrate_json(self, json_path: str | Path, developer: str) -> int:
+        """Import a legacy quiz_results.json once; returns how many results were imported."""
+        json_path = Path(json_path)
+        with closing(self._connect()) as conn, conn:
+            if conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_json_imported'").fetchone():
+                return 0
+            try:
+                data = json.loads(json_path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                data = {}
+            except (OSError, json.JSONDecodeError):
+                return 0  # retry on the next open rather than marking a bad file as imported
+            imported = 0
+            for quiz_id, result in (data if isinstance(data, dict) else {}).items():
+                if not isinstance(result, dict):
+                    continue
+                passed = bool(result.get("passed", False))
+                conn.execute(
+                    "INSERT OR IGNORE INTO quiz_results "
+                    "(developer, quiz_id, passed, answers, unlocked_zone, timestamp) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        developer, quiz_id, int(passed), json.dumps(result.get("answers", [])),
+                        "yellow" if passed and quiz_id == "v1" else None, result.get("timestamp") or _now(),
+                    ),
+                )
+                imported += 1
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('legacy_json_imported', ?)", (_now(),))
+        if imported:
+            self._notify()
+        return imported
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def get(self, developer: str, quiz_id: str) -> dict[str, Any] | None:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT * FROM quiz_results WHERE developer = ? AND quiz_id = ?", (developer, quiz_id)
+            ).fetchone()
+        return _row_to_result(row) if row else None
+
+    def passed(self, developer: str, quiz_id: str) -> bool:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT passed FROM quiz_results WHERE developer = ? AND quiz_id = ?", (developer, quiz_id)
+            ).fetchone()
+        return bool(row and row[0])
+
+    def _cached(self, key: tuple, load: Any) -> Any:
+        with self._cache_lock:
+            now = time.monotonic()
+            if now - self._checked >= STAMP_INTERVAL:
+                self._checked = now
+                stamp = _stamp(self.stamp_path)
+                if stamp != self._stamp:
+                    self._stamp = stamp
+                    self._cache.clear()
+            if key not in self._cache:
+                self._cache[key] = load()
+            return self._cache[key]
+
+    def passed_cached(self, developer: str, quiz_id: str) -> bool:
+        """passed() from memory; sees other processes' writes within STAMP_INTERVAL."""
+        return self._cached(("passed", developer, quiz_id), lambda: self.passed(developer, quiz_id))
+
+    def unlocked_zones_cached(self, developer: str) -> frozenset[str]:
+        """unlocked_zones() from memory, refreshed like passed_cached()."""
+        return self._cached(("zones", developer), lambda: frozenset(self.unlocked_zones(developer)))
+
+    def results(self, developer: str) -> dict[str, dict[str, Any]]:
+        """All of one developer's latest results, by quiz_id."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT * FROM quiz_results WHERE developer = ?", (developer,)).fetchall()
+        return {row[1]: _row_to_result(row) for row in rows}
+
+    def unlocked_zones(self, developer: str) -> set[str]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT unlocked_zone FROM quiz_results "
+                "WHERE developer = ? AND passed = 1 AND unlocked_zone IS NOT NULL",
+                (developer,),
+            ).fetchall()
+        return {r[0] for r in rows}
+
+
+_stores: dict[str, QuizStore] = {}
+_stores_lock = threading.Lock()
+
+
+def for_governance_dir(gov_dir: str | Path) -> QuizStore:
+    """Process-wide store for a .ai-governance directory (legacy JSON imported on first open)."""
+    key = os.path.abspath(gov_dir)  # no filesystem access: this runs on every zoning check
+    gov_dir = Path(gov_dir)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = QuizStore(gov_dir / DB_FILE)
+            store.migrate_json(gov_dir / LEGACY_JSON, default_developer())
+            _stores[key] = store
+        return store
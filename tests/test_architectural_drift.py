@@ -0,0 +1,114 @@
+"""Unit tests for the HEAD-keyed drift snapshot provider."""
+
+import subprocess
+
+import pytest
+
+import architectural_drift
+from architectural_drift import DriftProvider, get_repo_head
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=str(repo),
+        check=True,
+        capture_output=True,
+    )
+
+
+def _commit(repo, name, body="x = 1\n"):
+    (repo / name).write_text(body)
+    _git(repo, "add", name)
+    _git(repo, "commit", "-q", "-m", f"add {name}")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = tmp_path / "repo"
+    path.mkdir()
+    _git(path, "init", "-q")
+    _commit(path, "a.py")
+    return path
+
+
+class TestDriftProvider:
+    """Tests for DriftProvider snapshot caching."""
+
+    def test_first_get_refreshes_in_background(self, repo):
+        provider = DriftProvider(repo, days=90)
+        assert provider.get()["refreshing"] is True
+
+        provider.refresh(wait=True)
+        state = provider.get()
+        assert state["refreshing"] is False
+        assert state["stale"] is False
+        assert state["head"] == get_repo_head(repo)
+        assert "overall_score" in state["result"]
+
+    def test_snapshot_reused_across_instances(self, repo, monkeypatch):
+        DriftProvider(repo).refresh(wait=True)
+        assert (repo / ".ai-governance" / "drift_snapshot.json").exists()
+
+        calls = []
+        monkeypatch.setattr(architectural_drift, "calculate_architectural_drift",
+                            lambda **kw: calls.append(kw) or {})
+        state = DriftProvider(repo).get()
+        assert state["result"] is not None
+        assert state["refreshing"] is False
+        assert calls == []
+
+    def test_new_commit_marks_stale_and_recomputes(self, repo):
+        provider = DriftProvider(repo)
+        provider.refresh(wait=True)
+        old_head = provider.get()["head"]
+
+        _commit(repo, "b.py")
+        state = provider.get()
+        assert state["stale"] is True
+        assert state["head"] == old_head
+        assert state["result"] is not None
+
+        provider.refresh(wait=True)
+        assert provider.get()["head"] == get_repo_head(repo) != old_head
+
+    def test_different_window_ignores_snapshot(self, repo):
+        DriftProvider(repo, days=90).refresh(wait=True)
+        assert DriftProvider(repo, days=30)._snapshot is None
+
+    def test_failed_recompute_backs_off_for_same_head(self, repo, monkeypatch):
+        calls = []
+
+        def fail(**kw):
+            calls.append(kw)
+            raise RuntimeError("git exploded")
+
+        monkeypatch.setattr(architectural_drift, "calculate_architectural_drift", fail)
+        provider = DriftProvider(repo)
+        provider.refresh(wait=True)
+        state = provider.get()
+        assert state["error"] == "git exploded"
+        assert state["refreshing"] is False
+        assert state["retry_in"] > 0
+        provider.get()
+        assert len(calls) == 1
+
+        provider.refresh(force=True, wait=True)
+        assert len(calls) == 2
+
+        monkeypatch.setattr(architectural_drift, "RETRY_BACKOFF", 0.0)
+        provider.refresh(wait=True)
+        assert len(calls) == 3
+
+    def test_new_head_is_tried_despite_earlier_failure(self, repo, monkeypatch):
+        monkeypatch.setattr(architectural_drift, "calculate_architectural_drift",
+                            lambda **kw: (_ for _ in ()).throw(RuntimeError("boom")))
+        provider = DriftProvider(repo)
+        provider.refresh(wait=True)
+        monkeypatch.undo()
+
+        _commit(repo, "b.py")
+        provider.refresh(wait=True)
+        state = provider.get()
+        assert state["error"] is None
+        assert state["head"] == get_repo_head(repo)
@@ -0,0 +1,119 @@
+"""Unit tests for the hash-chained audit log."""
+
+import json
+
+import pytest
+
+from audit_chain import ChainedLog, checkpoint_path, merkle_root, verify_log
+
+
+def _write(path, n, every=1000, start=0):
+    log = ChainedLog(path, checkpoint_every=every)
+    for i in range(start, start + n):
+        log.append({"adr_id": f"ADR-{i}", "rationale": "ok", "timestamp": f"2024-01-01T00:00:{i % 60:02d}Z"})
+    return log
+
+
+def _lines(path):
+    return path.read_bytes().splitlines(keepends=True)
+
+
+class TestChainedLog:
+    """Tests for writing and verifying the chain."""
+
+    def test_records_are_valid_json_with_chain_fields(self, tmp_path):
+        path = tmp_path / "violations.jsonl"
+        _write(path, 3)
+        records = [json.loads(line) for line in _lines(path)]
+        assert records[0]["prev_hash"] == "0" * 64
+        assert records[1]["prev_hash"] == records[0]["hash"]
+        assert records[2]["adr_id"] == "ADR-2"
+
+    def test_full_verify_passes(self, tmp_path):
+        path = tmp_path / "violations.jsonl"
+        _write(path, 250, every=100)
+        result = verify_log(path, full=True)
+        assert result["valid"] is True
+        assert result["records_checked"] == 250
+        assert result["checkpoints_checked"] == 2
+
+    def test_edit_is_detected(self, tmp_path):
+        path = tmp_path / "violations.jsonl"
+        _write(path, 10)
+        lines = _lines(path)
+        lines[4] = lines[4].replace(b'"rationale": "ok"', b'"rationale": "no"')
+        path.write_bytes(b"".join(lines))
+        result = verify_log(path)
+        assert result["valid"] is False
+        assert result["first_bad_line"] == 5
+
+    def test_deletion_is_detected(self, tmp_path):
+        path = tmp_path / "violations.jsonl"
+        _write(path, 10)
+        lines = _lines(path)
+        del lines[3]
+        path.write_bytes(b"".join(lines))
+        result = verify_log(path)
+        assert result["valid"] is False
+        assert result["first_bad_line"] == 4
+
+    def test_new_writer_continues_chain(self, tmp_path):
+        path = tmp_path / "violations.jsonl"
+        _write(path, 5, every=3)
+        _write(path, 5, every=3, start=5)
+        result = verify_log(path, full=True)
+        assert result["valid"] is True
+        assert result["records_checked"] == 10
+        assert result["checkpoints_checked"] == 3
+
+    def test_legacy_prefix_is_anchored(self, tmp_path):
+        path = tmp_path / "violations.jsonl"
+        path.write_text('{"zone": "red", "user_role": "novice"}\n')
+        _write(path, 2)
+        assert verify_log(path)["legacy_lines"] == 1
+        path.write_text('{"zone": "green", "user_role": "novice"}\n' + "".join(
+            line.decode() for line in _lines(path)[1:]))
+        assert verify_log(path)["valid"] is False
+
+
+class TestCheckpoints:
+    """Tests for Merkle checkpoints and tail verification."""
+
+    def test_tail_verify_checks_only_new_records(self, tmp_path):
+        path = tmp_path / "audit.jsonl"
+        log = _write(path, 200, every=100)
+        log.append({"event_type": "late"})
+        result = verify_log(path, full=False)
+        assert result["valid"] is True
+        assert result["mode"] == "tail"
+        assert result["records_checked"] == 1
+
+    def test_tail_verify_detects_tail_edit(self, tmp_path):
+        path = tmp_path / "audit.jsonl"
+        _write(path, 105, every=100)
+        lines = _lines(path)
+        lines[-1] = lines[-1].replace(b"ADR-104", b"ADR-999")
+        path.write_bytes(b"".join(lines))
+        assert verify_log(path, full=False)["valid"] is False
+
+    def test_full_verify_checks_merkle_roots(self, tmp_path):
+        path = tmp_path / "audit.jsonl"
+        _write(path, 100, every=50)
+        cps = checkpoint_path(path)
+        entries = [json.loads(line) for line in cps.read_text().splitlines()]
+        entries[0]["merkle_root"] = "f" * 64
+        cps.write_text("".join(json.dumps(e) + "\n" for e in entries))
+        assert verify_log(path, full=True)["valid"] is False
+
+    def test_truncation_is_detected(self, tmp_path):
+        path = tmp_path / "audit.jsonl"
+        _write(path, 100, every=50)
+        path.write_bytes(b"".join(_lines(path)[:60]))
+        assert verify_log(path, full=False)["valid"] is False
+
+    def test_merkle_root(self):
+        leaves = ["00" * 32, "11" * 32, "22" * 32]
+        assert merkle_root(leaves) != merkle_root(leaves[:2])
+        assert merkle_root([]) == "0" * 64
+        assert merkle_root(leaves[:1]) == leaves[0]
+
@@ -0,0 +1,62 @@
+"""Unit tests for calibration metrics."""
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from calibration_metrics import calibrate, compute_calibration, entropy_inputs  # noqa: E402
+
+
+def _violations() -> list[dict]:
+    return [
+        {"zone": "Green", "user_role": "Novice", "allowed": True, "has_bloat": True, "touch_count": 1},
+        {"zone": "Green", "user_role": "Novice", "allowed": True, "has_bloat": False, "touch_count": 4},
+        {"zone": "Red", "user_role": "Expert", "allowed": False, "has_bloat": False, "touch_count": 3},
+        {"zone": "Yellow", "user_role": "Expert", "allowed": True, "has_bloat": False, "touch_count": 1},
+    ]
+
+
+def _scaffolding() -> list[dict]:
+    return [
+        {"user_role": "Novice", "time_to_accept": 2, "was_reverted": True},
+        {"user_role": "Novice", "time_to_accept": 45, "was_reverted": False},
+        {"user_role": "Expert", "time_to_accept": 4, "was_reverted": False},
+        {"user_role": "Expert", "time_to_accept": 90, "was_reverted": False},
+    ]
+
+
+class TestComputeCalibration:
+    """Tests for component and breakdown computation."""
+
+    def test_overall_components(self):
+        result = compute_calibration(_violations(), _scaffolding())
+        c = result["components"]
+        assert c["bloat"] == pytest.approx(33.33)  # 1 of 3 accepted
+        assert c["rework"] == 50.0  # 2 of 4 touched 3+ times
+        assert c["reverts"] == 25.0
+        assert c["premature"] == 50.0
+
+    def test_role_and_zone_breakdowns(self):
+        result = compute_calibration(_violations(), _scaffolding())
+        assert result["by_role"]["Novice"]["bloat"] == 50.0
+        assert result["by_role"]["Expert"]["premature"] == 50.0
+        assert result["by_role"]["Expert"]["violation_events"] == 2
+        assert result["by_zone"]["Red"]["rework"] == 100.0
+        assert "premature" not in result["by_zone"]["Green"]
+
+    def test_accepts_dataframes_and_missing_columns(self):
+        live = pd.DataFrame([{"zone": "Red", "user_role": "Novice", "reason": "blocked"}])
+        result = compute_calibration(live, pd.DataFrame())
+        assert result["components"] == {"bloat": 0.0, "rework": 0.0, "reverts": 0.0, "premature": 0.0}
+        assert result["violation_events"] == 1
+
+
+class TestCalibrate:
+    """Tests for calculate_entropy integration."""
+
+    def test_entropy_inputs_feed_formula(self):
+        result = calibrate(_violations(), _scaffolding())
+        inputs = result["entropy_inputs"]
+        assert inputs == entropy_inputs(result["components"])
+        expected = (33.33 * 0.25) + (50 * 0.25) + (25 * 0.20) + (50 * 0.30)
+        assert result["entropy_score"] == pytest.approx(expected, abs=0.01)
@@ -0,0 +1,148 @@
+"""Unit tests for the versioned quiz bank and bulk grading."""
+
+import json
+import os
+
+import pytest
+
+import quiz_bank
+from quiz_bank import QuizBank, compile_quiz, grade_many, parse_submissions_csv
+from quiz_store import QuizStore
+
+V2 = """
+id: v2
+version: 2
+title: Zones
+zone: yellow
+pass_score: 2
+questions:
+  - q: "How does AI behave in the YELLOW zone?"
+    options: ["Suggest only", "Generate with validation"]
+    answer: b
+  - q: "Who may change RED zone code?"
+    options: ["Anyone", "Champion only"]
+    answer: B
+  - q: "Novice max complexity?"
+    options: ["5", "10"]
+    answer: a
+"""
+
+
+def _bank(tmp_path, files):
+    quiz_dir = tmp_path / "quizzes"
+    quiz_dir.mkdir(exist_ok=True)
+    for name, text in files.items():
+        (quiz_dir / name).write_text(text)
+    return QuizBank(quiz_dir)
+
+
+class TestCompileQuiz:
+    """Tests for answer-key compilation and grading."""
+
+    def test_grades_letters_and_option_text(self):
+        quiz = compile_quiz({"id": "q", "questions": [
+            {"q": "a?", "options": ["Green", "Red"], "answer": "b"},
+            {"q": "b?", "options": ["Mentor", "Champion"], "answer": "a"},
+        ]})
+        assert quiz.grade([" B ", "mentor"]) == (2, True)
+        assert quiz.grade(["red", "b"]) == (1, False)
+
+    def test_questions_response_omits_answers(self):
+        quiz = compile_quiz({"id": "q", "questions": [{"q": "a?", "options": ["x", "y"], "answer": "a"}]})
+        body, etag = quiz.questions_response
+        payload = json.loads(body)
+        assert payload["questions"] == [{"q": "a?", "options": ["x", "y"]}]
+        assert etag.startswith('"')
+
+    @pytest.mark.parametrize("data", [
+        {"id": "q", "questions": []},
+        {"id": "q", "questions": [{"q": "a?", "options": ["x"], "answer": "c"}]},
+        {"id": "q", "pass_score": 3, "questions": [{"q": "a?", "options": ["x"], "answer": "a"}]},
+    ])
+    def test_invalid_definitions_are_rejected(self, data):
+        with pytest.raises(ValueError):
+            compile_quiz(data)
+
+
+class TestQuizBank:
+    """Tests for loading and reloading the bank."""
+
+    def test_loads_versions_and_lists_by_zone(self, tmp_path):
+        bank = _bank(tmp_path, {"v2.yaml": V2, "broken.yaml": "id: [", "red.yaml": V2.replace("v2", "r1").replace("yellow", "red")})
+        assert sorted(bank.quizzes()) == ["r1", "v2"]
+        assert [q["id"] for q in json.loads(bank.listing("red")[0])["quizzes"]] == ["r1"]
+        assert bank.get("v2").grade(["b", "b", "b"]) == (2, True)
+
+    def test_falls_back_to_builtin_v1(self, tmp_path):
+        bank = QuizBank(tmp_path / "missing")
+        assert list(bank.quizzes()) == ["v1"]
+        assert bank.get("v1").grade(["b", "c", "a", "d", "b"]) == (5, True)
+
+    def test_changed_file_is_picked_up(self, tmp_path, monkeypatch):
+        bank = _bank(tmp_path, {"v2.yaml": V2})
+        path = tmp_path / "quizzes" / "v2.yaml"
+        path.write_text(V2.replace("title: Zones", "title: Zones and scaffolding"))
+        os.utime(path, ns=(1, 1))
+        monkeypatch.setattr(quiz_bank, "RELOAD_INTERVAL", 0.0)
+        assert bank.get("v2").title == "Zones and scaffolding"
+
+    def test_reload_swaps_quizzes_and_listings_together(self, tmp_path):
+        bank = _bank(tmp_path, {"v2.yaml": V2})
+        before = bank._state
+        (tmp_path / "quizzes" / "r1.yaml").write_text(V2.replace("v2", "r1").replace("yellow", "red"))
+        assert bank.reload() is True
+        quizzes, listing = before  # a reader holding the old state keeps a consistent view
+        assert list(quizzes) == ["v2"] and "red" not in listing
+        quizzes, listing = bank._state
+        assert sorted(quizzes) == ["r1", "v2"] and "red" in listing
+        with pytest.raises(TypeError):
+            quizzes["x"] = None
+
+
+class TestSerialize:
+    """Pre-serialized bodies and their ETags."""
+
+    def test_compact_utf8_body_and_strong_etag(self):
+        body, etag = quiz_bank.serialize({"title": "Zonen für Neulinge", "n": [1, 2]})
+        assert body == '{"title":"Zonen für Neulinge","n":[1,2]}'.encode("utf-8")
+        assert etag.startswith('"') and etag.endswith('"') and len(etag) == 22
+        assert not etag.startswith('W/')
+
+    def test_etag_follows_content(self):
+        assert quiz_bank.serialize({"a": 1}) == quiz_bank.serialize({"a": 1})
+        assert quiz_bank.serialize({"a": 1})[1] != quiz_bank.serialize({"a": 2})[1]
+
+
+class TestBulkGrading:
+    """Tests for LMS import parsing and bulk grading."""
+
+    def test_csv_with_answers_column(self):
+        text = 'email,quiz_id,answers\na@x,v2,b;b;a\nb@x,,"Generate with validation|Anyone|5"\n'
+        subs = parse_submissions_csv(text, default_quiz_id="v2")
+        assert subs[0] == {"developer": "a@x", "quiz_id": "v2", "answers": ["b", "b", "a"]}
+        assert subs[1]["answers"] == ["Generate with validation", "Anyone", "5"]
+
+    def test_csv_with_question_columns(self):
+        text = "developer,q2,q1,q10\nann,b,a,c\n"
+        assert parse_submissions_csv(text)[0]["answers"] == ["a", "b", "c"]
+
+    def test_csv_without_developer_column_is_rejected(self):
+        with pytest.raises(ValueError):
+            parse_submissions_csv("name,answers\nx,a\n")
+
+    def test_grade_many_reports_and_records(self, tmp_path):
+        bank = _bank(tmp_path, {"v2.yaml": V2})
+        subs = [
+            {"developer": "ann", "quiz_id": "v2", "answers": ["b", "b", "b"]},
+            {"developer": "bob", "quiz_id": "v2", "answers": ["a", "a", "b"]},
+            {"developer": "cat", "quiz_id": "nope", "answers": []},
+            {"developer": "", "quiz_id": "v2", "answers": ["b", "b", "a"]},
+            {"developer": "dan", "quiz_id": "v2", "answers": ["b"]},
+        ]
+        report, rows = grade_many(bank, subs)
+        assert (report["graded"], report["passed"], report["failed"], report["invalid"]) == (2, 1, 1, 3)
+        assert [e["index"] for e in report["errors"]] == [2, 3, 4]
+        store = QuizStore(tmp_path / "quiz.db")
+        assert store.record_many(rows) == 2
+        assert store.unlocked_zones("ann") == {"yellow"}
+        assert store.passed("bob", "v2") is False
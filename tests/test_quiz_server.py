@@ -0,0 +1,96 @@
+"""Unit tests for the quiz server's write trust model and the MCP unlock check."""
+
+import pytest
+
+import quiz_server
+import quiz_store
+
+CORRECT = ["b", "c", "a", "d", "b"]
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setenv("GOVERNANCE_DEVELOPER", "owner")
+    monkeypatch.setattr(quiz_server, "GOV_DIR", tmp_path / ".ai-governance")
+    monkeypatch.setattr(quiz_server, "QUIZ_DIR", tmp_path / ".ai-governance" / "quizzes")
+    monkeypatch.setattr(quiz_server, "_quiz_bank", None)
+    monkeypatch.setattr(quiz_server, "QUIZ_SERVER_TOKEN", "")
+    return quiz_server.app.test_client()
+
+
+def _zones(developer):
+    return quiz_store.for_governance_dir(quiz_server.GOV_DIR).unlocked_zones(developer)
+
+
+class TestWithoutToken:
+    """Without QUIZ_SERVER_TOKEN only the server's own developer can be written."""
+
+    def test_submit_records_for_the_server_developer(self, client):
+        resp = client.post("/quiz/submit", json={"quiz_id": "v1", "answers": CORRECT})
+        assert resp.get_json()["passed"] is True
+        assert _zones("owner") == {"yellow"}
+
+    def test_naming_another_developer_is_refused(self, client):
+        resp = client.post("/quiz/submit", json={"developer": "mallory", "answers": CORRECT})
+        assert resp.status_code == 403
+        resp = client.post("/quiz/submit", json={"answers": CORRECT}, headers={"X-Developer": "mallory"})
+        assert resp.status_code == 403
+        assert _zones("mallory") == set()
+
+    def test_bulk_grade_only_grades(self, client):
+        body = {"submissions": [{"developer": "mallory", "quiz_id": "v1", "answers": CORRECT}]}
+        assert client.post("/quiz/bulk-grade", json=body).status_code == 403
+        resp = client.post("/quiz/bulk-grade?record=false", json=body)
+        assert resp.get_json()["passed"] == 1
+        assert _zones("mallory") == set()
+
+
+class TestWithToken:
+    """With QUIZ_SERVER_TOKEN set, token holders may write for any developer."""
+
+    @pytest.fixture(autouse=True)
+    def token(self, client, monkeypatch):
+        monkeypatch.setattr(quiz_server, "QUIZ_SERVER_TOKEN", "s3cret")
+
+    def test_missing_or_wrong_token_is_rejected(self, client):
+        body = {"developer": "alice", "answers": CORRECT}
+        assert client.post("/quiz/submit", json=body).status_code == 401
+        resp = client.post("/quiz/submit", json=body, headers={"Authorization": "Bearer nope"})
+        assert resp.status_code == 401
+        assert _zones("alice") == set()
+
+    def test_token_holder_names_the_developer(self, client):
+        auth = {"Authorization": "Bearer s3cret"}
+        client.post("/quiz/submit", json={"developer": "alice", "answers": CORRECT}, headers=auth)
+        body = {"submissions": [{"developer": "bob", "quiz_id": "v1", "answers": CORRECT}]}
+        assert client.post("/quiz/bulk-grade", json=body, headers=auth).get_json()["recorded"] == 1
+        assert _zones("alice") == _zones("bob") == {"yellow"}
+
+    def test_status_is_readable_without_token(self, client):
+        resp = client.get("/quiz/status?developer=alice")
+        assert resp.status_code == 200
+        assert resp.get_json()["yellow_zone_unlocked"] is False
+
+
+class TestEtags:
+    """If-None-Match is compared tag by tag."""
+
+    def test_listed_weak_and_star_match_but_substrings_do_not(self, client):
+        etag = client.get("/quizzes").headers["ETag"]
+        for header in (etag, f'"other", W/{etag}', "*"):
+            assert client.get("/quizzes", headers={"If-None-Match": header}).status_code == 304
+        assert client.get("/quizzes", headers={"If-None-Match": f'"x{etag[1:]}'}).status_code == 200
+        assert client.get("/quizzes", headers={"If-None-Match": etag[:-3] + '"'}).status_code == 200
+
+
+class TestQuizPassedCheck:
+    """Tests for the MCP server's YELLOW unlock check."""
+
+    def test_unreadable_store_fails_closed(self, monkeypatch):
+        import mcp_server
+
+        def unreadable(gov_dir):
+            raise PermissionError(13, "Permission denied", str(gov_dir))
+
+        monkeypatch.setattr(quiz_store, "for_governance_dir", unreadable)
+        assert mcp_server._quiz_passed("alice") is False
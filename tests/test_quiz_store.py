@@ -0,0 +1,100 @@
+"""Unit tests for the per-developer quiz results store."""
+
+import json
+import threading
+
+import quiz_store
+from quiz_store import QuizStore, default_developer, for_governance_dir
+
+
+class TestQuizStore:
+    """Tests for recording and reading results."""
+
+    def test_results_are_per_developer(self, tmp_path):
+        store = QuizStore(tmp_path / "quiz.db")
+        store.record("alice", "v1", True, ["b", "c", "a", "d", "b"], score=5, total=5, unlocked_zone="yellow")
+        assert store.passed("alice", "v1") is True
+        assert store.passed("bob", "v1") is False
+        assert store.unlocked_zones("alice") == {"yellow"}
+        assert store.unlocked_zones("bob") == set()
+
+    def test_latest_attempt_wins_and_attempts_are_counted(self, tmp_path):
+        store = QuizStore(tmp_path / "quiz.db")
+        store.record("alice", "v1", True, ["b"] * 5, unlocked_zone="yellow")
+        result = store.record("alice", "v1", False, ["a"] * 5, score=0, total=5, unlocked_zone="yellow")
+        assert result["passed"] is False
+        assert result["unlocked_zone"] is None
+        assert result["attempts"] == 2
+        assert store.get("alice", "v1")["answers"] == ["a"] * 5
+
+    def test_concurrent_submissions_are_not_lost(self, tmp_path):
+        store = QuizStore(tmp_path / "quiz.db")
+
+        def submit(i):
+            for _ in range(10):
+                store.record(f"dev{i}", "v1", i % 2 == 0, [str(i)])
+
+        threads = [threading.Thread(target=submit, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for i in range(8):
+            result = store.get(f"dev{i}", "v1")
+            assert result["attempts"] == 10
+            assert result["passed"] is (i % 2 == 0)
+
+
+class TestPassedCache:
+    """Tests for the in-memory unlock check used by zoning."""
+
+    def test_cached_reads_skip_the_database(self, tmp_path, monkeypatch):
+        store = QuizStore(tmp_path / "quiz.db")
+        store.record("alice", "v1", True, [])
+        assert store.passed_cached("alice", "v1") is True
+        monkeypatch.setattr(store, "passed", lambda *a: (_ for _ in ()).throw(AssertionError("db read")))
+        assert store.passed_cached("alice", "v1") is True
+
+    def test_write_from_another_store_is_seen_after_the_interval(self, tmp_path, monkeypatch):
+        reader = QuizStore(tmp_path / "quiz.db")
+        writer = QuizStore(tmp_path / "quiz.db")  # e.g. quiz_server in another process
+        assert reader.passed_cached("bob", "v1") is False
+        writer.record("bob", "v1", True, [])
+        assert reader.passed_cached("bob", "v1") is False  # within STAMP_INTERVAL
+        monkeypatch.setattr(quiz_store, "STAMP_INTERVAL", 0.0)
+        assert reader.passed_cached("bob", "v1") is True
+
+    def test_unlocked_zones_cached_follows_writes(self, tmp_path, monkeypatch):
+        store = QuizStore(tmp_path / "quiz.db")
+        monkeypatch.setattr(quiz_store, "STAMP_INTERVAL", 0.0)
+        assert store.unlocked_zones_cached("cy") == frozenset()
+        store.record_many([("cy", "v2", True, [], 5, 6, "yellow")])
+        assert store.unlocked_zones_cached("cy") == {"yellow"}
+
+
+class TestLegacyMigration:
+    """Tests for importing quiz_results.json."""
+
+    def test_json_is_imported_once_for_the_current_developer(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GOVERNANCE_DEVELOPER", "carol")
+        (tmp_path / "quiz_results.json").write_text(json.dumps({
+            "v1": {"passed": True, "answers": ["b", "c", "a", "d", "b"], "timestamp": "2024-01-01T00:00:00Z"},
+        }))
+        store = for_governance_dir(tmp_path)
+        assert default_developer() == "carol"
+        assert store.passed("carol", "v1") is True
+        assert store.get("carol", "v1")["unlocked_zone"] == "yellow"
+        assert store.passed("dave", "v1") is False
+
+        store.record("carol", "v1", False, ["a"] * 5)
+        assert store.migrate_json(tmp_path / "quiz_results.json", "carol") == 0
+        assert store.passed("carol", "v1") is False
+
+    def test_unreadable_json_is_retried(self, tmp_path):
+        legacy = tmp_path / "quiz_results.json"
+        legacy.write_text("{not json")
+        store = QuizStore(tmp_path / "quiz.db")
+        assert store.migrate_json(legacy, "erin") == 0
+        legacy.write_text(json.dumps({"v1": {"passed": True, "answers": []}}))
+        assert store.migrate_json(legacy, "erin") == 1
+        assert store.passed("erin", "v1") is True
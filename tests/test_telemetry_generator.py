@@ -0,0 +1,85 @@
+"""Unit tests for the synthetic telemetry generator."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from data.telemetry_generator import generate_telemetry, main
+
+
+def _read(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestGenerateTelemetry:
+    """Tests for generate_telemetry."""
+
+    def test_writes_requested_counts_across_chunks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            counts = {"violations": 250, "scaffolding_effectiveness": 120, "entropy_log": 75, "coaching_log": 310}
+            written = generate_telemetry(tmp, counts, team_size=10, chunk_size=64)
+            assert written == counts
+            for stream, n in counts.items():
+                assert len(_read(Path(tmp) / f"{stream}.jsonl")) == n
+
+    def test_skips_streams_without_count(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            written = generate_telemetry(tmp, {"violations": 5})
+            assert list(written) == ["violations"]
+            assert not (Path(tmp) / "coaching_log.jsonl").exists()
+
+    def test_role_and_zone_mix_respected(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            generate_telemetry(
+                tmp,
+                {"violations": 200},
+                role_mix={"Expert": 1.0},
+                zone_mix={"Red": 1.0},
+            )
+            records = _read(Path(tmp) / "violations.jsonl")
+            assert {r["user_role"] for r in records} == {"Expert"}
+            assert {r["zone"] for r in records} == {"Red"}
+            assert not any(r["allowed"] for r in records)
+
+    def test_timestamps_monotonic(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            generate_telemetry(tmp, {"entropy_log": 300}, chunk_size=50, days=7)
+            stamps = [r["timestamp"] for r in _read(Path(tmp) / "entropy_log.jsonl")]
+            assert stamps == sorted(stamps)
+
+    def test_entropy_records_match_formula(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            generate_telemetry(tmp, {"entropy_log": 20})
+            for r in _read(Path(tmp) / "entropy_log.jsonl"):
+                m = r["metrics"]
+                expected = m["bloat"] * 0.25 + m["rework"] * 0.25 + m["reverts"] * 0.20 + m["premature"] * 0.30
+                assert abs(r["score"] - expected) < 0.05
+
+    def test_reproducible_with_seed(self):
+        with tempfile.TemporaryDirectory() as a, tempfile.TemporaryDirectory() as b:
+            from datetime import datetime
+
+            end = datetime(2024, 1, 15)
+            generate_telemetry(a, {"coaching_log": 50}, seed=7, end=end)
+            generate_telemetry(b, {"coaching_log": 50}, seed=7, end=end)
+            assert (Path(a) / "coaching_log.jsonl").read_text() == (Path(b) / "coaching_log.jsonl").read_text()
+
+
+class TestMain:
+    """Tests for the command-line entry point."""
+
+    def test_mix_is_parsed_by_argparse(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            assert main(["--out-dir", tmp, "--events", "0", "--violations", "50", "--zone-mix", "red=1"]) == 0
+            assert {r["zone"] for r in _read(Path(tmp) / "violations.jsonl")} == {"Red"}
+
+    @pytest.mark.parametrize("mix", ["Wizard=1", "Novice=lots"])
+    def test_bad_mix_is_a_usage_error(self, mix, capsys):
+        with tempfile.TemporaryDirectory() as tmp:
+            with pytest.raises(SystemExit) as exc:
+                main(["--out-dir", tmp, "--role-mix", mix])
+            assert exc.value.code == 2
+            assert "--role-mix" in capsys.readouterr().err
+            assert not any(Path(tmp).iterdir())
@@ -0,0 +1,54 @@
+"""Unit tests for the Week 1 calibration data source."""
+
+import json
+import tempfile
+from pathlib import Path
+
+from data.week1_loader import load_week1_records, source_versions
+
+
+def _write(path: Path, records: list[dict]) -> None:
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+
+
+class TestLoadWeek1Records:
+    """Tests for telemetry vs demo data selection."""
+
+    def test_demo_fallback_when_no_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            violations, scaffolding, source = load_week1_records(tmp)
+            assert source == "demo"
+            assert violations and scaffolding
+
+    def test_reads_telemetry_and_skips_adr_records(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            gov = Path(tmp)
+            _write(gov / "violations.jsonl", [
+                {"zone": "Red", "user_role": "Novice", "reason": "blocked"},
+                {"adr_id": "ADR-1", "decision_type": "red_zone_edit"},
+            ])
+            _write(gov / "scaffolding_effectiveness.jsonl", [{"user_role": "Novice", "time_to_accept": 3}])
+            violations, scaffolding, source = load_week1_records(gov)
+            assert source == "telemetry"
+            assert violations == [{"zone": "Red", "user_role": "Novice", "reason": "blocked"}]
+            assert len(scaffolding) == 1
+
+    def test_mixed_when_one_file_present(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            _write(Path(tmp) / "violations.jsonl", [{"zone": "Green", "user_role": "Expert"}])
+            _, _, source = load_week1_records(tmp)
+            assert source == "mixed"
+
+
+class TestSourceVersions:
+    """Tests for the cache key fingerprint."""
+
+    def test_changes_when_file_appended(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "violations.jsonl"
+            assert source_versions(tmp) == (None, None)
+            _write(path, [{"zone": "Green"}])
+            first = source_versions(tmp)
+            with open(path, "a") as f:
+                f.write(json.dumps({"zone": "Red"}) + "\n")
+            assert source_versions(tmp) != first